@@ -4,256 +4,258 @@
 # All coordinates and lengths are discrete inches.
 
 
-from ortools.linear_solver import pywraplp # pyright: ignore[reportMissingImports]
+from collections.abc import Mapping
+
+from ortools.sat.python import cp_model # pyright: ignore[reportMissingImports]
 from .core import *
 from .room_rules import ROOM_RULES
+from .room_schema import RoomRule
+from .rule_tables import (
+    RULES_TABLE, SPACE_IDS, TARGET_MASKS, candidate_dims, mask_of, members_of, placed_pairs,
+    to_tenths,
+)
+
+# Stand-in for room types without a ROOM_RULES entry: every section is empty
+_NO_RULE = RoomRule()
+
+
+# ----------------------------
+# Shared row builders
+# ----------------------------
+# Separation and hidden-visibility both emit the same 4-way gap disjunction
+# (plain non-overlap is a global NoOverlap2D instead), direct adjacency emits
+# the same 3 rows per side, and proximity and visible-from both measure the
+# same Manhattan distance. Build each shape in one place so the pair loops only
+# resolve variables and call in. Rows are gated by their side literal with
+# OnlyEnforceIf, so there is no big-M.
+
+def _add_gap_disjunction(model, a, b, x, y, w, h, gap, label):
+    """
+    Require rectangles a and b to be at least `gap` inches apart along x OR y.
+    Uses 4 side literals.
+    """
+    left = model.NewBoolVar(f"{a}_{label}_left_{b}")
+    right = model.NewBoolVar(f"{a}_{label}_right_{b}")
+    above = model.NewBoolVar(f"{a}_{label}_above_{b}")
+    below = model.NewBoolVar(f"{a}_{label}_below_{b}")
+
+    model.AddBoolOr([left, right, above, below])
+    # Opposite sides cannot both hold (w, h >= 1): valid cuts that prune the search
+    model.AddAtMostOne([left, right])
+    model.AddAtMostOne([above, below])
+
+    model.Add(x[a] + w[a] + gap <= x[b]).OnlyEnforceIf(left)
+    model.Add(x[b] + w[b] + gap <= x[a]).OnlyEnforceIf(right)
+    model.Add(y[a] >= y[b] + h[b] + gap).OnlyEnforceIf(above)
+    model.Add(y[b] >= y[a] + h[a] + gap).OnlyEnforceIf(below)
+
+
+def _add_direct_adjacency(model, r, t, x, y, w, h, wall, overlap):
+    """
+    Require r and t to share a wall: exactly `wall` inches apart on one of
+    4 sides, with at least `overlap` inches of shared wall segment.
+    """
+    left  = model.NewBoolVar(f"{r}_adj_left_{t}")
+    right = model.NewBoolVar(f"{r}_adj_right_{t}")
+    above = model.NewBoolVar(f"{r}_adj_above_{t}")
+    below = model.NewBoolVar(f"{r}_adj_below_{t}")
+
+    # Must pick at least one adjacency side, and never two opposite ones
+    model.AddBoolOr([left, right, above, below])
+    model.AddAtMostOne([left, right])
+    model.AddAtMostOne([above, below])
+
+    # LEFT: r is left of t (vertical shared wall segment)
+    model.Add(x[r] + w[r] + wall == x[t]).OnlyEnforceIf(left)
+    model.Add(y[r] + overlap <= y[t] + h[t]).OnlyEnforceIf(left)
+    model.Add(y[t] + overlap <= y[r] + h[r]).OnlyEnforceIf(left)
+
+    # RIGHT: r is right of t
+    model.Add(x[t] + w[t] + wall == x[r]).OnlyEnforceIf(right)
+    model.Add(y[r] + overlap <= y[t] + h[t]).OnlyEnforceIf(right)
+    model.Add(y[t] + overlap <= y[r] + h[r]).OnlyEnforceIf(right)
+
+    # ABOVE: r is above t (horizontal shared wall segment)
+    model.Add(y[t] + h[t] + wall == y[r]).OnlyEnforceIf(above)
+    model.Add(x[r] + overlap <= x[t] + w[t]).OnlyEnforceIf(above)
+    model.Add(x[t] + overlap <= x[r] + w[r]).OnlyEnforceIf(above)
+
+    # BELOW: r is below t
+    model.Add(y[r] + h[r] + wall == y[t]).OnlyEnforceIf(below)
+    model.Add(x[r] + overlap <= x[t] + w[t]).OnlyEnforceIf(below)
+    model.Add(x[t] + overlap <= x[r] + w[r]).OnlyEnforceIf(below)
+
+
+def _add_manhattan_dist(model, a, b, x, y, building_width_in, building_height_in, name):
+    """
+    Manhattan distance between the origins of a and b, as a linear expression.
+    Each axis is one AddAbsEquality, so there are no one-sided slack rows and
+    no separate variable for the sum.
+    """
+    dx = model.NewIntVar(0, building_width_in, f"{name}_dx")
+    dy = model.NewIntVar(0, building_height_in, f"{name}_dy")
+    model.AddAbsEquality(dx, x[a] - x[b])
+    model.AddAbsEquality(dy, y[a] - y[b])
+    return dx + dy
+
 
 def add_room_bounds_constraints(
-    solver, rooms, x, y, w, h, building_width_in, building_height_in
+    model, rooms, x, y, w, h, building_width_in, building_height_in
 ):
     """
     Ensure each room rectangle fits inside the building shell.
     """
     for r in rooms:
         # Right / top edges inside shell
-        solver.Add(x[r] + w[r] <= building_width_in)
-        solver.Add(y[r] + h[r] <= building_height_in)
+        model.Add(x[r] + w[r] <= building_width_in)
+        model.Add(y[r] + h[r] <= building_height_in)
 
-        # Non-negative width/height (already enforced by domains, but keep semantics clear)
-        solver.Add(w[r] >= 1)
-        solver.Add(h[r] >= 1)
+        # w[r] >= 1 and h[r] >= 1 come from the variable domains set by the caller
 
 
-def add_non_overlap_constraints(solver, rooms, x, y, w, h):
+def add_non_overlap_constraints(model, rooms, x, y, w, h, building_width_in, building_height_in):
     """
-    Standard disjunctive non-overlap:
-        For each pair of rooms i, j, one of:
-            i is left of j
-            i is right of j
-            i is above j
-            i is below j
-    Uses big-M and 4 binaries per pair.
+    Rooms may not overlap. Each room contributes an x interval [x, x + w) and a
+    y interval [y, y + h), and a single AddNoOverlap2D over all of them replaces
+    the per-pair left/right/above/below disjunction.
     """
-    M = 10_000_000  # big enough upper bound for coordinate differences
-
-    for i_idx in range(len(rooms)):
-        for j_idx in range(i_idx + 1, len(rooms)):
-            ri = rooms[i_idx]
-            rj = rooms[j_idx]
-
-            left = solver.BoolVar(f"{ri}_left_of_{rj}")
-            right = solver.BoolVar(f"{ri}_right_of_{rj}")
-            above = solver.BoolVar(f"{ri}_above_{rj}")
-            below = solver.BoolVar(f"{ri}_below_{rj}")
-
-            # At least one spatial relation must hold
-            solver.Add(left + right + above + below >= 1)
+    x_intervals = []
+    y_intervals = []
+    for r in rooms:
+        # Interval ends must be single variables; the interval ties end = start + size
+        x_end = model.NewIntVar(1, building_width_in, f"x_end_{r}")
+        y_end = model.NewIntVar(1, building_height_in, f"y_end_{r}")
+        x_intervals.append(model.NewIntervalVar(x[r], w[r], x_end, f"x_iv_{r}"))
+        y_intervals.append(model.NewIntervalVar(y[r], h[r], y_end, f"y_iv_{r}"))
 
-            # If ri left of rj: x_i + w_i <= x_j
-            solver.Add(x[ri] + w[ri] <= x[rj] + M * (1 - left))
-            # If ri right of rj: x_j + w_j <= x_i
-            solver.Add(x[rj] + w[rj] <= x[ri] + M * (1 - right))
-            # If ri above rj: y_i >= y_j + h_j
-            solver.Add(y[ri] >= y[rj] + h[rj] - M * (1 - above))
-            # If ri below rj: y_j >= y_i + h_i
-            solver.Add(y[rj] >= y[ri] + h[ri] - M * (1 - below))
+    model.AddNoOverlap2D(x_intervals, y_intervals)
 
 
-def add_entry_bounds_constraints(
-    solver, rooms, x, y, w, h, entrance_x, entrance_y, entrance_active
+def add_entrance_constraints(
+    model, rooms, x, y, w, h, entrance_x, entrance_y, entrance_active, corridor_room_id=None
 ):
     """
     For each entrance (door) of each room, if active:
         - entrance must lie on the perimeter of the room rectangle.
+        - if corridor_room_id is given, entrance must also lie within the
+          corridor rectangle (doors of the corridor itself excepted).
 
     We'll use 4 binaries per entrance to select which side of the perimeter.
+    Both checks share one pass over the doors.
+
+    The corridor part is a simple skeleton; you'll refine based on your door model.
     """
-    M = 10_000_000
+    # In a full implementation you’d inspect ROOM_RULES[r].access.entry_constraints
+    # TODO: call this only for rooms that actually require entry_from corridor.
+    corridor = corridor_room_id if corridor_room_id in rooms else None
+    if corridor is not None:
+        # Corridor rectangle
+        x_c = x[corridor]
+        y_c = y[corridor]
+        w_c = w[corridor]
+        h_c = h[corridor]
 
     for (r, k), active_var in entrance_active.items():
         dx = entrance_x[(r, k)]
         dy = entrance_y[(r, k)]
 
-        # Bound to building extents – already in variable domain, but repeat for clarity
-        # (You can drop these lines if you set appropriate variable bounds)
-        # solver.Add(dx >= 0)
-        # solver.Add(dy >= 0)
+        # dx, dy are bounded to the building extents by their variable domains
 
         # Side selectors
-        on_left = solver.BoolVar(f"door_{r}_{k}_on_left")
-        on_right = solver.BoolVar(f"door_{r}_{k}_on_right")
-        on_bottom = solver.BoolVar(f"door_{r}_{k}_on_bottom")
-        on_top = solver.BoolVar(f"door_{r}_{k}_on_top")
-
-        # If door is active, it must be on exactly one side
-        solver.Add(on_left + on_right + on_bottom + on_top == active_var)
-
-        # Side conditions (assuming active; relaxed by big-M when not on that side)
+        on_left = model.NewBoolVar(f"door_{r}_{k}_on_left")
+        on_right = model.NewBoolVar(f"door_{r}_{k}_on_right")
+        on_bottom = model.NewBoolVar(f"door_{r}_{k}_on_bottom")
+        on_top = model.NewBoolVar(f"door_{r}_{k}_on_top")
+
+        # If door is active, it must be on exactly one side; inactive, on none
+        sides = [on_left, on_right, on_bottom, on_top]
+        model.AddBoolOr(sides).OnlyEnforceIf(active_var)
+        model.AddAtMostOne(sides)
+        model.AddBoolAnd([side.Not() for side in sides]).OnlyEnforceIf(active_var.Not())
+
+        # Side conditions, enforced only on the selected side
         # Left side: x = room.x, y within [room.y, room.y + h]
-        solver.Add(dx - x[r] <= M * (1 - on_left))
-        solver.Add(dx - x[r] >= -M * (1 - on_left))
-        solver.Add(dy >= y[r] - M * (1 - on_left))
-        solver.Add(dy <= y[r] + h[r] + M * (1 - on_left))
+        model.Add(dx == x[r]).OnlyEnforceIf(on_left)
+        model.Add(dy >= y[r]).OnlyEnforceIf(on_left)
+        model.Add(dy <= y[r] + h[r]).OnlyEnforceIf(on_left)
 
         # Right side: x = room.x + w
-        solver.Add(dx - (x[r] + w[r]) <= M * (1 - on_right))
-        solver.Add(dx - (x[r] + w[r]) >= -M * (1 - on_right))
-        solver.Add(dy >= y[r] - M * (1 - on_right))
-        solver.Add(dy <= y[r] + h[r] + M * (1 - on_right))
+        model.Add(dx == x[r] + w[r]).OnlyEnforceIf(on_right)
+        model.Add(dy >= y[r]).OnlyEnforceIf(on_right)
+        model.Add(dy <= y[r] + h[r]).OnlyEnforceIf(on_right)
 
         # Bottom side: y = room.y
-        solver.Add(dy - y[r] <= M * (1 - on_bottom))
-        solver.Add(dy - y[r] >= -M * (1 - on_bottom))
-        solver.Add(dx >= x[r] - M * (1 - on_bottom))
-        solver.Add(dx <= x[r] + w[r] + M * (1 - on_bottom))
+        model.Add(dy == y[r]).OnlyEnforceIf(on_bottom)
+        model.Add(dx >= x[r]).OnlyEnforceIf(on_bottom)
+        model.Add(dx <= x[r] + w[r]).OnlyEnforceIf(on_bottom)
 
         # Top side: y = room.y + h
-        solver.Add(dy - (y[r] + h[r]) <= M * (1 - on_top))
-        solver.Add(dy - (y[r] + h[r]) >= -M * (1 - on_top))
-        solver.Add(dx >= x[r] - M * (1 - on_top))
-        solver.Add(dx <= x[r] + w[r] + M * (1 - on_top))
-
-
-def add_simple_entry_from_corridor_constraints(
-    solver,
-    rooms,
-    x,
-    y,
-    w,
-    h,
-    entrance_x,
-    entrance_y,
-    entrance_active,
-    corridor_room_id,
-):
-    """
-    Example constraint builder:
-    For rooms that have an ENTRY_FROM rule pointing to the clinical corridor,
-    we require at least one active entrance that lies on a shared boundary
-    between the room and the corridor.
+        model.Add(dy == y[r] + h[r]).OnlyEnforceIf(on_top)
+        model.Add(dx >= x[r]).OnlyEnforceIf(on_top)
+        model.Add(dx <= x[r] + w[r]).OnlyEnforceIf(on_top)
 
-    This is a simple skeleton; you'll refine based on your door model.
-    """
-    if corridor_room_id not in rooms:
-        return
-
-    # Corridor rectangle
-    x_c = x[corridor_room_id]
-    y_c = y[corridor_room_id]
-    w_c = w[corridor_room_id]
-    h_c = h[corridor_room_id]
-
-    # In a full implementation you’d inspect ROOM_RULES[r]["entryRules"]
-    # Here we just show how to enforce "shared boundary" for a given pair.
-    # TODO: call this only for rooms that actually require entry_from corridor.
-
-    M = 10_000_000
-
-    for r in rooms:
-        if r == corridor_room_id:
+        if corridor is None or r == corridor:
             continue
 
-        # require at least one entrance active IF the rules say so.
-        # For now, we leave that conditional wiring as TODO and just
-        # demonstrate how to enforce "if active, share boundary".
-        # You’ll attach a binary “room_requires_corridor_entry[r]” later.
-        # Here we assume they *may* have doors to corridor, but not required.
-
-        # For each entrance, if it's active *and* is used as corridor entry:
-        # - door coordinate must lie on both rectangles' perimeter
-        # In practice you might add separate booleans per-door for
-        # "this is the corridor door".
-        for (room_id, k), active_var in entrance_active.items():
-            if room_id != r:
-                continue
-
-            dx = entrance_x[(room_id, k)]
-            dy = entrance_y[(room_id, k)]
-
-            # Shared boundary means:
-            # - door lies on room perimeter (already handled by add_entry_bounds_constraints)
-            # - door also lies on corridor perimeter
-            # We encode "if active, door is within corridor boundary band"
-            solver.Add(dx >= x_c - M * (1 - active_var))
-            solver.Add(dx <= x_c + w_c + M * (1 - active_var))
-            solver.Add(dy >= y_c - M * (1 - active_var))
-            solver.Add(dy <= y_c + h_c + M * (1 - active_var))
+        # Shared boundary with the corridor: the door is on the room perimeter
+        # (above) and, if active, within the corridor boundary band.
+        # Every door may be a corridor door for now; a per-door
+        # "this is the corridor door" binary comes later.
+        model.Add(dx >= x_c).OnlyEnforceIf(active_var)
+        model.Add(dx <= x_c + w_c).OnlyEnforceIf(active_var)
+        model.Add(dy >= y_c).OnlyEnforceIf(active_var)
+        model.Add(dy <= y_c + h_c).OnlyEnforceIf(active_var)
 
-            # NOTE: This is still loose; to make it exact you'd also need
-            # side-specific equality to corridor edges, similar to the room sides.
+        # NOTE: This is still loose; to make it exact you'd also need
+        # side-specific equality to corridor edges, similar to the room sides.
 
 
-def add_adjacency_constraints_from_rules(solver, rooms, x, y, w, h):
+def add_adjacency_constraints_from_rules(
+    model, rooms, x, y, w, h, building_width_in, building_height_in,
+    wall_thickness=12, min_adjacent_overlap=24, min_separation=180,
+):
     """
     DIRECT adjacency (hard, non-negotiable):
-      - exactly WALL_THICKNESS inches between room envelopes on one of 4 sides
+      - exactly wall_thickness inches between room envelopes on one of 4 sides
       - AND at least min_adjacent_overlap inches of overlap on the perpendicular axis
         (this is wall-segment overlap, NOT area overlap)
 
     separation:
-      - min gap (no touching)
+      - min gap of min_separation inches (no touching)
 
     preferredProximity:
       - soft objective (optional hard cap)
 
     Also: DIRECT adjacency constraints are added only once per unordered pair (r,t),
     to avoid duplicating constraints when rules exist in both directions.
+
+    All three distances are in inches; the defaults match kernels.evaluate_rules.
     """
-    M = 10_000_000
-    WALL_THICKNESS = 12        # inches between adjacent room envelopes
-    min_adjacent_overlap = 24  # inches of shared wall segment required
-    min_separation = 180        # inches: separation rules (cannot even touch)
     # TODO make the separation logic clear. right now we just account for a room between them with 15 feet of space, does not have any notion of rooms between them
 
     # ----------------------------
     # Helpers
     # ----------------------------
-    def _room_category(rid):
-        return ROOM_RULES.get(rid, {}).get("identity", {}).get("category", None)
-
-    def _rooms_in_group(group):
-        # Default grouping; swap out later if you add explicit memberships.
-        if group == SPACE_GROUP.CLINICAL:
-            return {r for r in rooms if _room_category(r) == ROOM_CATEGORY.CLINICAL}
-        if group == SPACE_GROUP.PUBLIC:
-            return {r for r in rooms if _room_category(r) == ROOM_CATEGORY.PUBLIC}
-        if group == SPACE_GROUP.PRIVATE:
-            return {r for r in rooms if _room_category(r) == ROOM_CATEGORY.PRIVATE}
-        if group == SPACE_GROUP.CORRIDORS:
-            # Prefer explicit SPACE_IDs for corridors; this is only a fallback.
-            return {r for r in rooms if "CORRIDOR" in str(r) or "HALLWAY" in str(r)}
-        if group == SPACE_GROUP.PATIENT_FACING:
-            return {r for r in rooms if _room_category(r) == ROOM_CATEGORY.PUBLIC}
-        return set()
+    # Rooms in the model as a SPACE_ID bitmask; TARGET_MASKS has SPACE_GROUPs pre-expanded
+    placed = mask_of(r for r in rooms if isinstance(r, SPACE_ID))
+    # Rules are keyed by SPACE_ID; with none in the model there is nothing to emit
+    if not placed:
+        return
 
     def _resolve_targets(target):
-        if target is None:
+        if not isinstance(target, (SPACE_ID, SPACE_GROUP)):
             return []
-        if isinstance(target, SPACE_ID):
-            return [target] if target in rooms else []
-        if isinstance(target, SPACE_GROUP):
-            return [t for t in _rooms_in_group(target) if t in rooms]
-        return []
+        return members_of(TARGET_MASKS[target] & placed)
 
-    def _objective():
-        return solver.Objective()
+    # Penalized distances and their weights, summed flat once at the end
+    penalty_terms = []
+    penalty_weights = []
 
     def _penalize(var, weight):
         if weight is None or weight <= 0:
             return
-        _objective().SetCoefficient(var, float(weight))
-        _objective().SetMinimization()
-
-    def _manhattan_dist(a, b, name):
-        dx = solver.NumVar(0, solver.infinity(), f"{name}_dx")
-        dy = solver.NumVar(0, solver.infinity(), f"{name}_dy")
-        solver.Add(dx >= x[a] - x[b])
-        solver.Add(dx >= x[b] - x[a])
-        solver.Add(dy >= y[a] - y[b])
-        solver.Add(dy >= y[b] - y[a])
-        d = solver.NumVar(0, solver.infinity(), f"{name}_dman")
-        solver.Add(d == dx + dy)
-        return d
+        penalty_terms.append(var)
+        penalty_weights.append(weight)
 
     def _pair_key(a, b):
         # stable unordered key for Enum values
@@ -261,155 +263,97 @@ def add_adjacency_constraints_from_rules(solver, rooms, x, y, w, h):
 
     # Track which direct adjacency pairs we've already constrained
     seen_direct_pairs = set()
+    direct = RULES_TABLE.direct_csr
+    placed_bits = int(placed)
 
     # ----------------------------
     # Main loop
     # ----------------------------
     for r in rooms:
-        spec = ROOM_RULES.get(r, {})
-        adj = spec.get("adjacency", {}) or {}
+        room_rule = ROOM_RULES.get(r)
+        if room_rule is None:
+            continue
+        adj = room_rule.adjacency
 
-        direct_rules = adj.get("direct", []) or []
-        sep_rules = adj.get("separation", []) or []
-        prox_rules = adj.get("preferredProximity", []) or []
+        prox_rules = adj.preferred_proximity
+        lo, hi = direct.indptr[r], direct.indptr[r + 1]
+        # Most rooms have neither kind of rule; skip them before any per-pair work
+        if lo == hi and not prox_rules:
+            continue
 
         # ---- DIRECT: fixed wall + shared wall segment overlap (once per pair) ----
-        for rule in direct_rules:
-            target = rule.get("target")
-            for t in _resolve_targets(target):
-                if t == r:
-                    continue
-
-                key = _pair_key(r, t)
-                if key in seen_direct_pairs:
-                    continue
-                seen_direct_pairs.add(key)
-
-                left  = solver.BoolVar(f"{r}_adj_left_{t}")
-                right = solver.BoolVar(f"{r}_adj_right_{t}")
-                above = solver.BoolVar(f"{r}_adj_above_{t}")
-                below = solver.BoolVar(f"{r}_adj_below_{t}")
-
-                # Must pick at least one adjacency side
-                solver.Add(left + right + above + below >= 1)
-
-                # LEFT: r is left of t (vertical shared wall segment)
-                solver.Add(x[r] + w[r] + WALL_THICKNESS == x[t] + M * (1 - left))
-                solver.Add(y[r] + min_adjacent_overlap <= y[t] + h[t] + M * (1 - left))
-                solver.Add(y[t] + min_adjacent_overlap <= y[r] + h[r] + M * (1 - left))
-
-                # RIGHT: r is right of t
-                solver.Add(x[t] + w[t] + WALL_THICKNESS == x[r] + M * (1 - right))
-                solver.Add(y[r] + min_adjacent_overlap <= y[t] + h[t] + M * (1 - right))
-                solver.Add(y[t] + min_adjacent_overlap <= y[r] + h[r] + M * (1 - right))
-
-                # ABOVE: r is above t (horizontal shared wall segment)
-                solver.Add(y[t] + h[t] + WALL_THICKNESS == y[r] + M * (1 - above))
-                solver.Add(x[r] + min_adjacent_overlap <= x[t] + w[t] + M * (1 - above))
-                solver.Add(x[t] + min_adjacent_overlap <= x[r] + w[r] + M * (1 - above))
-
-                # BELOW: r is below t
-                solver.Add(y[r] + h[r] + WALL_THICKNESS == y[t] + M * (1 - below))
-                solver.Add(x[r] + min_adjacent_overlap <= x[t] + w[t] + M * (1 - below))
-                solver.Add(x[t] + min_adjacent_overlap <= x[r] + w[r] + M * (1 - below))
-
-        # ---- SEPARATION: min gap (no touching) ----
-        for rule in sep_rules:
-            target = rule.get("target")
-            hard = bool(rule.get("hard", True))
-            if not hard:
-                # schema allows soft, but you can extend later; currently treat as hard
-                pass
-
-            for t in _resolve_targets(target):
-                if t == r:
-                    continue
-
-                sep_left  = solver.BoolVar(f"{r}_sep_left_{t}")
-                sep_right = solver.BoolVar(f"{r}_sep_right_{t}")
-                sep_above = solver.BoolVar(f"{r}_sep_above_{t}")
-                sep_below = solver.BoolVar(f"{r}_sep_below_{t}")
+        # Edges come pre-expanded from the CSR edge list, in rule order
+        edges = direct.indices[lo:hi]
+        for t in edges.tolist():
+            if t == r or not placed_bits >> t & 1:
+                continue
+            t = SPACE_IDS[t]
 
-                solver.Add(sep_left + sep_right + sep_above + sep_below >= 1)
+            key = _pair_key(r, t)
+            if key in seen_direct_pairs:
+                continue
+            seen_direct_pairs.add(key)
 
-                solver.Add(x[r] + w[r] + min_separation <= x[t] + M * (1 - sep_left))
-                solver.Add(x[t] + w[t] + min_separation <= x[r] + M * (1 - sep_right))
-                solver.Add(y[r] >= y[t] + h[t] + min_separation - M * (1 - sep_above))
-                solver.Add(y[t] >= y[r] + h[r] + min_separation - M * (1 - sep_below))
+            _add_direct_adjacency(
+                model, r, t, x, y, w, h, wall_thickness, min_adjacent_overlap
+            )
 
         # ---- PREFERRED PROXIMITY: objective + optional cap ----
         for rule in prox_rules:
-            target = rule.get("target")
-            max_dist = rule.get("maxDistanceInches")
-            weight = float(rule.get("optimizationWeight", 0.0) or 0.0)
+            target = rule.target
+            max_dist = rule.max_distance_inches
+            # Integer tenths: keeps the objective's coefficients integral
+            weight = to_tenths(rule.optimization_weight)
 
             for t in _resolve_targets(target):
                 if t == r:
                     continue
 
-                d = _manhattan_dist(r, t, name=f"{r}_prox_{t}")
-                if max_dist is not None:
-                    solver.Add(d <= int(max_dist))
+                d = _add_manhattan_dist(
+                    model, r, t, x, y, building_width_in, building_height_in, f"{r}_prox_{t}"
+                )
+                if max_dist < NO_LIMIT:
+                    model.Add(d <= int(max_dist))
                 _penalize(d, weight=weight)
 
-def add_visibility_constraints_from_rules(solver, rooms, x, y, w, h):
+    # ---- SEPARATION: min gap (no touching), once per unordered pair ----
+    # Soft separation rules are enforced as hard for now.
+    for r, t in placed_pairs(RULES_TABLE.sep_sym_csr, members_of(placed)):
+        _add_gap_disjunction(
+            model, r, t, x, y, w, h, min_separation, "sep"
+        )
+
+    # CP-SAT takes the objective whole, so the penalties are set in one call
+    if penalty_terms:
+        model.Minimize(cp_model.LinearExpr.WeightedSum(penalty_terms, penalty_weights))
+
+def add_visibility_constraints_from_rules(
+    model, rooms, x, y, w, h, building_width_in, building_height_in,
+    min_visibility_gap=180, max_visibility_dist=120,
+):
     """
     Schema-based visibility:
 
-      ROOM_RULES[room]["visibility"]["mustBeHiddenFrom"] -> enforce separation with a visibility gap
-      ROOM_RULES[room]["visibility"]["mustBeVisibleFrom"] -> enforce proximity (placeholder)
+      ROOM_RULES[room].visibility.must_be_hidden_from -> enforce separation with a visibility gap
+      ROOM_RULES[room].visibility.must_be_visible_from -> enforce proximity (placeholder)
 
     NOTE (v1):
       We are NOT doing true line-of-sight / occlusion.
       - "Hidden" is approximated as: keep at least `min_visibility_gap` inches apart in x OR y.
       - "Visible" is approximated as: keep within `max_visibility_dist` (Manhattan), optionally.
 
+    Both distances are in inches and can be tuned per call; the defaults are v1's.
+
     TODO get a notion of doorway visibility through corridors and hallway
     """
-    M = 10_000_000
-
-    # You can tune these as global defaults for v1.
-    min_visibility_gap = 180      # minimum to be invisible
-    max_visibility_dist = 120    # maximum to be visible
-
     # ----------------------------
     # Helpers
     # ----------------------------
-    def _room_category(rid):
-        return ROOM_RULES.get(rid, {}).get("identity", {}).get("category", None)
-
-    def _rooms_in_group(group):
-        if group == SPACE_GROUP.CLINICAL:
-            return {r for r in rooms if _room_category(r) == ROOM_CATEGORY.CLINICAL}
-        if group == SPACE_GROUP.PUBLIC:
-            return {r for r in rooms if _room_category(r) == ROOM_CATEGORY.PUBLIC}
-        if group == SPACE_GROUP.PRIVATE:
-            return {r for r in rooms if _room_category(r) == ROOM_CATEGORY.PRIVATE}
-        if group == SPACE_GROUP.CORRIDORS:
-            return {r for r in rooms if "CORRIDOR" in str(r) or "HALLWAY" in str(r)}
-        if group == SPACE_GROUP.PATIENT_FACING:
-            return {r for r in rooms if _room_category(r) == ROOM_CATEGORY.PUBLIC}
-        return set()
-
-    def _resolve_targets(target):
-        if target is None:
-            return []
-        if isinstance(target, SPACE_ID):
-            return [target] if target in rooms else []
-        if isinstance(target, SPACE_GROUP):
-            return [t for t in _rooms_in_group(target) if t in rooms]
-        return []
-
-    def _manhattan_dist(a, b, name):
-        dx = solver.NumVar(0, solver.infinity(), f"{name}_dx")
-        dy = solver.NumVar(0, solver.infinity(), f"{name}_dy")
-        solver.Add(dx >= x[a] - x[b])
-        solver.Add(dx >= x[b] - x[a])
-        solver.Add(dy >= y[a] - y[b])
-        solver.Add(dy >= y[b] - y[a])
-        d = solver.NumVar(0, solver.infinity(), f"{name}_dman")
-        solver.Add(d == dx + dy)
-        return d
+    # Rooms in the model as a SPACE_ID bitmask
+    placed = mask_of(r for r in rooms if isinstance(r, SPACE_ID))
+    # Rules are keyed by SPACE_ID; with none in the model there is nothing to emit
+    if not placed:
+        return
 
     def _pair_key(a, b):
         return (a.name, b.name) if a.name < b.name else (b.name, a.name)
@@ -420,240 +364,127 @@ def add_visibility_constraints_from_rules(solver, rooms, x, y, w, h):
     # ----------------------------
     # Main loop
     # ----------------------------
-    for r in rooms:
-        spec = ROOM_RULES.get(r, {})
-        vis = spec.get("visibility", {}) or {}
-
-        hidden_rules = vis.get("mustBeHiddenFrom", []) or []
-        visible_rules = vis.get("mustBeVisibleFrom", []) or []
-
-        # ---- MUST BE HIDDEN FROM: enforce separation gap ----
-        for rule in hidden_rules:
-            target = rule.get("target")
-            hard = bool(rule.get("hard", True))
-            # v1: treat as hard only; skip soft for now
-            if not hard:
-                continue
-
-            for t in _resolve_targets(target):
-                if t == r:
-                    continue
+    # Only hard visibility rules are in the tables; soft ones are skipped for now
+    ids = members_of(placed)
 
-                key = _pair_key(r, t)
-                if key in seen_hidden_pairs:
-                    continue
-                seen_hidden_pairs.add(key)
-
-                # Enforce: r and t are separated by at least min_visibility_gap in x OR y
-                sep_left  = solver.BoolVar(f"{r}_vis_hide_left_{t}")
-                sep_right = solver.BoolVar(f"{r}_vis_hide_right_{t}")
-                sep_above = solver.BoolVar(f"{r}_vis_hide_above_{t}")
-                sep_below = solver.BoolVar(f"{r}_vis_hide_below_{t}")
-
-                solver.Add(sep_left + sep_right + sep_above + sep_below >= 1)
-
-                solver.Add(x[r] + w[r] + min_visibility_gap <= x[t] + M * (1 - sep_left))
-                solver.Add(x[t] + w[t] + min_visibility_gap <= x[r] + M * (1 - sep_right))
-                solver.Add(y[r] >= y[t] + h[t] + min_visibility_gap - M * (1 - sep_above))
-                solver.Add(y[t] >= y[r] + h[r] + min_visibility_gap - M * (1 - sep_below))
-
-        # ---- MUST BE VISIBLE FROM: simple proximity placeholder ----
-        for rule in visible_rules:
-            target = rule.get("target")
-            hard = bool(rule.get("hard", True))
-            if not hard:
-                continue
-
-            for t in _resolve_targets(target):
-                if t == r:
-                    continue
-
-                key = _pair_key(r, t)
-                if key in seen_visible_pairs:
-                    continue
-                seen_visible_pairs.add(key)
+    # ---- MUST BE HIDDEN FROM: enforce separation gap ----
+    for r, t in placed_pairs(RULES_TABLE.hidden_csr, ids):
+        key = _pair_key(r, t)
+        if key in seen_hidden_pairs:
+            continue
+        seen_hidden_pairs.add(key)
 
-                # Placeholder: require them to be within some Manhattan distance.
-                # Replace with corridor/LOS logic later.
-                d = _manhattan_dist(r, t, name=f"{r}_vis_req_{t}")
-                solver.Add(d <= max_visibility_dist)
+        # Enforce: r and t are separated by at least min_visibility_gap in x OR y
+        _add_gap_disjunction(
+            model, r, t, x, y, w, h, min_visibility_gap, "vis_hide"
+        )
 
-def add_room_min_constraints_from_rules(solver, rooms, w, h, num_treatment_rooms):
+    # ---- MUST BE VISIBLE FROM: simple proximity placeholder ----
+    for r, t in placed_pairs(RULES_TABLE.visible_csr, ids):
+        key = _pair_key(r, t)
+        if key in seen_visible_pairs:
+            continue
+        seen_visible_pairs.add(key)
+
+        # Placeholder: require them to be within some Manhattan distance.
+        # Replace with corridor/LOS logic later.
+        d = _add_manhattan_dist(
+            model, r, t, x, y, building_width_in, building_height_in, f"{r}_vis_req_{t}"
+        )
+        model.Add(d <= max_visibility_dist)
+
+def _to_space_id(x):
+    if isinstance(x, SPACE_ID):
+        return x
+    if isinstance(x, str):
+        name = x.split("__", 1)[0]
+        if name.startswith("SPACE_ID."):
+            name = name.split(".", 1)[1]
+        return SPACE_ID[name]
+    raise TypeError(f"Cannot convert to SPACE_ID: {x}")
+
+
+def _room_size_bounds(space_id, num_treatment_rooms):
     """
-    HARD minimum bounds derived from rules.
+    (min_w, min_h, max_w, max_h) in inches for one room type; None where the
+    rules give no bound.
 
-    Supports:
+    Mins come from:
       A) geometry.dimensionModels (with optional treatment-room tiering)
       B) Treatment-room-style geometry:
-         - geometry.widthRules
+         - geometry.widthRules (minInches)
          - geometry.depthRules
          - entryVariants.*.depthRequirementInches
-
-    ROOM_RULES must be keyed by SPACE_ID enums.
-    """
-
-    def to_space_id(x):
-        if isinstance(x, SPACE_ID):
-            return x
-        if isinstance(x, str):
-            name = x.split("__", 1)[0]
-            if name.startswith("SPACE_ID."):
-                name = name.split(".", 1)[1]
-            return SPACE_ID[name]
-        raise TypeError(f"Cannot convert to SPACE_ID: {x}")
-
-    def _is_num(v):
-        return isinstance(v, (int, float))
-
-    def _matches_tr(m):
-        tr_min = m.get("treatmentRoomsMin")
-        tr_max = m.get("treatmentRoomsMax")
-
-        if tr_min is None and tr_max is None:
-            return None  # generic
-        if isinstance(tr_min, int) and isinstance(tr_max, int):
-            return tr_min <= num_treatment_rooms <= tr_max
-        if isinstance(tr_min, int) and tr_max is None:
-            return num_treatment_rooms >= tr_min
-        if tr_min is None and isinstance(tr_max, int):
-            return num_treatment_rooms <= tr_max
-        return False
-
-    for r in rooms:
-        # Resolve SPACE_ID
-        space_id = to_space_id(r)
-        spec = ROOM_RULES.get(space_id, {}) or {}
-        geom = spec.get("geometry") or {}
-
-        min_w = None
-        min_h = None
-
-        # ---------- A) dimensionModels ----------
-        models = geom.get("dimensionModels")
-        if isinstance(models, list):
-            models = [m for m in models if isinstance(m, dict)]
-
-            if models:
-                matching = [m for m in models if _matches_tr(m) is True]
-                generic = [m for m in models if _matches_tr(m) is None]
-                candidates = matching or generic or models
-
-                widths = [m.get("widthInches") for m in candidates if _is_num(m.get("widthInches"))]
-                lengths = [m.get("lengthInches") for m in candidates if _is_num(m.get("lengthInches"))]
-
-                if widths:
-                    min_w = min(widths)
-                if lengths:
-                    min_h = min(lengths)
-
-        # ---------- B) Treatment-room-style geometry ----------
-        if min_w is None or min_h is None:
-            width_rules = geom.get("widthRules") or {}
-            if min_w is None:
-                v = width_rules.get("minInches")
-                if _is_num(v):
-                    min_w = v
-
-            depth_candidates = []
-            depth_rules = geom.get("depthRules") or {}
-
-            for k in ("dualEntryMinInches", "sideToeEntryMinInches", "toeEntryMinInches"):
-                v = depth_rules.get(k)
-                if _is_num(v):
-                    depth_candidates.append(v)
-
-            entry_variants = spec.get("entryVariants") or {}
-            if isinstance(entry_variants, dict):
-                for v in entry_variants.values():
-                    if isinstance(v, dict):
-                        dv = v.get("depthRequirementInches")
-                        if _is_num(dv):
-                            depth_candidates.append(dv)
-
-            if min_h is None and depth_candidates:
-                min_h = max(depth_candidates)  # strictest requirement
-
-        if _is_num(min_w):
-            solver.Add(w[r] >= int(min_w))
-        if _is_num(min_h):
-            solver.Add(h[r] >= int(min_h))
-
-
-def add_room_max_constraints_from_rules(solver, rooms, w, h, num_treatment_rooms):
-    """
-    HARD maximum bounds derived from rules.
-
-    Supports:
+    Maxes come from:
       A) geometry.dimensionModels
       B) geometry.widthRules (maxInches)
 
     Note: your current schema does NOT define a max depth for treatment rooms,
-    so max height is only enforced when explicitly provided.
+    so max height is only set when dimensionModels provide one.
     """
-
-    def to_space_id(x):
-        if isinstance(x, SPACE_ID):
-            return x
-        if isinstance(x, str):
-            name = x.split("__", 1)[0]
-            if name.startswith("SPACE_ID."):
-                name = name.split(".", 1)[1]
-            return SPACE_ID[name]
-        raise TypeError(f"Cannot convert to SPACE_ID: {x}")
-
-    def _is_num(v):
-        return isinstance(v, (int, float))
-
-    def _matches_tr(m):
-        tr_min = m.get("treatmentRoomsMin")
-        tr_max = m.get("treatmentRoomsMax")
-
-        if tr_min is None and tr_max is None:
-            return None
-        if isinstance(tr_min, int) and isinstance(tr_max, int):
-            return tr_min <= num_treatment_rooms <= tr_max
-        if isinstance(tr_min, int) and tr_max is None:
-            return num_treatment_rooms >= tr_min
-        if tr_min is None and isinstance(tr_max, int):
-            return num_treatment_rooms <= tr_max
-        return False
-
+    rule = ROOM_RULES.get(space_id, _NO_RULE)
+    geom = rule.geometry
+
+    min_w = min_h = max_w = max_h = None
+
+    # ---------- A) dimensionModels ----------
+    dims = candidate_dims(space_id, num_treatment_rooms)
+    if dims is not None:
+        widths, lengths = dims
+
+        if widths.size:
+            min_w = int(widths.min())
+            max_w = int(widths.max())
+        if lengths.size:
+            min_h = int(lengths.min())
+            max_h = int(lengths.max())
+
+    # ---------- B) widthRules ----------
+    width_rules = geom.width_rules or {}
+    if min_w is None:
+        if isinstance(v := width_rules.get("minInches"), (int, float)):
+            min_w = v
+    if max_w is None:
+        if isinstance(v := width_rules.get("maxInches"), (int, float)):
+            max_w = v
+
+    # ---------- B) depth: strictest of depthRules / entryVariants ----------
+    if min_h is None:
+        depth_rules = geom.depth_rules or {}
+        entry_variants = rule.entry_variants or {}
+        if not isinstance(entry_variants, Mapping):
+            entry_variants = {}
+
+        depth_candidates = [
+            depth_rules.get(k)
+            for k in ("dualEntryMinInches", "sideToeEntryMinInches", "toeEntryMinInches")
+        ] + [
+            v.get("depthRequirementInches")
+            for v in entry_variants.values()
+            if isinstance(v, Mapping)
+        ]
+        depth_candidates = [v for v in depth_candidates if isinstance(v, (int, float))]
+
+        if depth_candidates:
+            min_h = max(depth_candidates)
+
+    return min_w, min_h, max_w, max_h
+
+
+def size_bounds_by_room(rooms, num_treatment_rooms):
+    """
+    {room: (min_w, min_h, max_w, max_h)} from the rules, None where unbounded.
+    Rooms may be SPACE_IDs or instance ids ("SPACE_ID.LAB__0").
+    """
+    # Instances of one type share their bounds, so each type is resolved once
+    by_type = {}
+    out = {}
     for r in rooms:
-        space_id = to_space_id(r)
-        spec = ROOM_RULES.get(space_id, {}) or {}
-        geom = spec.get("geometry") or {}
-
-        max_w = None
-        max_h = None
-
-        # ---------- A) dimensionModels ----------
-        models = geom.get("dimensionModels")
-        if isinstance(models, list):
-            models = [m for m in models if isinstance(m, dict)]
-
-            if models:
-                matching = [m for m in models if _matches_tr(m) is True]
-                generic = [m for m in models if _matches_tr(m) is None]
-                candidates = matching or generic or models
-
-                widths = [m.get("widthInches") for m in candidates if _is_num(m.get("widthInches"))]
-                lengths = [m.get("lengthInches") for m in candidates if _is_num(m.get("lengthInches"))]
-
-                if widths:
-                    max_w = max(widths)
-                if lengths:
-                    max_h = max(lengths)
-
-        # ---------- B) widthRules ----------
-        if max_w is None:
-            width_rules = geom.get("widthRules") or {}
-            v = width_rules.get("maxInches")
-            if _is_num(v):
-                max_w = v
-
-        if _is_num(max_w):
-            solver.Add(w[r] <= int(max_w))
-        if _is_num(max_h):
-            solver.Add(h[r] <= int(max_h))
+        space_id = _to_space_id(r)
+        if space_id not in by_type:
+            by_type[space_id] = _room_size_bounds(space_id, num_treatment_rooms)
+        out[r] = by_type[space_id]
+    return out
+
 
 # TODO add an ideal penalty for size of treatmeant rooms when we are ready to address those specifically
\ No newline at end of file
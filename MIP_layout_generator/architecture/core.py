@@ -1,20 +1,39 @@
 # This holds DSL vocabulary enumerations and definitions 
 # referneced by our schema'd rule set
-from enum import Enum, auto
+import math
+from enum import Enum, IntEnum, auto
+
+# Open upper bound. The rule literals write None ("no max"); compiled rules use
+# NO_LIMIT so bounds compare with plain arithmetic (n <= NO_LIMIT is always True).
+NO_LIMIT = math.inf
+ANY_COUNT = (0, NO_LIMIT)
 
 #Identity Enums:
 
-class ROOM_CATEGORY(Enum):
+class ROOM_CATEGORY(IntEnum):
     #zoning classification. Used to identify zones in BDs.
-    
+    # IntEnum from 1, so 0 stays free for "unset" in table columns.
+
+    __str__ = Enum.__str__
+    __format__ = Enum.__format__
+
     CLINICAL = auto()
     PUBLIC = auto()
     PRIVATE = auto()
 
-class SPACE_ID(Enum):
+class SPACE_ID(IntEnum):
     # Room identifiers, 
     # these are only rooms we have rules for or that were mentioned in rule set.
     # rooms that arent in rule set still need labels here
+    # Dense 0..N-1 so members index NumPy arrays and bitmasks directly.
+    # str()/format() keep the Enum form ("SPACE_ID.LAB"); instance ids are built from it.
+
+    @staticmethod
+    def _generate_next_value_(name, start, count, last_values):
+        return count
+
+    __str__ = Enum.__str__
+    __format__ = Enum.__format__
 
     STERILIZATION = auto()
     LAB = auto()
@@ -161,8 +180,12 @@ class COUNT_DRIVER_ENUM(Enum):
     OCCUPANCY = auto()
     FIXED = auto()
 
-class CONDITION_ENUM(Enum):
+class CONDITION_ENUM(IntEnum):
     # modifier to add additional conditions to rules
+    # IntEnum from 1, so 0 stays free for "unset" in table columns.
+
+    __str__ = Enum.__str__
+    __format__ = Enum.__format__
 
     IF_PRESENT = auto()
     IF_ABSENT = auto()
@@ -194,9 +217,17 @@ class ENTRY_RULE_ENUM(Enum):
 
 #Adjacency and Graph Semantics:
 
-class SPACE_GROUP(Enum):
+class SPACE_GROUP(IntEnum):
     # course group labels for rooms,
     # can be used to avoid exploding graph from direct adjacency rules
+    # Numbered on from the last SPACE_ID so a group never compares equal to a room.
+
+    @staticmethod
+    def _generate_next_value_(name, start, count, last_values):
+        return len(SPACE_ID) + count
+
+    __str__ = Enum.__str__
+    __format__ = Enum.__format__
 
     PATIENT_FACING = auto()
     CLINICAL = auto()
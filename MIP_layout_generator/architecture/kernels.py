@@ -0,0 +1,243 @@
+# kernels.py
+#
+# Compiled evaluators over the rule_tables arrays.
+# Inputs are flat NumPy arrays only (no lists, no dicts) so the loops compile
+# under numba. numba is optional: without it the same functions run as plain
+# Python over the same arrays. numba rather than Cython/C so there is no build
+# step; the project is run from source.
+# Rule tables reach the kernels as arguments, never as globals: numba freezes
+# global arrays into the compiled code, and its cache only watches this file,
+# so an edited room_rules.py would keep scoring against stale tables.
+
+import numpy as np
+
+from .rule_tables import (
+    HARD_ADJ, HARD_REQUIRED, HARD_SEPARATION, LAYOUT_DISALLOWED, MUST_HIDE_FROM, OPT_WEIGHTS,
+    PROX_MAX_DIST, RULES_TABLE,
+)
+
+try:
+    from numba import njit, prange  # pyright: ignore[reportMissingImports]
+except ImportError:
+    prange = range
+
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda fn: fn
+
+
+@njit(cache=True, parallel=True)
+def _eval_room_constraints(hard_required, opt_weights, placement_mask, room_ids):
+    n = room_ids.shape[0]
+    n_rooms = opt_weights.shape[1]
+    scores = np.zeros(n, dtype=np.float32)
+    one = np.uint64(1)
+
+    for i in prange(n):
+        r = room_ids[i]
+        mask = placement_mask[i]
+
+        if hard_required[r] & ~mask:
+            scores[i] = -np.inf
+            continue
+
+        total = np.float32(0.0)
+        for t in range(n_rooms):
+            if (mask >> np.uint64(t)) & one:
+                total += opt_weights[r, t]
+        scores[i] = total
+
+    return scores
+
+
+def eval_room_constraints(placement_mask, room_ids):
+    """
+    Presence-level score of room type room_ids[i] within room program placement_mask[i].
+
+    - placement_mask: uint64 array, one SPACE_ID bit per room type in the program
+    - room_ids: int32 array of SPACE_ID values, same length as placement_mask
+    Returns float32 scores: -inf if a required adjacency partner is not in the
+    program, otherwise the summed preferredProximity weight toward rooms that are.
+    """
+    return _eval_room_constraints(HARD_REQUIRED, OPT_WEIGHTS, placement_mask, room_ids)
+
+
+@njit(cache=True)
+def _score(hard_sep, opt_weights, room_idx, candidate_mask, out):
+    sep = hard_sep[room_idx]
+    one = np.uint64(1)
+
+    for t in range(opt_weights.shape[1]):
+        if candidate_mask[t] == 0 or t == room_idx:
+            out[t] = 0.0
+        elif (sep >> np.uint64(t)) & one:
+            out[t] = -np.inf
+        else:
+            out[t] = opt_weights[room_idx, t]
+
+    return out
+
+
+def score(room_idx, candidate_mask, out):
+    """
+    Pairwise score of room type room_idx against each candidate room type.
+
+    - candidate_mask: uint8 array of length N_ROOMS, nonzero where t is a candidate
+    - out: float32 array of length N_ROOMS, written in place
+    out[t] is -inf if room_idx must be separated from t (hard), otherwise its
+    preferredProximity weight toward t; 0 for non-candidates and t == room_idx.
+    """
+    return _score(HARD_SEPARATION, OPT_WEIGHTS, room_idx, candidate_mask, out)
+
+
+# fastmath minus "ninf"/"nnan": -inf is the hard-separation sentinel, and LLVM
+# may fold it away if told no infinities occur
+@njit(parallel=True, fastmath={"nsz", "arcp", "contract", "afn", "reassoc"}, cache=True)
+def _score_all(related, hard_sep, pref_w, center_w, room_ids, positions, center, min_gap, out):
+    n = room_ids.shape[0]
+    one = np.uint64(1)
+
+    for i in prange(n):
+        r = room_ids[i]
+        xi = positions[i, 0]
+        yi = positions[i, 1]
+        total = -center_w[r] * (abs(xi - center[0]) + abs(yi - center[1]))
+
+        for j in range(n):
+            t = room_ids[j]
+            # No rule of r mentions t: the pair adds nothing
+            if j == i or not (related[r] >> np.uint64(t)) & one:
+                continue
+            d = abs(xi - positions[j, 0]) + abs(yi - positions[j, 1])
+            if hard_sep[r, t] and d < min_gap:
+                total = -np.inf
+                break
+            total -= pref_w[r, t] * d
+
+        out[i] = total
+
+    return out
+
+
+def score_placements(room_ids, positions, center, min_gap=180.0):
+    """
+    Score a candidate placement room by room.
+
+    - room_ids: int32 array of SPACE_ID values, one per placed room
+    - positions: float32 (n, 2) array of room centers, in inches
+    - center: (x, y) that centerBias distance is measured to
+    Returns float32 scores (higher is better): minus the preferredProximity-
+    weighted Manhattan distance to the other rooms and the centerBias-weighted
+    distance to center, or -inf if a hard separation pair is within min_gap.
+    """
+    out = np.empty(room_ids.shape[0], dtype=np.float32)
+    return _score_all(
+        RULES_TABLE.related,
+        RULES_TABLE.hard_sep,
+        RULES_TABLE.pref_prox_w,
+        RULES_TABLE.center_bias_w,
+        room_ids,
+        positions,
+        np.asarray(center, dtype=np.float32),
+        np.float32(min_gap),
+        out,
+    )
+
+
+@njit(cache=True, boundscheck=False)
+def _separated(rects, i, j, gap):
+    # Same test as _add_gap_disjunction: at least gap apart along x OR y
+    xi, yi, wi, hi = rects[i, 0], rects[i, 1], rects[i, 2], rects[i, 3]
+    xj, yj, wj, hj = rects[j, 0], rects[j, 1], rects[j, 2], rects[j, 3]
+    return (
+        xi + wi + gap <= xj or xj + wj + gap <= xi
+        or yj + hj + gap <= yi or yi + hi + gap <= yj
+    )
+
+
+@njit(cache=True, boundscheck=False)
+def _share_wall(rects, i, j, wall, overlap):
+    # Same test as _add_direct_adjacency: wall apart on one side, overlap of shared wall
+    xi, yi, wi, hi = rects[i, 0], rects[i, 1], rects[i, 2], rects[i, 3]
+    xj, yj, wj, hj = rects[j, 0], rects[j, 1], rects[j, 2], rects[j, 3]
+    y_overlap = yi + overlap <= yj + hj and yj + overlap <= yi + hi
+    x_overlap = xi + overlap <= xj + wj and xj + overlap <= xi + wi
+    return (
+        ((xi + wi + wall == xj or xj + wj + wall == xi) and y_overlap)
+        or ((yj + hj + wall == yi or yi + hi + wall == yj) and x_overlap)
+    )
+
+
+@njit(cache=True, boundscheck=False)
+def _evaluate_rules(
+    hard_adj, hard_sep, hidden, prox_max, disallowed, room_ids, rects, wall, overlap, min_sep, min_hidden_gap
+):
+    n = room_ids.shape[0]
+    one = np.uint64(1)
+
+    placed = np.uint64(0)
+    for i in range(n):
+        placed |= one << np.uint64(room_ids[i])
+
+    # Layout rules arrive pre-resolved as one mask, so there is no per-rule layout branch
+    violations = 0
+    for i in range(n):
+        if (disallowed >> np.uint64(room_ids[i])) & one:
+            violations += 1
+    for i in range(n):
+        r = room_ids[i]
+        touching = np.uint64(0)
+
+        for j in range(n):
+            t = room_ids[j]
+            if j == i or t == r:
+                continue
+            bit = one << np.uint64(t)
+            if hard_adj[r] & bit and _share_wall(rects, i, j, wall, overlap):
+                touching |= bit
+            if hard_sep[r] & bit and not _separated(rects, i, j, min_sep):
+                violations += 1
+            if hidden[r] & bit and not _separated(rects, i, j, min_hidden_gap):
+                violations += 1
+            # maxDistanceInches caps the Manhattan distance between room origins
+            d = abs(rects[i, 0] - rects[j, 0]) + abs(rects[i, 1] - rects[j, 1])
+            if d > prox_max[r, t]:
+                violations += 1
+
+        # Hard adjacency holds if r shares a wall with at least one instance of t
+        missing = hard_adj[r] & placed & ~touching & ~(one << np.uint64(r))
+        for t in range(prox_max.shape[1]):
+            if (missing >> np.uint64(t)) & one:
+                violations += 1
+
+    return violations
+
+
+def evaluate_rules(room_ids, rects, layout=None, wall=12, overlap=24, min_sep=180, min_hidden_gap=180):
+    """
+    Count the hard adjacency / separation / must-be-hidden-from rules and
+    preferredProximity distance caps a placement violates.
+
+    - room_ids: int32 array of SPACE_ID values, one per placed room
+    - rects: (n, 4) array of x, y, w, h per room, in inches
+    - layout: LAYOUT_ENUM; each room its orientation rules disallow there is one
+      more violation. None skips the layout check.
+    Rooms are tested the way the MIP builders model them (shared wall `wall`
+    apart with `overlap` of common wall; min_sep / min_hidden_gap along x or y;
+    maxDistanceInches as Manhattan distance between room origins).
+    Violations are counted per ordered (r, t) rule; 0 means the placement is feasible.
+    """
+    return int(_evaluate_rules(
+        HARD_ADJ,
+        HARD_SEPARATION,
+        MUST_HIDE_FROM,
+        PROX_MAX_DIST,
+        np.uint64(0) if layout is None else LAYOUT_DISALLOWED[layout.value],
+        room_ids,
+        rects,
+        wall,
+        overlap,
+        min_sep,
+        min_hidden_gap,
+    ))
@@ -17,13 +17,163 @@ NOTE:
 - Use SPACE_GROUP where possible to avoid adjacency explosion
 """
 
+import os
+import pickle
+from pathlib import Path
+from types import MappingProxyType
+
+from . import core, room_schema
 from .core import *
-from .room_schema import RoomSchema
+from .room_schema import RoomRule, RoomSchema
+
+
+# Rule objects are read-only once built. Entry lists are written as tuples;
+# _freeze turns every dict into a MappingProxyType (and any stray list into a
+# tuple), and interns structurally identical fragments (e.g. repeated ada /
+# orientation blocks) so they share one object.
+
+_INTERNED = {}
+
+def _leaf_key(v):
+    # Children are interned before their parent, so a frozen child's id() is a
+    # canonical key for its structure. type() keeps True / 1 / 1.0 apart.
+    if isinstance(v, (MappingProxyType, tuple)):
+        return id(v)
+    return (type(v), v)
+
+def _freeze(obj):
+    if isinstance(obj, dict):
+        items = {k: _freeze(v) for k, v in obj.items()}
+        key = (dict, tuple((k, _leaf_key(v)) for k, v in items.items()))
+        return _INTERNED.setdefault(key, MappingProxyType(items))
+    if isinstance(obj, (list, tuple)):
+        items = tuple(_freeze(v) for v in obj)
+        key = (tuple, tuple(_leaf_key(v) for v in items))
+        return _INTERNED.setdefault(key, items)
+    return obj
+
+
+# Compact row forms for the target lists below. Each row materializes to the
+# same dict the schema describes, e.g. (SPACE_GROUP.PUBLIC, True) ->
+# {"target": SPACE_GROUP.PUBLIC, "hard": True}.
+
+def _targets(*rows):
+    return tuple({"target": target, "hard": hard} for target, hard in rows)
+
+def _adjacent(*rows):
+    return tuple(
+        {"target": target, "condition": condition, "hard": hard}
+        for target, condition, hard in rows
+    )
+
+# Orientation for a room that is placed the same way in every layout
+def _all_layouts(block):
+    return {layout: block for layout in LAYOUT_ENUM}
+
+
+# Shared sub-rules. Referenced from several rooms below; change them here.
+
+_ADA_STANDARD = _freeze({
+    "minClearWidthInches": 34,
+    "requiredEntries": 1,
+})
+
+_ADA_WIDE = _freeze({
+    "minClearWidthInches": 36,
+    "requiredEntries": 1,
+})
+
+_ADA_CORRIDOR = _freeze({
+    "minClearWidthInches": 44,
+    "requiredEntries": 1,
+})
+
+# entryCountRules that don't vary with treatment-room count
+_ONE_ENTRY = _freeze((
+    {
+        "treatmentRoomsMin": None,
+        "treatmentRoomsMax": None,
+        "minEntries": 1,
+        "maxEntries": 1,
+    },
+))
+
+_ONE_OR_TWO_ENTRIES = _freeze((
+    {
+        "treatmentRoomsMin": None,
+        "treatmentRoomsMax": None,
+        "minEntries": 1,
+        "maxEntries": 2,
+    },
+))
+
+_ORIENTATION_CENTER = _freeze({
+    LAYOUT_ENUM.NARROW: {
+        "allowed": True,
+        "longAxisRelation": AXIS_RELATION_ENUM.PARALLEL,
+        "placementHint": PLACEMENT_ENUM.CENTER,
+        "connectsCorridors": False,
+    },
+    LAYOUT_ENUM.THREE_LAYER_CAKE: {
+        "allowed": True,
+        "longAxisRelation": AXIS_RELATION_ENUM.NONE,
+        "placementHint": PLACEMENT_ENUM.CENTER,
+        "connectsCorridors": False,
+    },
+    LAYOUT_ENUM.H_LAYOUT: {
+        "allowed": True,
+        "longAxisRelation": AXIS_RELATION_ENUM.NONE,
+        "placementHint": PLACEMENT_ENUM.CENTER,
+        "connectsCorridors": False,
+    },
+})
+
+_ORIENTATION_FRONT = _freeze({
+    LAYOUT_ENUM.NARROW: {
+        "allowed": True,
+        "longAxisRelation": AXIS_RELATION_ENUM.PARALLEL,
+        "placementHint": PLACEMENT_ENUM.FRONT,
+        "connectsCorridors": False,
+    },
+    LAYOUT_ENUM.THREE_LAYER_CAKE: {
+        "allowed": True,
+        "longAxisRelation": AXIS_RELATION_ENUM.PARALLEL,
+        "placementHint": PLACEMENT_ENUM.FRONT,
+        "connectsCorridors": False,
+    },
+    LAYOUT_ENUM.H_LAYOUT: {
+        "allowed": True,
+        "longAxisRelation": AXIS_RELATION_ENUM.PARALLEL,
+        "placementHint": PLACEMENT_ENUM.FRONT,
+        "connectsCorridors": False,
+    },
+})
+
+_ORIENTATION_CENTER_CONNECTOR = _freeze({
+    LAYOUT_ENUM.NARROW: {
+        "allowed": True,
+        "longAxisRelation": AXIS_RELATION_ENUM.PARALLEL,
+        "placementHint": PLACEMENT_ENUM.CENTER,
+        "connectsCorridors": True,
+    },
+    LAYOUT_ENUM.H_LAYOUT: {
+        "allowed": True,
+        "longAxisRelation": AXIS_RELATION_ENUM.NONE,
+        "placementHint": PLACEMENT_ENUM.CENTER,
+        "connectsCorridors": True,
+    },
+    LAYOUT_ENUM.THREE_LAYER_CAKE: {
+        "allowed": True,
+        "longAxisRelation": AXIS_RELATION_ENUM.NONE,
+        "placementHint": PLACEMENT_ENUM.CENTER,
+        "connectsCorridors": True,
+    },
+})
 
 
 #Sterilization
 
-STERILIZATION_RULES = {
+STERILIZATION_RULES = _freeze({
     "identity": {
         "roomType": SPACE_ID.STERILIZATION,
         "category": ROOM_CATEGORY.PRIVATE,
@@ -32,19 +182,19 @@ STERILIZATION_RULES = {
 
     "existence": {
         "trigger": TRIGGER_ENUM.ALWAYS,
-        "countRules": [
+        "countRules": (
             {
                 "driver": COUNT_DRIVER_ENUM.FIXED,
                 "min": 1,
                 "max": 2,
                 "condition": CONDITION_ENUM.NONE,
-            }
-        ],
+            },
+        ),
     },
 
     "geometry": {
         "shape": SHAPE_ENUM.RECTANGULAR,
-        "dimensionModels": [
+        "dimensionModels": (
             {
                 "label": "compact",
                 "treatmentRoomsMin": 5,
@@ -75,7 +225,7 @@ STERILIZATION_RULES = {
                 "longAxisVariable": True,
                 "longAxisIncrementPerDoorInches": 36,
             },
-        ],
+        ),
         "fallbackStrategy": GEOMETRY_FALLBACK_ENUM.NEAREST_MATCH,
     },
 
@@ -101,7 +251,7 @@ STERILIZATION_RULES = {
     },
 
     "access": {
-        "entryCountRules": [
+        "entryCountRules": (
             {
                 "treatmentRoomsMin": 5,
                 "treatmentRoomsMax": 8,
@@ -114,8 +264,8 @@ STERILIZATION_RULES = {
                 "minEntries": 2,
                 "maxEntries": 2,
             },
-        ],
-        "entryConstraints": [#find a less semantic way to encode this
+        ),
+        "entryConstraints": (#find a less semantic way to encode this
             {
                 "kind": ENTRY_RULE_ENUM.ENTRY_FROM,
                 "target": SPACE_ID.CLINICAL_CORRIDOR,
@@ -134,15 +284,12 @@ STERILIZATION_RULES = {
                 "distanceMaxInches": 36,
                 "hard": False,
             },
-        ],
-        "ada": {
-            "minClearWidthInches": 34,
-            "requiredEntries": 1,
-        },
+        ),
+        "ada": _ADA_STANDARD,
     },
 
     "adjacency": {
-        "direct": [
+        "direct": (
             {#TODO: might not need to define adjacency corridir groups, just let them fall into place based on whats given in rules
                 "target": SPACE_ID.CLINICAL_CORRIDOR,
                 "condition": CONDITION_ENUM.NONE,
@@ -153,31 +300,31 @@ STERILIZATION_RULES = {
                 "condition": CONDITION_ENUM.IF_PRESENT,
                 "hard": False,
             },
-        ],
-        "preferredProximity": [
+        ),
+        "preferredProximity": (
             {#TODO: maybe instead of space group do preferred dist to treatment room 
                 "target": SPACE_GROUP.CLINICAL,
                 "maxDistanceInches": None,
                 "optimizationWeight": 1.0,
-            }
-        ],
-        "separation": [],
+            },
+        ),
+        "separation": (),
     },
 
     "visibility": {
-        "mustBeHiddenFrom": [
+        "mustBeHiddenFrom": (
             {
                 "target": SPACE_GROUP.PATIENT_FACING,
                 "hard": True,
-            }
-        ],
-        "mustBeVisibleFrom": [],
+            },
+        ),
+        "mustBeVisibleFrom": (),
     },
 
     "circulation": {#NOTE: these aren't explicitly defined in the rule set, but i have it here for optimization purposes down the line, values are assumed.
         "role": CIRCULATION_ROLE_ENUM.DESTINATION,
-        "mustConnect": [SPACE_ID.CLINICAL_CORRIDOR],
-        "mustNotTerminateInto": [],
+        "mustConnect": (SPACE_ID.CLINICAL_CORRIDOR,),
+        "mustNotTerminateInto": (),
     },
 
     "optimization": {#NOTE: these aren't explicitly defined in the rule set, but i have it here for optimization purposes down the line, values are assumed.
@@ -189,11 +336,11 @@ STERILIZATION_RULES = {
             "sameCategoryBonus": 0.5,
         },
     },
-}
+})
 
 # Lab
 
-LAB_RULES = {
+LAB_RULES = _freeze({
     "identity": {
         "roomType": SPACE_ID.LAB,
         "category": ROOM_CATEGORY.CLINICAL,
@@ -205,14 +352,14 @@ LAB_RULES = {
         # Labs are common but not universally required.
         # Often dependent on practice type or analog workflows.
         "trigger": TRIGGER_ENUM.DERIVED,  # TODO: confirm if always required in some practices
-        "countRules": [
+        "countRules": (
             {
                 "driver": COUNT_DRIVER_ENUM.FIXED,
                 "min": 0,          # allow absence
                 "max": 1,          # assume single shared lab
                 "condition": CONDITION_ENUM.NONE,
-            }
-        ],
+            },
+        ),
     },
 
     "geometry": {
@@ -220,7 +367,7 @@ LAB_RULES = {
         # Labs are typically rectilinear or rectangular.
         "shape": SHAPE_ENUM.RECTANGULAR,
 
-        "dimensionModels": [
+        "dimensionModels": (
             {
                 "label": "default_lab",
                 "treatmentRoomsMin": None,
@@ -230,8 +377,8 @@ LAB_RULES = {
                 "areaSqIn": None,        # TODO: preferred area if known
                 "longAxisVariable": False,
                 "longAxisIncrementPerDoorInches": None,
-            }
-        ],
+            },
+        ),
 
         "fallbackStrategy": GEOMETRY_FALLBACK_ENUM.MINIMUM,
     },
@@ -260,16 +407,9 @@ LAB_RULES = {
     },
 
     "access": {
-        "entryCountRules": [
-            {
-                "treatmentRoomsMin": None,
-                "treatmentRoomsMax": None,
-                "minEntries": 1,
-                "maxEntries": 1,
-            }
-        ],
+        "entryCountRules": _ONE_ENTRY,
 
-        "entryConstraints": [
+        "entryConstraints": (
             {
                 # Assumption:
                 # Labs typically connect to clinical circulation.
@@ -277,67 +417,64 @@ LAB_RULES = {
                 "target": SPACE_GROUP.CLINICAL,
                 "distanceMaxInches": None,
                 "hard": True,
-            }
-        ],
+            },
+        ),
 
-        "ada": {
-            # Assumption:
-            # Treat lab like other staff-accessible rooms.
-            "minClearWidthInches": 34,
-            "requiredEntries": 1,
-        },
+        # Assumption:
+        # Treat lab like other staff-accessible rooms.
+        "ada": _ADA_STANDARD,
     },
 
     "adjacency": {
-        "direct": [
+        "direct": (
             {
                 # Inferred from sterilization rules:
                 # Lab is often adjacent to sterilization when present.
                 "target": SPACE_ID.STERILIZATION,
                 "condition": CONDITION_ENUM.IF_PRESENT,
                 "hard": False,
-            }
-        ],
+            },
+        ),
 
-        "preferredProximity": [
+        "preferredProximity": (
             {
                 # Labs generally support clinical functions.
                 "target": SPACE_GROUP.CLINICAL,
                 "maxDistanceInches": None,
                 "optimizationWeight": 0.5,
-            }
-        ],
+            },
+        ),
 
-        "separation": [
+        "separation": (
             {
                 # Conservative assumption:
                 # Labs should not open directly into public zones.
                 "target": SPACE_GROUP.PUBLIC,
                 "hard": True,
-            }
-        ],
+            },
+        ),
     },
 
     "visibility": {
-        "mustBeHiddenFrom": [
+        "mustBeHiddenFrom": (
             {
                 # Labs are typically non-patient-facing.
                 "target": SPACE_GROUP.PATIENT_FACING,
                 "hard": True,
-            }
-        ],
-        "mustBeVisibleFrom": [],
+            },
+        ),
+        "mustBeVisibleFrom": (),
     },
 
     "circulation": {
         # Labs are destinations, not connectors.
         "role": CIRCULATION_ROLE_ENUM.DESTINATION,
-        "mustConnect": [
+        "mustConnect": (
             SPACE_ID.CLINICAL_CORRIDOR,
-        ],
-        "mustNotTerminateInto": [
+        ),
+        "mustNotTerminateInto": (
             SPACE_GROUP.PUBLIC,
-        ],
+        ),
     },
 
     "optimization": {
@@ -350,11 +487,11 @@ LAB_RULES = {
             "sameCategoryBonus": 0.4,
         },
     },
-}
+})
 
 # Consult
 
-CONSULT_RULES = {
+CONSULT_RULES = _freeze({
     "identity": {
         "roomType": SPACE_ID.CONSULT,
         "category": ROOM_CATEGORY.PUBLIC,
@@ -365,7 +502,7 @@ CONSULT_RULES = {
         # Explicit in rules:
         # Consult rooms are included only when requested by user input.
         "trigger": TRIGGER_ENUM.USER_INPUT,
-        "countRules": [
+        "countRules": (
             {
                 # No deterministic scaling rules provided.
                 # Quantity depends entirely on user request.
@@ -373,14 +510,14 @@ CONSULT_RULES = {
                 "min": 0,
                 "max": None,  # unbounded; controlled externally
                 "condition": CONDITION_ENUM.NONE,
-            }
-        ],
+            },
+        ),
     },
 
     "geometry": {
         "shape": SHAPE_ENUM.RECTANGULAR,
 
-        "dimensionModels": [
+        "dimensionModels": (
             {
                 # Ideal: same size as treatment room
                 "label": "ideal_equals_treatment_room",
@@ -414,35 +551,21 @@ CONSULT_RULES = {
                 "longAxisVariable": False,
                 "longAxisIncrementPerDoorInches": None,
             },
-        ],
+        ),
 
         "fallbackStrategy": GEOMETRY_FALLBACK_ENUM.NEAREST_MATCH,
     },
 
-    "orientation": {
+    "orientation": _all_layouts({
         # Explicitly stated: no orientation rules for any layout
-        LAYOUT_ENUM.NARROW: {
-            "allowed": True,
-            "longAxisRelation": AXIS_RELATION_ENUM.NONE,
-            "placementHint": None,
-            "connectsCorridors": False,
-        },
-        LAYOUT_ENUM.THREE_LAYER_CAKE: {
-            "allowed": True,
-            "longAxisRelation": AXIS_RELATION_ENUM.NONE,
-            "placementHint": None,
-            "connectsCorridors": False,
-        },
-        LAYOUT_ENUM.H_LAYOUT: {
-            "allowed": True,
-            "longAxisRelation": AXIS_RELATION_ENUM.NONE,
-            "placementHint": None,
-            "connectsCorridors": False,
-        },
-    },
+        "allowed": True,
+        "longAxisRelation": AXIS_RELATION_ENUM.NONE,
+        "placementHint": None,
+        "connectsCorridors": False,
+    }),
 
     "access": {
-        "entryCountRules": [
+        "entryCountRules": (
             {
                 # One entry required
                 "treatmentRoomsMin": None,
@@ -457,9 +580,9 @@ CONSULT_RULES = {
                 "minEntries": 1,
                 "maxEntries": 2,
             },
-        ],
+        ),
 
-        "entryConstraints": [
+        "entryConstraints": (
             {
                 # Required: entry near check-out
                 "kind": ENTRY_RULE_ENUM.ENTRY_NEAR,
@@ -481,56 +604,47 @@ CONSULT_RULES = {
                 "distanceMaxInches": None,
                 "hard": False,
             },
-        ],
+        ),
 
-        "ada": {
-            # Explicitly stated
-            "minClearWidthInches": 34,
-            "requiredEntries": 1,
-        },
+        # Explicitly stated
+        "ada": _ADA_STANDARD,
     },
 
     "adjacency": {
-        "direct": [
+        "direct": (
             # Explicitly none
-        ],
+        ),
 
-        "preferredProximity": [
+        "preferredProximity": (
             {
                 # Check-out within 15 feet
                 "target": SPACE_ID.CHECK_OUT,
                 "maxDistanceInches": 180,  # 15 ft
                 "optimizationWeight": 1.0,
-            }
-        ],
-
-        "separation": [
-            {
-                "target": SPACE_ID.MECHANICAL,
-                "hard": True,
-            },
-            {
-                "target": SPACE_ID.LAB,
-                "hard": True,
             },
-        ],
+        ),
+
+        "separation": _targets(
+            (SPACE_ID.MECHANICAL, True),
+            (SPACE_ID.LAB, True),
+        ),
     },
 
     "visibility": {
         # Explicitly none
-        "mustBeHiddenFrom": [],
-        "mustBeVisibleFrom": [],
+        "mustBeHiddenFrom": (),
+        "mustBeVisibleFrom": (),
     },
 
     "circulation": {
         # Consult rooms are destinations accessed by patients.
         "role": CIRCULATION_ROLE_ENUM.DESTINATION,
-        "mustConnect": [
+        "mustConnect": (
             SPACE_GROUP.PUBLIC,
-        ],
-        "mustNotTerminateInto": [
+        ),
+        "mustNotTerminateInto": (
             SPACE_GROUP.CLINICAL,
-        ],
+        ),
     },
 
     "optimization": {
@@ -543,11 +657,11 @@ CONSULT_RULES = {
             "sameCategoryBonus": 0.6,
         },
     },
-}
+})
 
 # Patient Restroom
 
-PATIENT_RESTROOM_RULES = {
+PATIENT_RESTROOM_RULES = _freeze({
     "identity": {
         "roomType": SPACE_ID.PATIENT_RESTROOM,
         "category": ROOM_CATEGORY.PUBLIC,
@@ -558,42 +672,46 @@ PATIENT_RESTROOM_RULES = {
         # Explicit: included when noted by user input
         "trigger": TRIGGER_ENUM.USER_INPUT,
 
-        "countRules": [
+        "countRules": (
             {
                 # 1 required if total square footage < 1500
+                # (baseline; the > 1500 rule below raises it)
                 "driver": COUNT_DRIVER_ENUM.BUILDING_SQFT,
                 "min": 1,
                 "max": 1,
-                "condition": CONDITION_ENUM.IF_THRESHOLD,  # TODO: encode threshold logic (<1500)
+                "condition": CONDITION_ENUM.NONE,
             },
             {
                 # 2 required if square footage > 1500
                 "driver": COUNT_DRIVER_ENUM.BUILDING_SQFT,
                 "min": 2,
                 "max": 2,
-                "condition": CONDITION_ENUM.IF_THRESHOLD,  # TODO: encode threshold logic (>1500)
+                "condition": CONDITION_ENUM.IF_GREATER_THAN,
+                "threshold": 1500,
             },
             {
                 # 3 required if occupancy > 50
                 "driver": COUNT_DRIVER_ENUM.OCCUPANCY,
                 "min": 3,
                 "max": 3,
-                "condition": CONDITION_ENUM.IF_THRESHOLD,  # TODO: encode threshold logic (>50)
+                "condition": CONDITION_ENUM.IF_GREATER_THAN,
+                "threshold": 50,
             },
             {
-                # +1 for every additional 50 occupants
+                # +1 for every additional 50 occupants (extends the rule above)
                 "driver": COUNT_DRIVER_ENUM.OCCUPANCY,
-                "min": None,
+                "min": 1,
                 "max": None,
-                "condition": CONDITION_ENUM.IF_THRESHOLD,  # TODO: encode incremental rule (per +50)
+                "condition": CONDITION_ENUM.PER_N_UNITS,
+                "threshold": 50,
             },
-        ],
+        ),
     },
 
     "geometry": {
         "shape": SHAPE_ENUM.RECTANGULAR,
 
-        "dimensionModels": [
+        "dimensionModels": (
             {
                 "label": "minimum_patient_restroom",
                 "treatmentRoomsMin": None,
@@ -603,46 +721,32 @@ PATIENT_RESTROOM_RULES = {
                 "areaSqIn": None,
                 "longAxisVariable": False,
                 "longAxisIncrementPerDoorInches": None,
-            }
-        ],
+            },
+        ),
 
         "fallbackStrategy": GEOMETRY_FALLBACK_ENUM.MINIMUM,
     },
 
-    "orientation": {
+    "orientation": _all_layouts({
         # Explicitly no orientation constraints in any layout
-        LAYOUT_ENUM.NARROW: {
-            "allowed": True,
-            "longAxisRelation": AXIS_RELATION_ENUM.NONE,
-            "placementHint": None,
-            "connectsCorridors": False,
-        },
-        LAYOUT_ENUM.THREE_LAYER_CAKE: {
-            "allowed": True,
-            "longAxisRelation": AXIS_RELATION_ENUM.NONE,
-            "placementHint": None,
-            "connectsCorridors": False,
-        },
-        LAYOUT_ENUM.H_LAYOUT: {
-            "allowed": True,
-            "longAxisRelation": AXIS_RELATION_ENUM.NONE,
-            "placementHint": None,
-            "connectsCorridors": False,
-        },
-    },
+        "allowed": True,
+        "longAxisRelation": AXIS_RELATION_ENUM.NONE,
+        "placementHint": None,
+        "connectsCorridors": False,
+    }),
 
     "access": {
-        "entryCountRules": [
+        "entryCountRules": (
             {
                 # One entry required
                 "treatmentRoomsMin": None,
                 "treatmentRoomsMax": None,
                 "minEntries": 1,
                 "maxEntries": 1,
-            }
-        ],
+            },
+        ),
 
-        "entryConstraints": [
+        "entryConstraints": (
             {
                 # Must not be accessed from within another room
                 "kind": ENTRY_RULE_ENUM.ENTRY_NOT_FROM,
@@ -657,49 +761,46 @@ PATIENT_RESTROOM_RULES = {
                 "distanceMaxInches": None,
                 "hard": False,
             },
-        ],
+        ),
 
-        "ada": {
-            # Explicit ADA requirement
-            "minClearWidthInches": 34,
-            "requiredEntries": 1,
-        },
+        # Explicit ADA requirement
+        "ada": _ADA_STANDARD,
     },
 
     "adjacency": {
-        "direct": [
+        "direct": (
             # None specified
-        ],
+        ),
 
-        "preferredProximity": [
+        "preferredProximity": (
             {
                 # Check-out should be within 15 feet
                 "target": SPACE_ID.CHECK_OUT,
                 "maxDistanceInches": 180,  # 15 ft
                 "optimizationWeight": 0.8,
-            }
-        ],
+            },
+        ),
 
-        "separation": [
+        "separation": (
             # None specified
-        ],
+        ),
     },
 
     "visibility": {
         # Explicitly none
-        "mustBeHiddenFrom": [],
-        "mustBeVisibleFrom": [],
+        "mustBeHiddenFrom": (),
+        "mustBeVisibleFrom": (),
     },
 
     "circulation": {
         # Patient restrooms are destinations accessed from public circulation
         "role": CIRCULATION_ROLE_ENUM.DESTINATION,
-        "mustConnect": [
+        "mustConnect": (
             SPACE_GROUP.PUBLIC,
-        ],
-        "mustNotTerminateInto": [
+        ),
+        "mustNotTerminateInto": (
             SPACE_GROUP.CLINICAL,
-        ],
+        ),
     },
 
     "optimization": {
@@ -712,11 +813,11 @@ PATIENT_RESTROOM_RULES = {
             "sameCategoryBonus": 0.5,
         },
     },
-}
+})
 
 # Treatment Coordination Station
 
-TREATMENT_COORDINATION_RULES = {
+TREATMENT_COORDINATION_RULES = _freeze({
     "identity": {
         "roomType": SPACE_ID.TREATMENT_COORDINATION,
         "category": ROOM_CATEGORY.CLINICAL,
@@ -727,21 +828,21 @@ TREATMENT_COORDINATION_RULES = {
         # Explicit: included only when requested
         "trigger": TRIGGER_ENUM.USER_INPUT,
 
-        "countRules": [
+        "countRules": (
             {
                 # One coordinator per 10 operatories
                 "driver": COUNT_DRIVER_ENUM.TREATMENT_ROOMS,
                 "min": None,
                 "max": None,
                 "condition": CONDITION_ENUM.PER_N_UNITS,  # TODO: encode divisor = 10
-            }
-        ],
+            },
+        ),
     },
 
     "geometry": {
         "shape": SHAPE_ENUM.RECTANGULAR,
 
-        "dimensionModels": [
+        "dimensionModels": (
             {
                 # One-person station
                 "label": "one_person_station",
@@ -764,46 +865,32 @@ TREATMENT_COORDINATION_RULES = {
                 "longAxisVariable": False,
                 "longAxisIncrementPerDoorInches": None,
             },
-        ],
+        ),
 
         "fallbackStrategy": GEOMETRY_FALLBACK_ENUM.MINIMUM,
     },
 
-    "orientation": {
+    "orientation": _all_layouts({
         # All layouts: parallel to the long axis of the clinical hallway
-        LAYOUT_ENUM.NARROW: {
-            "allowed": True,
-            "longAxisRelation": AXIS_RELATION_ENUM.PARALLEL,
-            "placementHint": PLACEMENT_ENUM.ALONG,
-            "connectsCorridors": True,
-        },
-        LAYOUT_ENUM.THREE_LAYER_CAKE: {
-            "allowed": True,
-            "longAxisRelation": AXIS_RELATION_ENUM.PARALLEL,
-            "placementHint": PLACEMENT_ENUM.ALONG,
-            "connectsCorridors": True,
-        },
-        LAYOUT_ENUM.H_LAYOUT: {
-            "allowed": True,
-            "longAxisRelation": AXIS_RELATION_ENUM.PARALLEL,
-            "placementHint": PLACEMENT_ENUM.ALONG,
-            "connectsCorridors": True,
-        },
-    },
+        "allowed": True,
+        "longAxisRelation": AXIS_RELATION_ENUM.PARALLEL,
+        "placementHint": PLACEMENT_ENUM.ALONG,
+        "connectsCorridors": True,
+    }),
 
     "access": {
         # This is not a room with discrete doors
         # Modeled as zero formal entries, but continuous access
-        "entryCountRules": [
+        "entryCountRules": (
             {
                 "treatmentRoomsMin": None,
                 "treatmentRoomsMax": None,
                 "minEntries": 0,
                 "maxEntries": 0,
-            }
-        ],
+            },
+        ),
 
-        "entryConstraints": [
+        "entryConstraints": (
             {
                 # Entire length must be accessible from clinical hallway
                 "kind": ENTRY_RULE_ENUM.ENTRY_FROM,
@@ -818,7 +905,7 @@ TREATMENT_COORDINATION_RULES = {
                 "distanceMaxInches": 36,
                 "hard": False,
             },
-        ],
+        ),
 
         # ADA modeled implicitly via corridor standards
         "ada": {
@@ -828,43 +915,43 @@ TREATMENT_COORDINATION_RULES = {
     },
 
     "adjacency": {
-        "direct": [
+        "direct": (
             # None specified
-        ],
+        ),
 
-        "preferredProximity": [
+        "preferredProximity": (
             {
                 # As close to center of treatment space as possible
                 "target": SPACE_GROUP.CLINICAL,
                 "maxDistanceInches": None,
                 "optimizationWeight": 1.0,
-            }
-        ],
+            },
+        ),
 
-        "separation": [
+        "separation": (
             {
                 # Ideally not adjacent to patient restroom
                 "target": SPACE_ID.PATIENT_RESTROOM,
                 "hard": False,
-            }
-        ],
+            },
+        ),
     },
 
     "visibility": {
         # No explicit visibility requirements
-        "mustBeHiddenFrom": [],
-        "mustBeVisibleFrom": [],
+        "mustBeHiddenFrom": (),
+        "mustBeVisibleFrom": (),
     },
 
     "circulation": {
         # Behaves as part of the clinical spine, not a destination
         "role": CIRCULATION_ROLE_ENUM.CONNECTOR,
-        "mustConnect": [
+        "mustConnect": (
             SPACE_ID.CLINICAL_CORRIDOR,
-        ],
-        "mustNotTerminateInto": [
+        ),
+        "mustNotTerminateInto": (
             SPACE_GROUP.PUBLIC,
-        ],
+        ),
     },
 
     "optimization": {
@@ -877,11 +964,11 @@ TREATMENT_COORDINATION_RULES = {
             "sameCategoryBonus": 0.7,
         },
     },
-}
+})
 
 # Mobile Tech Area
 
-MOBILE_TECH_RULES = {
+MOBILE_TECH_RULES = _freeze({
     "identity": {
         "roomType": SPACE_ID.MOBILE_TECH,
         "category": ROOM_CATEGORY.CLINICAL,
@@ -892,7 +979,7 @@ MOBILE_TECH_RULES = {
         # Always required
         "trigger": TRIGGER_ENUM.ALWAYS,
 
-        "countRules": [
+        "countRules": (
             {
                 # One Mobile Tech area per clinical cluster of 5–8 treatment rooms
                 "driver": COUNT_DRIVER_ENUM.TREATMENT_ROOMS,
@@ -907,13 +994,13 @@ MOBILE_TECH_RULES = {
                 "max": None,
                 "condition": CONDITION_ENUM.IF_THRESHOLD,  # TODO: define distribution logic
             },
-        ],
+        ),
     },
 
     "geometry": {
         "shape": SHAPE_ENUM.RECTANGULAR,
 
-        "dimensionModels": [
+        "dimensionModels": (
             {
                 "label": "standard_mobile_tech",
                 "treatmentRoomsMin": None,
@@ -923,46 +1010,32 @@ MOBILE_TECH_RULES = {
                 "areaSqIn": None,
                 "longAxisVariable": False,
                 "longAxisIncrementPerDoorInches": None,
-            }
-        ],
+            },
+        ),
 
         "fallbackStrategy": GEOMETRY_FALLBACK_ENUM.MINIMUM,
     },
 
-    "orientation": {
+    "orientation": _all_layouts({
         # All layouts: parallel to clinical hallway
-        LAYOUT_ENUM.NARROW: {
-            "allowed": True,
-            "longAxisRelation": AXIS_RELATION_ENUM.PARALLEL,
-            "placementHint": PLACEMENT_ENUM.ALONG,
-            "connectsCorridors": True,
-        },
-        LAYOUT_ENUM.THREE_LAYER_CAKE: {
-            "allowed": True,
-            "longAxisRelation": AXIS_RELATION_ENUM.PARALLEL,
-            "placementHint": PLACEMENT_ENUM.ALONG,
-            "connectsCorridors": True,
-        },
-        LAYOUT_ENUM.H_LAYOUT: {
-            "allowed": True,
-            "longAxisRelation": AXIS_RELATION_ENUM.PARALLEL,
-            "placementHint": PLACEMENT_ENUM.ALONG,
-            "connectsCorridors": True,
-        },
-    },
+        "allowed": True,
+        "longAxisRelation": AXIS_RELATION_ENUM.PARALLEL,
+        "placementHint": PLACEMENT_ENUM.ALONG,
+        "connectsCorridors": True,
+    }),
 
     "access": {
         # Linear / open access, not discrete door-based
-        "entryCountRules": [
+        "entryCountRules": (
             {
                 "treatmentRoomsMin": None,
                 "treatmentRoomsMax": None,
                 "minEntries": 0,
                 "maxEntries": 0,
-            }
-        ],
+            },
+        ),
 
-        "entryConstraints": [
+        "entryConstraints": (
             {
                 # Must be accessible from clinical hallway or sterilization corridor
                 "kind": ENTRY_RULE_ENUM.ENTRY_FROM,
@@ -990,7 +1063,7 @@ MOBILE_TECH_RULES = {
                 "distanceMaxInches": 36,
                 "hard": False,
             },
-        ],
+        ),
 
         # ADA compliance handled at corridor level
         "ada": {
@@ -1000,20 +1073,20 @@ MOBILE_TECH_RULES = {
     },
 
     "adjacency": {
-        "direct": [
+        "direct": (
             # None specified
-        ],
+        ),
 
-        "preferredProximity": [
+        "preferredProximity": (
             {
                 # As close to center of clinical (treatment room) space as possible
                 "target": SPACE_GROUP.CLINICAL,
                 "maxDistanceInches": None,
                 "optimizationWeight": 1.0,
-            }
-        ],
+            },
+        ),
 
-        "separation": [
+        "separation": (
             {
                 "target": SPACE_ID.CROSSOVER_HALLWAY,
                 "hard": True,
@@ -1027,29 +1100,29 @@ MOBILE_TECH_RULES = {
                 "target": SPACE_GROUP.PATIENT_FACING,
                 "hard": True,
             },
-        ],
+        ),
     },
 
     "visibility": {
-        "mustBeHiddenFrom": [
+        "mustBeHiddenFrom": (
             {
                 # Should not be visible from patient-facing zones
                 "target": SPACE_GROUP.PATIENT_FACING,
                 "hard": False,
-            }
-        ],
-        "mustBeVisibleFrom": [],
+            },
+        ),
+        "mustBeVisibleFrom": (),
     },
 
     "circulation": {
         # Functions as a clinical support element along circulation
         "role": CIRCULATION_ROLE_ENUM.CONNECTOR,
-        "mustConnect": [
+        "mustConnect": (
             SPACE_ID.CLINICAL_CORRIDOR,
-        ],
-        "mustNotTerminateInto": [
+        ),
+        "mustNotTerminateInto": (
             SPACE_GROUP.PUBLIC,
-        ],
+        ),
     },
 
     "optimization": {
@@ -1062,11 +1135,11 @@ MOBILE_TECH_RULES = {
             "sameCategoryBonus": 0.6,
         },
     },
-}
+})
 
 # Doctors On Deck
 
-DOCTORS_ON_DECK_RULES = {
+DOCTORS_ON_DECK_RULES = _freeze({
     "identity": {
         "roomType": SPACE_ID.DOCTORS_ON_DECK,
         "category": ROOM_CATEGORY.CLINICAL,
@@ -1077,7 +1150,7 @@ DOCTORS_ON_DECK_RULES = {
         # Conditionally required
         "trigger": TRIGGER_ENUM.DERIVED,
 
-        "countRules": [
+        "countRules": (
             {
                 # Always required if >5 treatment rooms AND no doctor office on clinical floor
                 "driver": COUNT_DRIVER_ENUM.TREATMENT_ROOMS,
@@ -1106,13 +1179,13 @@ DOCTORS_ON_DECK_RULES = {
                 "max": None,
                 "condition": CONDITION_ENUM.PER_N_UNITS,  # TODO: multi-nook distribution logic
             },
-        ],
+        ),
     },
 
     "geometry": {
         "shape": SHAPE_ENUM.RECTANGULAR,
 
-        "dimensionModels": [
+        "dimensionModels": (
             {
                 "label": "single_doctor_nook",
                 "treatmentRoomsMin": 3,
@@ -1143,44 +1216,23 @@ DOCTORS_ON_DECK_RULES = {
                 "longAxisVariable": False,
                 "longAxisIncrementPerDoorInches": None,
             },
-        ],
+        ),
 
         "fallbackStrategy": GEOMETRY_FALLBACK_ENUM.NEAREST_MATCH,
     },
 
-    "orientation": {
+    "orientation": _all_layouts({
         # All layouts: positioned along clinical hallway
-        LAYOUT_ENUM.NARROW: {
-            "allowed": True,
-            "longAxisRelation": AXIS_RELATION_ENUM.PARALLEL,
-            "placementHint": PLACEMENT_ENUM.ALONG,
-            "connectsCorridors": True,
-        },
-        LAYOUT_ENUM.THREE_LAYER_CAKE: {
-            "allowed": True,
-            "longAxisRelation": AXIS_RELATION_ENUM.PARALLEL,
-            "placementHint": PLACEMENT_ENUM.ALONG,
-            "connectsCorridors": True,
-        },
-        LAYOUT_ENUM.H_LAYOUT: {
-            "allowed": True,
-            "longAxisRelation": AXIS_RELATION_ENUM.PARALLEL,
-            "placementHint": PLACEMENT_ENUM.ALONG,
-            "connectsCorridors": True,
-        },
-    },
+        "allowed": True,
+        "longAxisRelation": AXIS_RELATION_ENUM.PARALLEL,
+        "placementHint": PLACEMENT_ENUM.ALONG,
+        "connectsCorridors": True,
+    }),
 
     "access": {
-        "entryCountRules": [
-            {
-                "treatmentRoomsMin": None,
-                "treatmentRoomsMax": None,
-                "minEntries": 1,
-                "maxEntries": 1,
-            }
-        ],
+        "entryCountRules": _ONE_ENTRY,
 
-        "entryConstraints": [
+        "entryConstraints": (
             {
                 # Must enter directly from clinical hallway
                 "kind": ENTRY_RULE_ENUM.ENTRY_FROM,
@@ -1209,26 +1261,23 @@ DOCTORS_ON_DECK_RULES = {
                 "distanceMaxInches": 36,
                 "hard": False,
             },
-        ],
+        ),
 
-        "ada": {
-            "minClearWidthInches": 34,
-            "requiredEntries": 1,
-            # TODO: push/pull clearances, turning circle semantics
-        },
+        # TODO: push/pull clearances, turning circle semantics
+        "ada": _ADA_STANDARD,
     },
 
     "adjacency": {
-        "direct": [
+        "direct": (
             {
                 # Must connect directly to clinical hallway
                 "target": SPACE_ID.CLINICAL_CORRIDOR,
                 "condition": None,
                 "hard": True,
-            }
-        ],
+            },
+        ),
 
-        "preferredProximity": [
+        "preferredProximity": (
             {
                 # Ideally central to treatment rooms
                 "target": SPACE_GROUP.CLINICAL,
@@ -1241,50 +1290,41 @@ DOCTORS_ON_DECK_RULES = {
                 "maxDistanceInches": None,
                 "optimizationWeight": 0.6,
             },
-        ],
+        ),
+
+        "separation": _targets(
+            (SPACE_ID.PATIENT_LOUNGE, True),
+            (SPACE_GROUP.PATIENT_FACING, True),
+            (SPACE_ID.STAFF_LOUNGE, True),
+        ),
+    },
 
-        "separation": [
+    "visibility": {
+        "mustBeVisibleFrom": (
             {
-                "target": SPACE_ID.PATIENT_LOUNGE,
-                "hard": True,
+                # Visibility into clinical hallway for quick response
+                "target": SPACE_ID.CLINICAL_CORRIDOR,
+                "hard": False,
             },
-            {
-                "target": SPACE_GROUP.PATIENT_FACING,
-                "hard": True,
-            },
-            {
-                "target": SPACE_ID.STAFF_LOUNGE,
-                "hard": True,
-            },
-        ],
-    },
-
-    "visibility": {
-        "mustBeVisibleFrom": [
-            {
-                # Visibility into clinical hallway for quick response
-                "target": SPACE_ID.CLINICAL_CORRIDOR,
-                "hard": False,
-            }
-        ],
-        "mustBeHiddenFrom": [
+        ),
+        "mustBeHiddenFrom": (
             {
                 # Should not be visible from patient-facing zones
                 "target": SPACE_GROUP.PATIENT_FACING,
                 "hard": False,
-            }
-        ],
+            },
+        ),
     },
 
     "circulation": {
         # Active oversight node along circulation spine
         "role": CIRCULATION_ROLE_ENUM.CONNECTOR,
-        "mustConnect": [
+        "mustConnect": (
             SPACE_ID.CLINICAL_CORRIDOR,
-        ],
-        "mustNotTerminateInto": [
+        ),
+        "mustNotTerminateInto": (
             SPACE_GROUP.PUBLIC,
-        ],
+        ),
     },
 
     "optimization": {
@@ -1297,11 +1337,11 @@ DOCTORS_ON_DECK_RULES = {
             "sameCategoryBonus": 0.7,
         },
     },
-}
+})
 
 # Doctor Office
 
-DOCTOR_OFFICE_RULES = {
+DOCTOR_OFFICE_RULES = _freeze({
     "identity": {
         "roomType": SPACE_ID.DOCTOR_OFFICE,
         "category": ROOM_CATEGORY.CLINICAL,
@@ -1312,7 +1352,7 @@ DOCTOR_OFFICE_RULES = {
         # Exists only when explicitly requested
         "trigger": TRIGGER_ENUM.USER_INPUT,
 
-        "countRules": [
+        "countRules": (
             {
                 # 1 private office for 1–5 treatment rooms if no Doctor’s Nook
                 "driver": COUNT_DRIVER_ENUM.TREATMENT_ROOMS,
@@ -1334,13 +1374,13 @@ DOCTOR_OFFICE_RULES = {
                 "max": None,
                 "condition": CONDITION_ENUM.IF_THRESHOLD,
             },
-        ],
+        ),
     },
 
     "geometry": {
         "shape": SHAPE_ENUM.RECTANGULAR,
 
-        "dimensionModels": [
+        "dimensionModels": (
             {
                 "label": "single_doctor_office",
                 "treatmentRoomsMin": 1,
@@ -1384,7 +1424,7 @@ DOCTOR_OFFICE_RULES = {
             #     "longAxisIncrementPerDoorInches": None,
             #     # TODO: represent attachment relationship explicitly
             # },
-        ],
+        ),
 
         "fallbackStrategy": GEOMETRY_FALLBACK_ENUM.NEAREST_MATCH,
     },
@@ -1411,16 +1451,9 @@ DOCTOR_OFFICE_RULES = {
     },
 
     "access": {
-        "entryCountRules": [
-            {
-                "treatmentRoomsMin": None,
-                "treatmentRoomsMax": None,
-                "minEntries": 1,
-                "maxEntries": 1,
-            }
-        ],
+        "entryCountRules": _ONE_ENTRY,
 
-        "entryConstraints": [
+        "entryConstraints": (
             {
                 # Default: entry from clinical hallway
                 "kind": ENTRY_RULE_ENUM.ENTRY_FROM,
@@ -1456,16 +1489,13 @@ DOCTOR_OFFICE_RULES = {
                 "distanceMaxInches": 36,
                 "hard": False,
             },
-        ],
+        ),
 
-        "ada": {
-            "minClearWidthInches": 34,
-            "requiredEntries": 1,
-        },
+        "ada": _ADA_STANDARD,
     },
 
     "adjacency": {
-        "direct": [
+        "direct": (
             {
                 # Clinical hallway OR second crossover hallway
                 "target": SPACE_ID.CLINICAL_CORRIDOR,
@@ -1483,9 +1513,9 @@ DOCTOR_OFFICE_RULES = {
                 "condition": CONDITION_ENUM.IF_PRESENT,
                 "hard": False,
             },
-        ],
+        ),
 
-        "preferredProximity": [
+        "preferredProximity": (
             {
                 # Near treatment rooms
                 "target": SPACE_GROUP.CLINICAL,
@@ -1498,38 +1528,29 @@ DOCTOR_OFFICE_RULES = {
                 "maxDistanceInches": None,
                 "optimizationWeight": 0.6,
             },
-        ],
+        ),
 
-        "separation": [
-            {
-                "target": SPACE_ID.STAFF_LOUNGE,
-                "hard": True,
-            },
-            {
-                "target": SPACE_ID.PATIENT_LOUNGE,
-                "hard": True,
-            },
-            {
-                "target": SPACE_GROUP.PATIENT_FACING,
-                "hard": True,
-            },
-        ],
+        "separation": _targets(
+            (SPACE_ID.STAFF_LOUNGE, True),
+            (SPACE_ID.PATIENT_LOUNGE, True),
+            (SPACE_GROUP.PATIENT_FACING, True),
+        ),
     },
 
     "visibility": {
         # No explicit visibility requirements
-        "mustBeHiddenFrom": [],
-        "mustBeVisibleFrom": [],
+        "mustBeHiddenFrom": (),
+        "mustBeVisibleFrom": (),
     },
 
     "circulation": {
         "role": CIRCULATION_ROLE_ENUM.DESTINATION,
-        "mustConnect": [
+        "mustConnect": (
             SPACE_ID.CLINICAL_CORRIDOR,
-        ],
-        "mustNotTerminateInto": [
+        ),
+        "mustNotTerminateInto": (
             SPACE_GROUP.PUBLIC,
-        ],
+        ),
     },
 
     "optimization": {
@@ -1542,11 +1563,11 @@ DOCTOR_OFFICE_RULES = {
             "sameCategoryBonus": 0.5,
         },
     },
-}
+})
 
 # Doctor Private Restroom
 
-DOCTOR_PRIVATE_RESTROOM_RULES = {
+DOCTOR_PRIVATE_RESTROOM_RULES = _freeze({
     "identity": {
         "roomType": SPACE_ID.DOCTOR_PRIVATE_RESTROOM,
         "category": ROOM_CATEGORY.PRIVATE,
@@ -1556,19 +1577,19 @@ DOCTOR_PRIVATE_RESTROOM_RULES = {
     "existence": {
         # Only exists if doctor office exists
         "trigger": TRIGGER_ENUM.DERIVED,
-        "countRules": [
+        "countRules": (
             {
                 "driver": COUNT_DRIVER_ENUM.FIXED,
                 "min": 0,
                 "max": 1,
                 "condition": CONDITION_ENUM.IF_PRESENT,  # present only if doctor office exists
             },
-        ],
+        ),
     },
 
     "geometry": {
         "shape": SHAPE_ENUM.RECTANGULAR,
-        "dimensionModels": [
+        "dimensionModels": (
             {
                 "label": "default_private_restroom",
                 "treatmentRoomsMin": None,
@@ -1579,42 +1600,21 @@ DOCTOR_PRIVATE_RESTROOM_RULES = {
                 "longAxisVariable": False,
                 "longAxisIncrementPerDoorInches": None,
             },
-        ],
+        ),
         "fallbackStrategy": GEOMETRY_FALLBACK_ENUM.MINIMUM,
     },
 
-    "orientation": {
-        LAYOUT_ENUM.NARROW: {
-            "allowed": True,
-            "longAxisRelation": AXIS_RELATION_ENUM.PARALLEL,  # TODO: may vary depending on office
-            "placementHint": PLACEMENT_ENUM.BETWEEN,          # attached to doctor office
-            "connectsCorridors": False,
-        },
-        LAYOUT_ENUM.THREE_LAYER_CAKE: {
-            "allowed": True,
-            "longAxisRelation": AXIS_RELATION_ENUM.PARALLEL,
-            "placementHint": PLACEMENT_ENUM.BETWEEN,
-            "connectsCorridors": False,
-        },
-        LAYOUT_ENUM.H_LAYOUT: {
-            "allowed": True,
-            "longAxisRelation": AXIS_RELATION_ENUM.PARALLEL,
-            "placementHint": PLACEMENT_ENUM.BETWEEN,
-            "connectsCorridors": False,
-        },
-    },
+    "orientation": _all_layouts({
+        "allowed": True,
+        "longAxisRelation": AXIS_RELATION_ENUM.PARALLEL,  # TODO: may vary depending on office
+        "placementHint": PLACEMENT_ENUM.BETWEEN,          # attached to doctor office
+        "connectsCorridors": False,
+    }),
 
     "access": {
-        "entryCountRules": [
-            {
-                "treatmentRoomsMin": None,
-                "treatmentRoomsMax": None,
-                "minEntries": 1,
-                "maxEntries": 1,
-            }
-        ],
+        "entryCountRules": _ONE_ENTRY,
 
-        "entryConstraints": [
+        "entryConstraints": (
             {
                 # Only accessible from doctor office
                 "kind": ENTRY_RULE_ENUM.ENTRY_FROM,
@@ -1629,64 +1629,48 @@ DOCTOR_PRIVATE_RESTROOM_RULES = {
                 "distanceMaxInches": None,
                 "hard": True,
             },
-        ],
+        ),
 
-        "ada": {
-            "minClearWidthInches": 34,
-            "requiredEntries": 1,
-        },
+        "ada": _ADA_STANDARD,
     },
 
     "adjacency": {
-        "direct": [
-            {
-                "target": SPACE_ID.DOCTOR_OFFICE,
-                "condition": CONDITION_ENUM.IF_PRESENT,
-                "hard": True,
-            },
-        ],
+        "direct": _adjacent(
+            (SPACE_ID.DOCTOR_OFFICE, CONDITION_ENUM.IF_PRESENT, True),
+        ),
 
-        "preferredProximity": [
+        "preferredProximity": (
             {
                 "target": SPACE_ID.DOCTOR_OFFICE,
                 "maxDistanceInches": 0,
                 "optimizationWeight": 1.0,
             },
-        ],
+        ),
 
-        "separation": [
-            {
-                "target": SPACE_GROUP.PUBLIC,
-                "hard": True,
-            },
-            {
-                "target": SPACE_ID.PATIENT_LOUNGE,
-                "hard": True,
-            },
-        ],
+        "separation": _targets(
+            (SPACE_GROUP.PUBLIC, True),
+            (SPACE_ID.PATIENT_LOUNGE, True),
+        ),
     },
 
     "visibility": {
         # Should not be visible from patient-facing areas
-        "mustBeHiddenFrom": [
-            {
-                "target": SPACE_GROUP.PATIENT_FACING,
-                "hard": True,
-            },
-        ],
-        "mustBeVisibleFrom": [
+        "mustBeHiddenFrom": _targets(
+            (SPACE_GROUP.PATIENT_FACING, True),
+        ),
+        "mustBeVisibleFrom": (
             # Optional: visible from doctor office
             {
                 "target": SPACE_ID.DOCTOR_OFFICE,
                 "hard": False,
-            }
-        ],
+            },
+        ),
     },
 
     "circulation": {
         "role": CIRCULATION_ROLE_ENUM.DESTINATION,
-        "mustConnect": [SPACE_ID.DOCTOR_OFFICE],
-        "mustNotTerminateInto": [SPACE_GROUP.PUBLIC, SPACE_GROUP.CLINICAL],
+        "mustConnect": (SPACE_ID.DOCTOR_OFFICE,),
+        "mustNotTerminateInto": (SPACE_GROUP.PUBLIC, SPACE_GROUP.CLINICAL),
     },
 
     "optimization": {
@@ -1698,11 +1682,11 @@ DOCTOR_PRIVATE_RESTROOM_RULES = {
             "sameCategoryBonus": 0.8,
         },
     },
-}
+})
 
 # Office Manager
 
-OFFICE_MANAGER_RULES = {
+OFFICE_MANAGER_RULES = _freeze({
     "identity": {
         "roomType": SPACE_ID.OFFICE_MANAGER,
         "category": ROOM_CATEGORY.PRIVATE,
@@ -1711,19 +1695,19 @@ OFFICE_MANAGER_RULES = {
 
     "existence": {
         "trigger": TRIGGER_ENUM.ALWAYS,
-        "countRules": [
+        "countRules": (
             {
                 "driver": COUNT_DRIVER_ENUM.FIXED,
                 "min": 1,
                 "max": 1,
                 "condition": CONDITION_ENUM.NONE,
             },
-        ],
+        ),
     },
 
     "geometry": {
         "shape": SHAPE_ENUM.RECTANGULAR,
-        "dimensionModels": [
+        "dimensionModels": (
             {
                 "label": "min_office_manager",
                 "treatmentRoomsMin": None,
@@ -1744,41 +1728,20 @@ OFFICE_MANAGER_RULES = {
                 "longAxisVariable": False,
                 "longAxisIncrementPerDoorInches": None,
             },
-        ],
+        ),
         "fallbackStrategy": GEOMETRY_FALLBACK_ENUM.NEAREST_MATCH,
     },
 
-    "orientation": {
-        LAYOUT_ENUM.NARROW: {
-            "allowed": True,
-            "longAxisRelation": AXIS_RELATION_ENUM.NONE,
-            "placementHint": PLACEMENT_ENUM.BACK,
-            "connectsCorridors": False,
-        },
-        LAYOUT_ENUM.THREE_LAYER_CAKE: {
-            "allowed": True,
-            "longAxisRelation": AXIS_RELATION_ENUM.NONE,
-            "placementHint": PLACEMENT_ENUM.BACK,
-            "connectsCorridors": False,
-        },
-        LAYOUT_ENUM.H_LAYOUT: {
-            "allowed": True,
-            "longAxisRelation": AXIS_RELATION_ENUM.NONE,
-            "placementHint": PLACEMENT_ENUM.BACK,
-            "connectsCorridors": False,
-        },
-    },
+    "orientation": _all_layouts({
+        "allowed": True,
+        "longAxisRelation": AXIS_RELATION_ENUM.NONE,
+        "placementHint": PLACEMENT_ENUM.BACK,
+        "connectsCorridors": False,
+    }),
 
     "access": {
-        "entryCountRules": [
-            {
-                "treatmentRoomsMin": None,
-                "treatmentRoomsMax": None,
-                "minEntries": 1,
-                "maxEntries": 1,
-            }
-        ],
-        "entryConstraints": [
+        "entryCountRules": _ONE_ENTRY,
+        "entryConstraints": (
             {
                 "kind": ENTRY_RULE_ENUM.ENTRY_NEAR,
                 "target": SPACE_GROUP.PUBLIC,
@@ -1797,16 +1760,13 @@ OFFICE_MANAGER_RULES = {
                 "distanceMaxInches": None,
                 "hard": True,
             },
-        ],
-        "ada": {
-            "minClearWidthInches": 34,
-            "requiredEntries": 1,
-        },
+        ),
+        "ada": _ADA_STANDARD,
     },
 
     "adjacency": {
-        "direct": [],  # None required
-        "preferredProximity": [
+        "direct": (),  # None required
+        "preferredProximity": (
             {
                 "target": SPACE_ID.CHECK_IN,
                 "maxDistanceInches": None,  # TODO: exact preferred distance
@@ -1817,29 +1777,23 @@ OFFICE_MANAGER_RULES = {
                 "maxDistanceInches": None,
                 "optimizationWeight": 0.8,
             },
-        ],
-        "separation": [
-            {
-                "target": SPACE_GROUP.CLINICAL,
-                "hard": True,
-            },
-        ],
+        ),
+        "separation": _targets(
+            (SPACE_GROUP.CLINICAL, True),
+        ),
     },
 
     "visibility": {
-        "mustBeHiddenFrom": [
-            {
-                "target": SPACE_GROUP.PATIENT_FACING,
-                "hard": True,
-            },
-        ],
-        "mustBeVisibleFrom": [],
+        "mustBeHiddenFrom": _targets(
+            (SPACE_GROUP.PATIENT_FACING, True),
+        ),
+        "mustBeVisibleFrom": (),
     },
 
     "circulation": {
         "role": CIRCULATION_ROLE_ENUM.DESTINATION,
-        "mustConnect": [SPACE_GROUP.PUBLIC],
-        "mustNotTerminateInto": [SPACE_GROUP.CLINICAL],
+        "mustConnect": (SPACE_GROUP.PUBLIC,),
+        "mustNotTerminateInto": (SPACE_GROUP.CLINICAL,),
     },
 
     "optimization": {
@@ -1851,11 +1805,11 @@ OFFICE_MANAGER_RULES = {
             "sameCategoryBonus": 0.8,
         },
     },
-}
+})
 
 # Business Office
 
-BUSINESS_OFFICE_RULES = {
+BUSINESS_OFFICE_RULES = _freeze({
     "identity": {
         "roomType": SPACE_ID.BUSINESS_OFFICE,
         "category": ROOM_CATEGORY.PRIVATE,
@@ -1864,19 +1818,19 @@ BUSINESS_OFFICE_RULES = {
 
     "existence": {
         "trigger": TRIGGER_ENUM.DERIVED,  # Only exists in practices with more than 4 treatment rooms
-        "countRules": [
+        "countRules": (
             {
                 "driver": COUNT_DRIVER_ENUM.TREATMENT_ROOMS,
                 "min": 1,
                 "max": 1,
                 "condition": CONDITION_ENUM.IF_THRESHOLD,  # TODO: specify exact threshold for inclusion
             },
-        ],
+        ),
     },
 
     "geometry": {
         "shape": SHAPE_ENUM.RECTANGULAR,
-        "dimensionModels": [
+        "dimensionModels": (
             {
                 "label": "small",
                 "treatmentRoomsMin": 0,
@@ -1907,33 +1861,19 @@ BUSINESS_OFFICE_RULES = {
                 "longAxisVariable": False,
                 "longAxisIncrementPerDoorInches": None,
             },
-        ],
+        ),
         "fallbackStrategy": GEOMETRY_FALLBACK_ENUM.NEAREST_MATCH,
     },
 
-    "orientation": {
-        LAYOUT_ENUM.NARROW: {
-            "allowed": True,
-            "longAxisRelation": AXIS_RELATION_ENUM.NONE,
-            "placementHint": PLACEMENT_ENUM.BACK,
-            "connectsCorridors": False,
-        },
-        LAYOUT_ENUM.THREE_LAYER_CAKE: {
-            "allowed": True,
-            "longAxisRelation": AXIS_RELATION_ENUM.NONE,
-            "placementHint": PLACEMENT_ENUM.BACK,
-            "connectsCorridors": False,
-        },
-        LAYOUT_ENUM.H_LAYOUT: {
-            "allowed": True,
-            "longAxisRelation": AXIS_RELATION_ENUM.NONE,
-            "placementHint": PLACEMENT_ENUM.BACK,
-            "connectsCorridors": False,
-        },
-    },
+    "orientation": _all_layouts({
+        "allowed": True,
+        "longAxisRelation": AXIS_RELATION_ENUM.NONE,
+        "placementHint": PLACEMENT_ENUM.BACK,
+        "connectsCorridors": False,
+    }),
 
     "access": {
-        "entryCountRules": [
+        "entryCountRules": (
             {
                 "treatmentRoomsMin": 0,
                 "treatmentRoomsMax": 6,
@@ -1946,8 +1886,8 @@ BUSINESS_OFFICE_RULES = {
                 "minEntries": 1,
                 "maxEntries": 2,
             },
-        ],
-        "entryConstraints": [
+        ),
+        "entryConstraints": (
             {
                 "kind": ENTRY_RULE_ENUM.ENTRY_NEAR,
                 "target": SPACE_ID.CHECK_IN,
@@ -1966,69 +1906,42 @@ BUSINESS_OFFICE_RULES = {
                 "distanceMaxInches": 36,
                 "hard": True,
             },
-        ],
-        "ada": {
-            "minClearWidthInches": 34,
-            "requiredEntries": 1,
-        },
+        ),
+        "ada": _ADA_STANDARD,
     },
 
     "adjacency": {
-        "direct": [
-            {
-                "target": SPACE_ID.CHECK_IN,
-                "condition": CONDITION_ENUM.NONE,
-                "hard": False,
-            },
-            {
-                "target": SPACE_ID.CHECK_IN,
-                "condition": CONDITION_ENUM.NONE,
-                "hard": False,
-            },
-            {
-                "target": SPACE_ID.CHECK_OUT,
-                "condition": CONDITION_ENUM.NONE,
-                "hard": False,
-            },
-        ],
-        "preferredProximity": [
+        "direct": _adjacent(
+            (SPACE_ID.CHECK_IN, CONDITION_ENUM.NONE, False),
+            (SPACE_ID.CHECK_IN, CONDITION_ENUM.NONE, False),
+            (SPACE_ID.CHECK_OUT, CONDITION_ENUM.NONE, False),
+        ),
+        "preferredProximity": (
             {
                 "target": SPACE_ID.OFFICE_MANAGER,
                 "maxDistanceInches": None,  # TODO: exact preferred distance
                 "optimizationWeight": 1.0,
             },
-        ],
-        "separation": [
-            {
-                "target": SPACE_GROUP.CLINICAL,
-                "hard": True,
-            },
-            {
-                "target": SPACE_ID.PATIENT_RESTROOM,
-                "hard": True,
-            },
-        ],
+        ),
+        "separation": _targets(
+            (SPACE_GROUP.CLINICAL, True),
+            (SPACE_ID.PATIENT_RESTROOM, True),
+        ),
     },
 
     "visibility": {
-        "mustBeHiddenFrom": [
-            {
-                "target": SPACE_GROUP.PATIENT_FACING,
-                "hard": True,
-            },
-        ],
-        "mustBeVisibleFrom": [
-            {
-                "target": SPACE_ID.CHECK_IN,
-                "hard": False,
-            },
-        ],
+        "mustBeHiddenFrom": _targets(
+            (SPACE_GROUP.PATIENT_FACING, True),
+        ),
+        "mustBeVisibleFrom": _targets(
+            (SPACE_ID.CHECK_IN, False),
+        ),
     },
 
     "circulation": {
         "role": CIRCULATION_ROLE_ENUM.DESTINATION,
-        "mustConnect": [SPACE_ID.CHECK_IN, SPACE_ID.CHECK_IN],
-        "mustNotTerminateInto": [SPACE_GROUP.CLINICAL],
+        "mustConnect": (SPACE_ID.CHECK_IN, SPACE_ID.CHECK_IN),
+        "mustNotTerminateInto": (SPACE_GROUP.CLINICAL,),
     },
 
     "optimization": {
@@ -2040,11 +1953,11 @@ BUSINESS_OFFICE_RULES = {
             "sameCategoryBonus": 0.8,
         },
     },
-}
+})
 
 # Alt Business Office
 
-ALT_BUSINESS_OFFICE_RULES = {
+ALT_BUSINESS_OFFICE_RULES = _freeze({
     "identity": {
         "roomType": SPACE_ID.ALT_BUSINESS_OFFICE,
         "category": ROOM_CATEGORY.PRIVATE,
@@ -2056,7 +1969,7 @@ ALT_BUSINESS_OFFICE_RULES = {
 
     "existence": {
         "trigger": TRIGGER_ENUM.DERIVED,
-        "countRules": [
+        "countRules": (
             {
                 "driver": COUNT_DRIVER_ENUM.TREATMENT_ROOMS,
                 "min": 1,
@@ -2064,7 +1977,7 @@ ALT_BUSINESS_OFFICE_RULES = {
                 "condition": CONDITION_ENUM.IF_GREATER_THAN,
                 "threshold": 4,
             },
-        ],
+        ),
     },
 
     "capacity": {#this block isn't part of schema but relevant to this room so idk
@@ -2082,7 +1995,7 @@ ALT_BUSINESS_OFFICE_RULES = {
 
     "geometry": {
         "shape": SHAPE_ENUM.RECTANGULAR,
-        "dimensionModels": [
+        "dimensionModels": (
             {
                 "label": "small",
                 "treatmentRoomsMin": 0,
@@ -2114,7 +2027,7 @@ ALT_BUSINESS_OFFICE_RULES = {
                 "aspectRatioRange": (1.5, 4.0),
                 "notes": "Expand into dedicated business area or command center",
             },
-        ],
+        ),
         "fallbackStrategy": GEOMETRY_FALLBACK_ENUM.AREA_FIRST,
     },
 
@@ -2138,7 +2051,7 @@ ALT_BUSINESS_OFFICE_RULES = {
     },
 
     "access": {
-        "entryCountRules": [
+        "entryCountRules": (
             {
                 "workstationsMin": 2,
                 "workstationsMax": 3,
@@ -2151,8 +2064,8 @@ ALT_BUSINESS_OFFICE_RULES = {
                 "minEntries": 1,
                 "maxEntries": 2,
             },
-        ],
-        "entryConstraints": [
+        ),
+        "entryConstraints": (
             {
                 "kind": ENTRY_RULE_ENUM.ENTRY_NEAR,
                 "target": SPACE_GROUP.FRONT_OF_HOUSE,
@@ -2175,15 +2088,12 @@ ALT_BUSINESS_OFFICE_RULES = {
                 "distanceMaxInches": 36,
                 "hard": True,
             },
-        ],
-        "ada": {
-            "minClearWidthInches": 34,
-            "requiredEntries": 1,
-        },
+        ),
+        "ada": _ADA_STANDARD,
     },
 
     "adjacency": {
-        "direct": [
+        "direct": (
             {
                 "target": SPACE_ID.CHECK_IN,
                 "hard": False,
@@ -2196,48 +2106,33 @@ ALT_BUSINESS_OFFICE_RULES = {
                 "target": SPACE_ID.CHECK_OUT,
                 "hard": False,
             },
-        ],
-        "preferredProximity": [
+        ),
+        "preferredProximity": (
             {
                 "target": SPACE_ID.OFFICE_MANAGER,
                 "optimizationWeight": 1.0,
             },
-        ],
-        "separation": [
-            {
-                "target": SPACE_GROUP.CLINICAL,
-                "hard": True,
-            },
-            {
-                "target": SPACE_ID.PATIENT_RESTROOM,
-                "hard": True,
-            },
-            {
-                "target": SPACE_ID.STERILIZATION,
-                "hard": True,
-            },
-        ],
+        ),
+        "separation": _targets(
+            (SPACE_GROUP.CLINICAL, True),
+            (SPACE_ID.PATIENT_RESTROOM, True),
+            (SPACE_ID.STERILIZATION, True),
+        ),
     },
 
     "visibility": {
-        "mustBeVisibleFrom": [
-            {
-                "target": SPACE_ID.CHECK_IN,
-                "hard": False,
-            },
-        ],
-        "mustBeHiddenFrom": [
-            {
-                "target": SPACE_GROUP.PATIENT_FACING,
-                "hard": True,
-            },
-        ],
+        "mustBeVisibleFrom": _targets(
+            (SPACE_ID.CHECK_IN, False),
+        ),
+        "mustBeHiddenFrom": _targets(
+            (SPACE_GROUP.PATIENT_FACING, True),
+        ),
     },
 
     "circulation": {
         "role": CIRCULATION_ROLE_ENUM.DESTINATION,
-        "mustConnect": [SPACE_GROUP.FRONT_OF_HOUSE],
-        "mustNotTerminateInto": [SPACE_GROUP.CLINICAL],
+        "mustConnect": (SPACE_GROUP.FRONT_OF_HOUSE,),
+        "mustNotTerminateInto": (SPACE_GROUP.CLINICAL,),
     },
 
     "optimization": {
@@ -2249,11 +2144,11 @@ ALT_BUSINESS_OFFICE_RULES = {
             "weight": 0.9,
         },
     },
-}
+})
 
 # Staff Lounge
 
-STAFF_LOUNGE_RULES = {
+STAFF_LOUNGE_RULES = _freeze({
     "identity": {
         "roomType": SPACE_ID.STAFF_LOUNGE,
         "category": ROOM_CATEGORY.PRIVATE,
@@ -2265,14 +2160,14 @@ STAFF_LOUNGE_RULES = {
 
     "existence": {
         "trigger": TRIGGER_ENUM.ALWAYS,
-        "countRules": [
+        "countRules": (
             {
                 "driver": COUNT_DRIVER_ENUM.FIXED,
                 "min": 1,
                 "max": 1,
                 "condition": CONDITION_ENUM.NONE,
-            }
-        ],
+            },
+        ),
     },
 
     "capacity": { #again, geometry for room derived from capacity
@@ -2307,14 +2202,14 @@ STAFF_LOUNGE_RULES = {
 
     "geometry": {
         "shape": SHAPE_ENUM.RECTANGULAR,
-        "dimensionModels": [
+        "dimensionModels": (
             {
                 "label": "capacity_driven",
                 "derivation": "seating + kitchenette + lockers",
                 "aspectRatioRange": (1.2, 3.5),
                 # TODO: define preferred min/max depths for daylight walls
-            }
-        ],
+            },
+        ),
         "fallbackStrategy": GEOMETRY_FALLBACK_ENUM.MINIMUM,
     },
 
@@ -2339,7 +2234,7 @@ STAFF_LOUNGE_RULES = {
     },
 
     "access": {
-        "entryCountRules": [
+        "entryCountRules": (
             {
                 "seatsMin": 0,
                 "seatsMax": 10,
@@ -2352,8 +2247,8 @@ STAFF_LOUNGE_RULES = {
                 "minEntries": 1,
                 "maxEntries": 2,
             },
-        ],
-        "entryConstraints": [
+        ),
+        "entryConstraints": (
             {
                 "kind": ENTRY_RULE_ENUM.ENTRY_FROM,
                 "target": SPACE_GROUP.STAFF,
@@ -2364,16 +2259,13 @@ STAFF_LOUNGE_RULES = {
                 "target": SPACE_ID.PATIENT_LOUNGE,
                 "hard": True,
             },
-        ],
-        "ada": {
-            "minClearWidthInches": 34,
-            "requiredEntries": 1,
-        },
+        ),
+        "ada": _ADA_STANDARD,
     },
 
     "adjacency": {
-        "direct": [],
-        "preferredProximity": [
+        "direct": (),
+        "preferredProximity": (
             {
                 "target": SPACE_ID.STAFF_ENTRY,
                 "optimizationWeight": 0.8,
@@ -2382,33 +2274,24 @@ STAFF_LOUNGE_RULES = {
                 "target": SPACE_ID.STAFF_RESTROOM,
                 "optimizationWeight": 0.9,
             },
-        ],
-        "separation": [
-            {
-                "target": SPACE_ID.PATIENT_LOUNGE,
-                "hard": True,
-            },
-            {
-                "target": SPACE_ID.CHECK_IN,
-                "hard": True,
-            },
-        ],
+        ),
+        "separation": _targets(
+            (SPACE_ID.PATIENT_LOUNGE, True),
+            (SPACE_ID.CHECK_IN, True),
+        ),
     },
 
     "visibility": {
-        "mustBeHiddenFrom": [
-            {
-                "target": SPACE_GROUP.PATIENT_FACING,
-                "hard": True,
-            }
-        ],
-        "mustBeVisibleFrom": [],
+        "mustBeHiddenFrom": _targets(
+            (SPACE_GROUP.PATIENT_FACING, True),
+        ),
+        "mustBeVisibleFrom": (),
     },
 
     "circulation": {
         "role": CIRCULATION_ROLE_ENUM.DESTINATION,
-        "mustConnect": [SPACE_GROUP.STAFF],
-        "mustNotTerminateInto": [SPACE_GROUP.PATIENT_FACING],
+        "mustConnect": (SPACE_GROUP.STAFF,),
+        "mustNotTerminateInto": (SPACE_GROUP.PATIENT_FACING,),
     },
 
     "optimization": {
@@ -2420,11 +2303,11 @@ STAFF_LOUNGE_RULES = {
             "weight": 0.8,
         },
     },
-}
+})
 
 # Patient Lounge
 
-PATIENT_LOUNGE_RULES = {
+PATIENT_LOUNGE_RULES = _freeze({
     "identity": {
         "roomType": SPACE_ID.PATIENT_LOUNGE,
         "category": ROOM_CATEGORY.PUBLIC,
@@ -2436,14 +2319,14 @@ PATIENT_LOUNGE_RULES = {
 
     "existence": {
         "trigger": TRIGGER_ENUM.ALWAYS,
-        "countRules": [
+        "countRules": (
             {
                 "driver": COUNT_DRIVER_ENUM.FIXED,
                 "min": 1,
                 "max": 1,
                 "condition": CONDITION_ENUM.NONE,
-            }
-        ],
+            },
+        ),
     },
 
     "capacity": {
@@ -2477,15 +2360,15 @@ PATIENT_LOUNGE_RULES = {
 
     "geometry": {
         "shape": SHAPE_ENUM.RECTANGULAR,
-        "dimensionModels": [
+        "dimensionModels": (
             {
                 "label": "capacity_driven_lounge",
                 "derivation": "seating + refreshment + front_of_house_buffers",
                 "allowsClusteredSeating": True,
                 "aspectRatioRange": (1.1, 3.0),
                 # TODO: define preferred minimum depth for waiting furniture
-            }
-        ],
+            },
+        ),
         "fallbackStrategy": GEOMETRY_FALLBACK_ENUM.MINIMUM,
     },
 
@@ -2510,13 +2393,13 @@ PATIENT_LOUNGE_RULES = {
     },
 
     "access": {
-        "entryCountRules": [
+        "entryCountRules": (
             {
                 "minEntries": 1,
                 "maxEntries": 2,
-            }
-        ],
-        "entryConstraints": [
+            },
+        ),
+        "entryConstraints": (
             {
                 "kind": ENTRY_RULE_ENUM.ENTRY_FROM,
                 "target": SPACE_ID.CHECK_IN,
@@ -2527,72 +2410,47 @@ PATIENT_LOUNGE_RULES = {
                 "target": SPACE_GROUP.CLINICAL,
                 "hard": True,
             },
-        ],
-        "ada": {
-            "minClearWidthInches": 34,
-            "requiredEntries": 1,
-        },
+        ),
+        "ada": _ADA_STANDARD,
     },
 
     "adjacency": {
-        "direct": [
-            {
-                "target": SPACE_ID.CHECK_IN,
-                "condition": CONDITION_ENUM.NONE,
-                "hard": True,
-            }
-        ],
-        "preferredProximity": [
+        "direct": _adjacent(
+            (SPACE_ID.CHECK_IN, CONDITION_ENUM.NONE, True),
+        ),
+        "preferredProximity": (
             {
                 "target": SPACE_ID.PATIENT_RESTROOM,
                 "maxDistanceInches": 240,  # 20 ft
                 "optimizationWeight": 0.9,
-            }
-        ],
-        "separation": [
-            {
-                "target": SPACE_ID.STERILIZATION,
-                "hard": True,
-            },
-            {
-                "target": SPACE_ID.LAB,
-                "hard": True,
-            },
-            {
-                "target": SPACE_ID.MECHANICAL,
-                "hard": True,
-            },
-            {
-                "target": SPACE_ID.STAFF_LOUNGE,
-                "hard": True,
             },
-        ],
+        ),
+        "separation": _targets(
+            (SPACE_ID.STERILIZATION, True),
+            (SPACE_ID.LAB, True),
+            (SPACE_ID.MECHANICAL, True),
+            (SPACE_ID.STAFF_LOUNGE, True),
+        ),
     },
 
     "visibility": {
-        "mustBeVisibleFrom": [
-            {
-                "target": SPACE_ID.CHECK_IN,
-                "hard": True,
-            }
-        ],
-        "mustBeHiddenFrom": [
-            {
-                "target": SPACE_GROUP.CLINICAL,
-                "hard": True,
-            }
-        ],
+        "mustBeVisibleFrom": _targets(
+            (SPACE_ID.CHECK_IN, True),
+        ),
+        "mustBeHiddenFrom": _targets(
+            (SPACE_GROUP.CLINICAL, True),
+        ),
     },
 
     "circulation": {
         "role": CIRCULATION_ROLE_ENUM.DESTINATION,
-        "mustConnect": [
+        "mustConnect": (
             SPACE_ID.CHECK_IN,
             SPACE_GROUP.PUBLIC,
-        ],
-        "mustNotTerminateInto": [
+        ),
+        "mustNotTerminateInto": (
             SPACE_GROUP.CLINICAL,
-        ],
+        ),
     },
 
     "optimization": {
@@ -2609,11 +2467,11 @@ PATIENT_LOUNGE_RULES = {
             # TODO: define zoning semantics (play area, quiet area)
         },
     },
-}
+})
 
 # Crossover Hallway
 
-CROSSOVER_HALLWAY_RULES = {
+CROSSOVER_HALLWAY_RULES = _freeze({
     "identity": {
         "roomType": SPACE_ID.CROSSOVER_HALLWAY,
         "category": ROOM_CATEGORY.CLINICAL,
@@ -2625,20 +2483,20 @@ CROSSOVER_HALLWAY_RULES = {
 
     "existence": {
         "trigger": TRIGGER_ENUM.DERIVED,
-        "countRules": [
+        "countRules": (
             {
                 "driver": COUNT_DRIVER_ENUM.FIXED,
                 "min": 1,
                 "max": None,
                 "condition": CONDITION_ENUM.IF_LAYOUT,  # parallel clinical corridors
                 # TODO: encode explicit condition parameters (parallel corridors present)
-            }
-        ],
+            },
+        ),
     },
 
     "geometry": {
         "shape": SHAPE_ENUM.RECTANGULAR,
-        "dimensionModels": [
+        "dimensionModels": (
             {
                 "label": "standard_crossover",
                 "widthInches": 60,  # 5'-0" minimum
@@ -2646,8 +2504,8 @@ CROSSOVER_HALLWAY_RULES = {
                 "lengthStrategy": "minimize",
                 "highTrafficThresholdTreatmentRooms": 10,
                 # TODO: formalize length minimization heuristic
-            }
-        ],
+            },
+        ),
         "fallbackStrategy": GEOMETRY_FALLBACK_ENUM.MINIMUM,
     },
 
@@ -2666,20 +2524,20 @@ CROSSOVER_HALLWAY_RULES = {
     },
 
     "access": {
-        "entryCountRules": [
+        "entryCountRules": (
             {
                 "minEntries": 2,
                 "maxEntries": 2,
                 # one into each parallel clinical corridor
-            }
-        ],
-        "entryConstraints": [
+            },
+        ),
+        "entryConstraints": (
             {
                 "kind": ENTRY_RULE_ENUM.ENTRY_FROM,
                 "target": SPACE_ID.CLINICAL_CORRIDOR,
                 "hard": True,
-            }
-        ],
+            },
+        ),
         "ada": {
             "minClearWidthInches": 60,
             "requiredEntries": 2,
@@ -2687,40 +2545,21 @@ CROSSOVER_HALLWAY_RULES = {
     },
 
     "adjacency": {
-        "direct": [
-            {
-                "target": SPACE_ID.CLINICAL_CORRIDOR,
-                "condition": CONDITION_ENUM.NONE,
-                "hard": True,
-            }
-        ],
-        "preferredProximity": [],
-        "separation": [
-            {
-                "target": SPACE_ID.PATIENT_LOUNGE,
-                "hard": True,
-            },
-            {
-                "target": SPACE_ID.CHECK_IN,
-                "hard": True,
-            },
-            {
-                "target": SPACE_ID.CHECK_IN,
-                "hard": True,
-            },
-            {
-                "target": SPACE_ID.CHECK_OUT,
-                "hard": True,
-            },
-            {
-                "target": SPACE_ID.STAFF_LOUNGE,
-                "hard": True,
-            },
-        ],
+        "direct": _adjacent(
+            (SPACE_ID.CLINICAL_CORRIDOR, CONDITION_ENUM.NONE, True),
+        ),
+        "preferredProximity": (),
+        "separation": _targets(
+            (SPACE_ID.PATIENT_LOUNGE, True),
+            (SPACE_ID.CHECK_IN, True),
+            (SPACE_ID.CHECK_IN, True),
+            (SPACE_ID.CHECK_OUT, True),
+            (SPACE_ID.STAFF_LOUNGE, True),
+        ),
     },
 
     "visibility": {
-        "mustBeHiddenFrom": [
+        "mustBeHiddenFrom": (
             {
                 "target": SPACE_GROUP.PATIENT_FACING,
                 "hard": True,
@@ -2738,19 +2577,19 @@ CROSSOVER_HALLWAY_RULES = {
                 "target": SPACE_ID.PATIENT_RESTROOM,
                 "hard": True,
             },
-        ],
-        "mustBeVisibleFrom": [],
+        ),
+        "mustBeVisibleFrom": (),
     },
 
     "circulation": {
         "role": CIRCULATION_ROLE_ENUM.CONNECTOR,
-        "mustConnect": [
+        "mustConnect": (
             SPACE_ID.CLINICAL_CORRIDOR,
-        ],
-        "mustNotTerminateInto": [
+        ),
+        "mustNotTerminateInto": (
             SPACE_GROUP.PUBLIC,
             SPACE_GROUP.PATIENT_FACING,
-        ],
+        ),
     },
 
     "optimization": {
@@ -2767,11 +2606,11 @@ CROSSOVER_HALLWAY_RULES = {
         },
         # TODO: differentiate Primary vs Secondary crossover types
     },
-}
+})
 
 # Clinical Corridor
 
-CLINICAL_CORRIDOR_RULES = {
+CLINICAL_CORRIDOR_RULES = _freeze({
     "identity": {
         "roomType": SPACE_ID.CLINICAL_CORRIDOR,
         "category": ROOM_CATEGORY.CLINICAL,
@@ -2783,28 +2622,28 @@ CLINICAL_CORRIDOR_RULES = {
 
     "existence": {
         "trigger": TRIGGER_ENUM.DERIVED,
-        "countRules": [
+        "countRules": (
             {
                 "driver": COUNT_DRIVER_ENUM.TREATMENT_ROOMS,
                 "min": 1,
                 "max": None,
                 "condition": CONDITION_ENUM.IF_PRESENT,
                 # Always required when treatment rooms exist
-            }
-        ],
+            },
+        ),
     },
 
     "geometry": {
         "shape": SHAPE_ENUM.RECTILINEAR,
-        "dimensionModels": [
+        "dimensionModels": (
             {
                 "label": "clinical_corridor_standard",
                 "widthInches": 60,              # 5'-0" minimum clear
                 "widthPreferredMaxInches": 72,  # 6'-0" preferred max
                 "lengthStrategy": "scale_with_treatment_rooms",
                 # TODO: formalize LF per treatment room coefficient
-            }
-        ],
+            },
+        ),
         "fallbackStrategy": GEOMETRY_FALLBACK_ENUM.MINIMUM,
     },
 
@@ -2830,14 +2669,14 @@ CLINICAL_CORRIDOR_RULES = {
     },
 
     "access": {
-        "entryCountRules": [
+        "entryCountRules": (
             {
                 "minEntries": 1,
                 "maxEntries": None,
                 # corridor is continuous; entries handled by connected spaces
-            }
-        ],
-        "entryConstraints": [
+            },
+        ),
+        "entryConstraints": (
             {
                 "kind": ENTRY_RULE_ENUM.ENTRY_FROM,
                 "target": SPACE_ID.TREATMENT_ROOM,
@@ -2858,7 +2697,7 @@ CLINICAL_CORRIDOR_RULES = {
                 "target": SPACE_ID.MOBILE_TECH,
                 "hard": False,
             },
-        ],
+        ),
         "ada": {
             "minClearWidthInches": 60,
             "requiredEntries": 1,
@@ -2867,34 +2706,14 @@ CLINICAL_CORRIDOR_RULES = {
     },
 
     "adjacency": {
-        "direct": [
-            {
-                "target": SPACE_ID.TREATMENT_ROOM,
-                "condition": CONDITION_ENUM.NONE,
-                "hard": True,
-            },
-            {
-                "target": SPACE_ID.STERILIZATION,
-                "condition": CONDITION_ENUM.NONE,
-                "hard": True,
-            },
-            {
-                "target": SPACE_ID.MOBILE_TECH,
-                "condition": CONDITION_ENUM.NONE,
-                "hard": True,
-            },
-            {
-                "target": SPACE_ID.DOCTORS_ON_DECK,
-                "condition": CONDITION_ENUM.NONE,
-                "hard": False,
-            },
-            {
-                "target": SPACE_ID.CROSSOVER_HALLWAY,
-                "condition": CONDITION_ENUM.NONE,
-                "hard": True,
-            },
-        ],
-        "preferredProximity": [
+        "direct": _adjacent(
+            (SPACE_ID.TREATMENT_ROOM, CONDITION_ENUM.NONE, True),
+            (SPACE_ID.STERILIZATION, CONDITION_ENUM.NONE, True),
+            (SPACE_ID.MOBILE_TECH, CONDITION_ENUM.NONE, True),
+            (SPACE_ID.DOCTORS_ON_DECK, CONDITION_ENUM.NONE, False),
+            (SPACE_ID.CROSSOVER_HALLWAY, CONDITION_ENUM.NONE, True),
+        ),
+        "preferredProximity": (
             {
                 "target": SPACE_ID.CONSULT,
                 "maxDistanceInches": None,
@@ -2905,53 +2724,35 @@ CLINICAL_CORRIDOR_RULES = {
                 "maxDistanceInches": None,
                 "optimizationWeight": 0.6,
             },
-        ],
-        "separation": [
-            {
-                "target": SPACE_ID.PATIENT_LOUNGE,
-                "hard": True,
-            },
-            {
-                "target": SPACE_ID.CHECK_IN,
-                "hard": True,
-            },
-            {
-                "target": SPACE_ID.STAFF_LOUNGE,
-                "hard": True,
-            },
-            {
-                "target": SPACE_ID.LAB,
-                "hard": False,
-            },
-            {
-                "target": SPACE_ID.MECHANICAL,
-                "hard": False,
-            },
-        ],
+        ),
+        "separation": _targets(
+            (SPACE_ID.PATIENT_LOUNGE, True),
+            (SPACE_ID.CHECK_IN, True),
+            (SPACE_ID.STAFF_LOUNGE, True),
+            (SPACE_ID.LAB, False),
+            (SPACE_ID.MECHANICAL, False),
+        ),
     },
 
     "visibility": {
-        "mustBeHiddenFrom": [
-            {
-                "target": SPACE_GROUP.PATIENT_FACING,
-                "hard": True,
-            }
-        ],
-        "mustBeVisibleFrom": [],
+        "mustBeHiddenFrom": _targets(
+            (SPACE_GROUP.PATIENT_FACING, True),
+        ),
+        "mustBeVisibleFrom": (),
         # NOTE: wayfinding treated as optimization, not hard visibility
     },
 
     "circulation": {
         "role": CIRCULATION_ROLE_ENUM.SPINE,
-        "mustConnect": [
+        "mustConnect": (
             SPACE_ID.TREATMENT_ROOM,
             SPACE_ID.STERILIZATION,
             SPACE_ID.CROSSOVER_HALLWAY,
-        ],
-        "mustNotTerminateInto": [
+        ),
+        "mustNotTerminateInto": (
             SPACE_GROUP.PUBLIC,
             SPACE_GROUP.PATIENT_FACING,
-        ],
+        ),
     },
 
     "optimization": {
@@ -2972,11 +2773,11 @@ CLINICAL_CORRIDOR_RULES = {
         },
         # TODO: formalize signage / visual cues if needed later
     },
-}
+})
 
 # Treatment Room
 
-TREATMENT_ROOM_RULES = {
+TREATMENT_ROOM_RULES = _freeze({
     "identity": {
         "roomType": SPACE_ID.TREATMENT_ROOM,
         "category": ROOM_CATEGORY.CLINICAL,
@@ -2988,14 +2789,14 @@ TREATMENT_ROOM_RULES = {
 
     "existence": {
         "trigger": TRIGGER_ENUM.USER_INPUT,
-        "countRules": [
+        "countRules": (
             {
                 "driver": COUNT_DRIVER_ENUM.FIXED,
                 "min": 1,
                 "max": None,
                 "condition": CONDITION_ENUM.IF_PRESENT,
-            }
-        ],
+            },
+        ),
     },
 
     "geometry": {
@@ -3034,7 +2835,7 @@ TREATMENT_ROOM_RULES = {
                 "straddling the chair head for bilateral circulation."
             ),
             "depthRequirementInches": 126,  # 10'-6"
-            "entries": [
+            "entries": (
                 {
                     "wall": CLOCK_FACE_ENUM.TWELVE_OCLOCK,
                     "side": CLOCK_FACE_ENUM.NINE_OCLOCK,
@@ -3053,13 +2854,13 @@ TREATMENT_ROOM_RULES = {
                     #"doorType": DOOR_TYPE_ENUM.OPENING,
                     "hard": True,
                 },
-            ],
+            ),
             "headwallClearance": {
                 "minBetweenOpeningsInches": 36,
                 "scalesWithRoomWidth": True,
             },
             "adjacency": {
-                "mustConnectTo": [SPACE_ID.CLINICAL_CORRIDOR],
+                "mustConnectTo": (SPACE_ID.CLINICAL_CORRIDOR,),
                 "antiParallelRule": {
                     "target": SPACE_ID.TREATMENT_ROOM,
                     "condition": "not_directly_opposite",
@@ -3074,16 +2875,16 @@ TREATMENT_ROOM_RULES = {
                 "used when room long axis runs parallel to corridor."
             ),
             "depthRequirementInches": 132,  # 11'-0"
-            "entries": [
+            "entries": (
                 {
-                    "wall": [CLOCK_FACE_ENUM.THREE_OCLOCK, CLOCK_FACE_ENUM.NINE_OCLOCK],
+                    "wall": (CLOCK_FACE_ENUM.THREE_OCLOCK, CLOCK_FACE_ENUM.NINE_OCLOCK),
                     "positionBias": CLOCK_FACE_ENUM.SIX_OCLOCK,
                     #"doorType": DOOR_TYPE_ENUM.SWING,
                     "hard": True,
-                }
-            ],
+                },
+            ),
             "adjacency": {
-                "mustConnectTo": [SPACE_ID.CLINICAL_CORRIDOR],
+                "mustConnectTo": (SPACE_ID.CLINICAL_CORRIDOR,),
             },
         },
 
@@ -3092,23 +2893,23 @@ TREATMENT_ROOM_RULES = {
                 "Single swing door on the toe wall, offset from the chair centerline."
             ),
             "depthRequirementInches": 132,  # 11'-0"
-            "entries": [
+            "entries": (
                 {
                     "wall": CLOCK_FACE_ENUM.SIX_OCLOCK,
                     #"alignment": ALIGNMENT_ENUM.OFF_CENTER,
-                    "offsetToward": [
+                    "offsetToward": (
                         CLOCK_FACE_ENUM.THREE_OCLOCK,
                         CLOCK_FACE_ENUM.NINE_OCLOCK,
-                    ],
+                    ),
                     #"doorType": DOOR_TYPE_ENUM.SWING,
                     "hard": True,
-                }
-            ],
+                },
+            ),
             "constraints": {
                 #"forbiddenAlignment": ALIGNMENT_ENUM.CENTERLINE,
             },
             "adjacency": {
-                "mustConnectTo": [SPACE_ID.CLINICAL_CORRIDOR],
+                "mustConnectTo": (SPACE_ID.CLINICAL_CORRIDOR,),
             },
         },
     },
@@ -3122,21 +2923,18 @@ TREATMENT_ROOM_RULES = {
     },
 
     "visibility": {
-        "mustBeHiddenFrom": [
-            {
-                "target": SPACE_GROUP.PATIENT_FACING,
-                "hard": True,
-            }
-        ],
+        "mustBeHiddenFrom": _targets(
+            (SPACE_GROUP.PATIENT_FACING, True),
+        ),
         "acousticControls": {
             "avoidDirectOpposition": True,
         },
     },
-}
+})
 
 # Check In
 
-CHECK_IN_RULES = {
+CHECK_IN_RULES = _freeze({
 
     "identity": {
         "roomType": SPACE_ID.CHECK_IN,
@@ -3149,19 +2947,19 @@ CHECK_IN_RULES = {
 
     "existence": {
         "trigger": TRIGGER_ENUM.ALWAYS,
-        "countRules": [
+        "countRules": (
             {
                 "driver": COUNT_DRIVER_ENUM.FIXED,
                 "min": 1,
                 "max": 1,
                 "condition": CONDITION_ENUM.ALWAYS,
-            }
-        ],
+            },
+        ),
     },
 
     "geometry": {
         "shape": SHAPE_ENUM.RECTANGULAR,
-        "dimensionModels": [
+        "dimensionModels": (
             {
                 "label": "single_desk",
                 "treatmentRoomsMin": None,
@@ -3182,7 +2980,7 @@ CHECK_IN_RULES = {
                 "longAxisVariable": False,
                 "longAxisIncrementPerDoorInches": None,
             },
-        ],
+        ),
         "fallbackStrategy": GEOMETRY_FALLBACK_ENUM.MINIMUM,
     },
 
@@ -3208,74 +3006,51 @@ CHECK_IN_RULES = {
     },
 
     "access": {
-        "entryCountRules": [
-            {
-                "treatmentRoomsMin": None,
-                "treatmentRoomsMax": None,
-                "minEntries": 1,
-                "maxEntries": 2,
-            }
-        ],
-        "entryConstraints": [
+        "entryCountRules": _ONE_OR_TWO_ENTRIES,
+        "entryConstraints": (
             {
                 "kind": ENTRY_RULE_ENUM.ENTRY_FROM,
                 "target": SPACE_ID.PATIENT_LOUNGE,
                 "distanceMaxInches": None,
                 "hard": True,
-            }
-        ],
-        "ada": {
-            "minClearWidthInches": 34,
-            "requiredEntries": 1,
-        },
+            },
+        ),
+        "ada": _ADA_STANDARD,
     },
 
     "adjacency": {
-        "direct": [
-            {
-                "target": SPACE_ID.PATIENT_LOUNGE,
-                "condition": None,
-                "hard": True,
-            }
-        ],
-        "preferredProximity": [
+        "direct": _adjacent(
+            (SPACE_ID.PATIENT_LOUNGE, None, True),
+        ),
+        "preferredProximity": (
             {
                 "target": SPACE_ID.BUSINESS_OFFICE,
                 "maxDistanceInches": 120,
                 "optimizationWeight": 1.0,
-            }
-        ],
-        "separation": [
-            {
-                "target": SPACE_ID.CLINICAL_CORRIDOR,
-                "hard": True,
-            }
-        ],
+            },
+        ),
+        "separation": _targets(
+            (SPACE_ID.CLINICAL_CORRIDOR, True),
+        ),
     },
 
     "visibility": {
-        "mustBeHiddenFrom": [
-            {
-                "target": SPACE_ID.CLINICAL_CORRIDOR,
-                "hard": True,
-            }
-        ],
-        "mustBeVisibleFrom": [
-            {
-                "target": SPACE_ID.PATIENT_LOUNGE,
-                "hard": True,
-            }
-        ],
+        "mustBeHiddenFrom": _targets(
+            (SPACE_ID.CLINICAL_CORRIDOR, True),
+        ),
+        "mustBeVisibleFrom": _targets(
+            (SPACE_ID.PATIENT_LOUNGE, True),
+        ),
     },
 
     "circulation": {
         "role": CIRCULATION_ROLE_ENUM.DESTINATION,
-        "mustConnect": [
+        "mustConnect": (
             SPACE_ID.PATIENT_LOUNGE,
-        ],
-        "mustNotTerminateInto": [
+        ),
+        "mustNotTerminateInto": (
             SPACE_ID.CLINICAL_CORRIDOR,
-        ],
+        ),
     },
 
     "optimization": {
@@ -3287,11 +3062,11 @@ CHECK_IN_RULES = {
             "sameCategoryBonus": 0.3,
         },
     },
-}
+})
 
 # Check Out
 
-CHECK_OUT_RULES = {
+CHECK_OUT_RULES = _freeze({
 
     "identity": {
         "roomType": SPACE_ID.CHECK_OUT,
@@ -3304,19 +3079,19 @@ CHECK_OUT_RULES = {
 
     "existence": {
         "trigger": TRIGGER_ENUM.ALWAYS,
-        "countRules": [
+        "countRules": (
             {
                 "driver": COUNT_DRIVER_ENUM.FIXED,
                 "min": 1,
                 "max": 1,
                 "condition": CONDITION_ENUM.ALWAYS,
-            }
-        ],
+            },
+        ),
     },
 
     "geometry": {
         "shape": SHAPE_ENUM.RECTANGULAR,
-        "dimensionModels": [
+        "dimensionModels": (
             {
                 "label": "single_position",
                 "treatmentRoomsMin": None,
@@ -3337,7 +3112,7 @@ CHECK_OUT_RULES = {
                 "longAxisVariable": False,
                 "longAxisIncrementPerDoorInches": None,
             },
-        ],
+        ),
         "fallbackStrategy": GEOMETRY_FALLBACK_ENUM.MINIMUM,
     },
 
@@ -3363,37 +3138,23 @@ CHECK_OUT_RULES = {
     },
 
     "access": {
-        "entryCountRules": [
-            {
-                "treatmentRoomsMin": None,
-                "treatmentRoomsMax": None,
-                "minEntries": 1,
-                "maxEntries": 2,
-            }
-        ],
-        "entryConstraints": [
+        "entryCountRules": _ONE_OR_TWO_ENTRIES,
+        "entryConstraints": (
             {
                 "kind": ENTRY_RULE_ENUM.ENTRY_FROM,
                 "target": SPACE_ID.PATIENT_LOUNGE,
                 "distanceMaxInches": None,
                 "hard": True,
-            }
-        ],
-        "ada": {
-            "minClearWidthInches": 34,
-            "requiredEntries": 1,
-        },
+            },
+        ),
+        "ada": _ADA_STANDARD,
     },
 
     "adjacency": {
-        "direct": [
-            {
-                "target": SPACE_ID.PATIENT_LOUNGE,
-                "condition": None,
-                "hard": True,
-            }
-        ],
-        "preferredProximity": [
+        "direct": _adjacent(
+            (SPACE_ID.PATIENT_LOUNGE, None, True),
+        ),
+        "preferredProximity": (
             {
                 "target": SPACE_ID.BUSINESS_OFFICE,
                 "maxDistanceInches": 120,
@@ -3404,38 +3165,29 @@ CHECK_OUT_RULES = {
                 "maxDistanceInches": 180,
                 "optimizationWeight": 0.5,
             },
-        ],
-        "separation": [
-            {
-                "target": SPACE_ID.CLINICAL_CORRIDOR,
-                "hard": True,
-            }
-        ],
+        ),
+        "separation": _targets(
+            (SPACE_ID.CLINICAL_CORRIDOR, True),
+        ),
     },
 
     "visibility": {
-        "mustBeHiddenFrom": [
-            {
-                "target": SPACE_ID.CLINICAL_CORRIDOR,
-                "hard": True,
-            }
-        ],
-        "mustBeVisibleFrom": [
-            {
-                "target": SPACE_ID.PATIENT_LOUNGE,
-                "hard": False,
-            }
-        ],
+        "mustBeHiddenFrom": _targets(
+            (SPACE_ID.CLINICAL_CORRIDOR, True),
+        ),
+        "mustBeVisibleFrom": _targets(
+            (SPACE_ID.PATIENT_LOUNGE, False),
+        ),
     },
 
     "circulation": {
         "role": CIRCULATION_ROLE_ENUM.DESTINATION,
-        "mustConnect": [
+        "mustConnect": (
             SPACE_ID.PATIENT_LOUNGE,
-        ],
-        "mustNotTerminateInto": [
+        ),
+        "mustNotTerminateInto": (
             SPACE_ID.CLINICAL_CORRIDOR,
-        ],
+        ),
     },
 
     "optimization": {
@@ -3447,11 +3199,11 @@ CHECK_OUT_RULES = {
             "sameCategoryBonus": 0.2,
         },
     },
-}
+})
 
 # Mechanical
 
-MECHANICAL_RULES = {
+MECHANICAL_RULES = _freeze({
 
     "identity": {
         "roomType": SPACE_ID.MECHANICAL,
@@ -3464,7 +3216,7 @@ MECHANICAL_RULES = {
 
     "existence": {
         "trigger": TRIGGER_ENUM.DERIVED,
-        "countRules": [
+        "countRules": (
             {
                 # Base assumption: at least one mechanical room is required
                 "driver": COUNT_DRIVER_ENUM.FIXED,
@@ -3479,12 +3231,12 @@ MECHANICAL_RULES = {
                 "max": None,
                 "condition": CONDITION_ENUM.IF_THRESHOLD,  # TODO: define sqft threshold
             },
-        ],
+        ),
     },
 
     "geometry": {
         "shape": SHAPE_ENUM.RECTANGULAR,
-        "dimensionModels": [
+        "dimensionModels": (
             {
                 "label": "small_mechanical",
                 "treatmentRoomsMin": None,
@@ -3515,7 +3267,7 @@ MECHANICAL_RULES = {
                 "longAxisVariable": True,  # equipment-driven layouts
                 "longAxisIncrementPerDoorInches": None,
             },
-        ],
+        ),
         "fallbackStrategy": GEOMETRY_FALLBACK_ENUM.MINIMUM,
     },
 
@@ -3541,15 +3293,15 @@ MECHANICAL_RULES = {
     },
 
     "access": {
-        "entryCountRules": [
+        "entryCountRules": (
             {
                 "treatmentRoomsMin": None,
                 "treatmentRoomsMax": None,
                 "minEntries": 1,
                 "maxEntries": 2,  # secondary service access possible
-            }
-        ],
-        "entryConstraints": [
+            },
+        ),
+        "entryConstraints": (
             {
                 # Should not be accessed from patient-facing areas
                 "kind": ENTRY_RULE_ENUM.ENTRY_NOT_FROM,
@@ -3564,7 +3316,7 @@ MECHANICAL_RULES = {
                 "distanceMaxInches": None,
                 "hard": False,
             },
-        ],
+        ),
         "ada": {
             # Not a public-access space; allow narrower service door
             "minClearWidthInches": 32,  # TODO: confirm with code requirements
@@ -3573,60 +3325,45 @@ MECHANICAL_RULES = {
     },
 
     "adjacency": {
-        "direct": [
+        "direct": (
             # No required direct adjacencies
-        ],
-        "preferredProximity": [
+        ),
+        "preferredProximity": (
             {
                 # Prefer proximity to lab / sterilization for MEP efficiency
                 "target": SPACE_GROUP.SUPPORT,
                 "maxDistanceInches": None,
                 "optimizationWeight": 0.4,
-            }
-        ],
-        "separation": [
-            {
-                "target": SPACE_GROUP.PATIENT_FACING,
-                "hard": True,
-            },
-            {
-                "target": SPACE_ID.TREATMENT_ROOM,
-                "hard": True,
-            },
-            {
-                "target": SPACE_ID.PATIENT_LOUNGE,
-                "hard": True,
-            },
-            {
-                "target": SPACE_ID.CONSULT,
-                "hard": True,
             },
-        ],
+        ),
+        "separation": _targets(
+            (SPACE_GROUP.PATIENT_FACING, True),
+            (SPACE_ID.TREATMENT_ROOM, True),
+            (SPACE_ID.PATIENT_LOUNGE, True),
+            (SPACE_ID.CONSULT, True),
+        ),
     },
 
     "visibility": {
-        "mustBeHiddenFrom": [
-            {
-                "target": SPACE_GROUP.PATIENT_FACING,
-                "hard": True,
-            }
-        ],
-        "mustBeVisibleFrom": [
+        "mustBeHiddenFrom": _targets(
+            (SPACE_GROUP.PATIENT_FACING, True),
+        ),
+        "mustBeVisibleFrom": (
             # None
-        ],
+        ),
     },
 
     "circulation": {
         "role": CIRCULATION_ROLE_ENUM.DESTINATION,
-        "mustConnect": [
+        "mustConnect": (
             # Staff / support corridor preferred but not mandatory
             # TODO: add STAFF_CORRIDOR enum if needed
-        ],
-        "mustNotTerminateInto": [
+        ),
+        "mustNotTerminateInto": (
             SPACE_ID.PATIENT_LOUNGE,
             SPACE_ID.CHECK_IN,
             SPACE_ID.CHECK_OUT,
-        ],
+        ),
     },
 
     "optimization": {
@@ -3639,11 +3376,11 @@ MECHANICAL_RULES = {
             "sameCategoryBonus": 0.6,
         },
     },
-}
+})
 
 # Staff Restrooms
 
-STAFF_RESTROOM_RULES = {
+STAFF_RESTROOM_RULES = _freeze({
 
     "identity": {
         "roomType": SPACE_ID.STAFF_RESTROOM,
@@ -3656,7 +3393,7 @@ STAFF_RESTROOM_RULES = {
 
     "existence": {
         "trigger": TRIGGER_ENUM.DERIVED,
-        "countRules": [
+        "countRules": (
             {
                 # Minimum one staff restroom in any staffed practice
                 "driver": COUNT_DRIVER_ENUM.FIXED,
@@ -3678,12 +3415,12 @@ STAFF_RESTROOM_RULES = {
                 "max": None,
                 "condition": CONDITION_ENUM.IF_THRESHOLD,  # TODO: define occupancy thresholds
             },
-        ],
+        ),
     },
 
     "geometry": {
         "shape": SHAPE_ENUM.RECTANGULAR,
-        "dimensionModels": [
+        "dimensionModels": (
             {
                 "label": "single_user_staff_restroom",
                 "treatmentRoomsMin": None,
@@ -3704,7 +3441,7 @@ STAFF_RESTROOM_RULES = {
                 "longAxisVariable": False,
                 "longAxisIncrementPerDoorInches": None,
             },
-        ],
+        ),
         "fallbackStrategy": GEOMETRY_FALLBACK_ENUM.MINIMUM,
     },
 
@@ -3730,15 +3467,8 @@ STAFF_RESTROOM_RULES = {
     },
 
     "access": {
-        "entryCountRules": [
-            {
-                "treatmentRoomsMin": None,
-                "treatmentRoomsMax": None,
-                "minEntries": 1,
-                "maxEntries": 1,
-            }
-        ],
-        "entryConstraints": [
+        "entryCountRules": _ONE_ENTRY,
+        "entryConstraints": (
             {
                 # Must not be accessed from patient-facing zones
                 "kind": ENTRY_RULE_ENUM.ENTRY_NOT_FROM,
@@ -3753,19 +3483,16 @@ STAFF_RESTROOM_RULES = {
                 "distanceMaxInches": None,
                 "hard": False,
             },
-        ],
-        "ada": {
-            # At least one ADA-compliant staff restroom is typically required
-            "minClearWidthInches": 34,
-            "requiredEntries": 1,
-        },
+        ),
+        # At least one ADA-compliant staff restroom is typically required
+        "ada": _ADA_STANDARD,
     },
 
     "adjacency": {
-        "direct": [
+        "direct": (
             # No required direct adjacencies
-        ],
-        "preferredProximity": [
+        ),
+        "preferredProximity": (
             {
                 "target": SPACE_ID.STAFF_LOUNGE,
                 "maxDistanceInches": None,
@@ -3776,49 +3503,34 @@ STAFF_RESTROOM_RULES = {
                 "maxDistanceInches": None,
                 "optimizationWeight": 0.4,
             },
-        ],
-        "separation": [
-            {
-                "target": SPACE_GROUP.PATIENT_FACING,
-                "hard": True,
-            },
-            {
-                "target": SPACE_ID.PATIENT_LOUNGE,
-                "hard": True,
-            },
-            {
-                "target": SPACE_ID.CHECK_IN,
-                "hard": True,
-            },
-            {
-                "target": SPACE_ID.CHECK_OUT,
-                "hard": True,
-            },
-        ],
+        ),
+        "separation": _targets(
+            (SPACE_GROUP.PATIENT_FACING, True),
+            (SPACE_ID.PATIENT_LOUNGE, True),
+            (SPACE_ID.CHECK_IN, True),
+            (SPACE_ID.CHECK_OUT, True),
+        ),
     },
 
     "visibility": {
-        "mustBeHiddenFrom": [
-            {
-                "target": SPACE_GROUP.PATIENT_FACING,
-                "hard": True,
-            }
-        ],
-        "mustBeVisibleFrom": [
+        "mustBeHiddenFrom": _targets(
+            (SPACE_GROUP.PATIENT_FACING, True),
+        ),
+        "mustBeVisibleFrom": (
             # None
-        ],
+        ),
     },
 
     "circulation": {
         "role": CIRCULATION_ROLE_ENUM.DESTINATION,
-        "mustConnect": [
+        "mustConnect": (
             # TODO: add STAFF_CORRIDOR enum if explicitly modeled later
-        ],
-        "mustNotTerminateInto": [
+        ),
+        "mustNotTerminateInto": (
             SPACE_ID.PATIENT_LOUNGE,
             SPACE_ID.CHECK_IN,
             SPACE_ID.CHECK_OUT,
-        ],
+        ),
     },
 
     "optimization": {
@@ -3832,11 +3544,11 @@ STAFF_RESTROOM_RULES = {
             "sameCategoryBonus": 0.7,
         },
     },
-}
+})
 
 # Doctor Nook
 
-DOCTOR_NOOK_RULES = {
+DOCTOR_NOOK_RULES = _freeze({
 
     "identity": {
         "roomType": SPACE_ID.DOCTOR_NOOK,
@@ -3850,7 +3562,7 @@ DOCTOR_NOOK_RULES = {
 
     "existence": {
         "trigger": TRIGGER_ENUM.DERIVED,
-        "countRules": [
+        "countRules": (
             {
                 # At least one nook in any provider-based practice
                 "driver": COUNT_DRIVER_ENUM.FIXED,
@@ -3865,12 +3577,12 @@ DOCTOR_NOOK_RULES = {
                 "max": None,
                 "condition": CONDITION_ENUM.IF_THRESHOLD,  # TODO: define scaling breakpoint
             },
-        ],
+        ),
     },
 
     "geometry": {
         "shape": SHAPE_ENUM.RECTANGULAR,
-        "dimensionModels": [
+        "dimensionModels": (
             {
                 "label": "single_provider_nook",
                 "treatmentRoomsMin": None,
@@ -3891,41 +3603,20 @@ DOCTOR_NOOK_RULES = {
                 "longAxisVariable": False,
                 "longAxisIncrementPerDoorInches": None,
             },
-        ],
+        ),
         "fallbackStrategy": GEOMETRY_FALLBACK_ENUM.MINIMUM,
     },
 
-    "orientation": {
-        LAYOUT_ENUM.NARROW: {
-            "allowed": True,
-            "longAxisRelation": None,
-            "placementHint": PLACEMENT_ENUM.CENTER,
-            "connectsCorridors": False,
-        },
-        LAYOUT_ENUM.THREE_LAYER_CAKE: {
-            "allowed": True,
-            "longAxisRelation": None,
-            "placementHint": PLACEMENT_ENUM.CENTER,
-            "connectsCorridors": False,
-        },
-        LAYOUT_ENUM.H_LAYOUT: {
-            "allowed": True,
-            "longAxisRelation": None,
-            "placementHint": PLACEMENT_ENUM.CENTER,
-            "connectsCorridors": False,
-        },
-    },
+    "orientation": _all_layouts({
+        "allowed": True,
+        "longAxisRelation": None,
+        "placementHint": PLACEMENT_ENUM.CENTER,
+        "connectsCorridors": False,
+    }),
 
     "access": {
-        "entryCountRules": [
-            {
-                "treatmentRoomsMin": None,
-                "treatmentRoomsMax": None,
-                "minEntries": 1,
-                "maxEntries": 1,
-            }
-        ],
-        "entryConstraints": [
+        "entryCountRules": _ONE_ENTRY,
+        "entryConstraints": (
             {
                 # Should not be directly accessed from public/patient spaces
                 "kind": ENTRY_RULE_ENUM.ENTRY_NOT_FROM,
@@ -3940,7 +3631,7 @@ DOCTOR_NOOK_RULES = {
                 "distanceMaxInches": None,
                 "hard": False,
             },
-        ],
+        ),
         "ada": {
             # Not a patient-occupied space; ADA may not strictly apply
             # TODO: confirm local code interpretation
@@ -3950,10 +3641,10 @@ DOCTOR_NOOK_RULES = {
     },
 
     "adjacency": {
-        "direct": [
+        "direct": (
             # No strictly required direct adjacencies
-        ],
-        "preferredProximity": [
+        ),
+        "preferredProximity": (
             {
                 # Close to treatment rooms for efficiency
                 "target": SPACE_GROUP.CLINICAL,
@@ -3970,8 +3661,8 @@ DOCTOR_NOOK_RULES = {
                 "maxDistanceInches": None,
                 "optimizationWeight": 0.3,
             },
-        ],
-        "separation": [
+        ),
+        "separation": (
             {
                 # Avoid public-facing and waiting areas
                 "target": SPACE_GROUP.PUBLIC,
@@ -3985,31 +3676,28 @@ DOCTOR_NOOK_RULES = {
                 "target": SPACE_ID.CHECK_IN,
                 "hard": True,
             },
-        ],
+        ),
     },
 
     "visibility": {
-        "mustBeHiddenFrom": [
-            {
-                "target": SPACE_GROUP.PUBLIC,
-                "hard": True,
-            }
-        ],
-        "mustBeVisibleFrom": [
+        "mustBeHiddenFrom": _targets(
+            (SPACE_GROUP.PUBLIC, True),
+        ),
+        "mustBeVisibleFrom": (
             # None required
-        ],
+        ),
     },
 
     "circulation": {
         "role": CIRCULATION_ROLE_ENUM.DESTINATION,
-        "mustConnect": [
+        "mustConnect": (
             # TODO: add explicit CLINICAL_CORRIDOR if modeled separately
-        ],
-        "mustNotTerminateInto": [
+        ),
+        "mustNotTerminateInto": (
             SPACE_ID.PATIENT_LOUNGE,
             SPACE_ID.CHECK_IN,
             SPACE_ID.CHECK_OUT,
-        ],
+        ),
     },
 
     "optimization": {
@@ -4023,11 +3711,11 @@ DOCTOR_NOOK_RULES = {
             "sameCategoryBonus": 0.6,
         },
     },
-}
+})
 
 # Vestibule
 
-VESTIBULE_RULES = {
+VESTIBULE_RULES = _freeze({
 
     "identity": {
         "roomType": SPACE_ID.VESTIBULE,
@@ -4041,7 +3729,7 @@ VESTIBULE_RULES = {
 
     "existence": {
         "trigger": TRIGGER_ENUM.ALWAYS,
-        "countRules": [
+        "countRules": (
             {
                 # Typically one main vestibule per practice
                 "driver": COUNT_DRIVER_ENUM.FIXED,
@@ -4056,12 +3744,12 @@ VESTIBULE_RULES = {
                 "max": None,
                 "condition": CONDITION_ENUM.IF_THRESHOLD,  # TODO: define sqft threshold
             },
-        ],
+        ),
     },
 
     "geometry": {
         "shape": SHAPE_ENUM.RECTANGULAR,
-        "dimensionModels": [
+        "dimensionModels": (
             {
                 "label": "standard_single_door_vestibule",
                 "treatmentRoomsMin": None,
@@ -4082,42 +3770,28 @@ VESTIBULE_RULES = {
                 "longAxisVariable": False,
                 "longAxisIncrementPerDoorInches": None,
             },
-        ],
+        ),
         "fallbackStrategy": GEOMETRY_FALLBACK_ENUM.MINIMUM,
     },
 
-    "orientation": {
-        LAYOUT_ENUM.NARROW: {
-            "allowed": True,
-            "longAxisRelation": AXIS_RELATION_ENUM.PERPENDICULAR,
-            "placementHint": PLACEMENT_ENUM.FRONT,
-            "connectsCorridors": False,
-        },
-        LAYOUT_ENUM.THREE_LAYER_CAKE: {
-            "allowed": True,
-            "longAxisRelation": AXIS_RELATION_ENUM.PERPENDICULAR,
-            "placementHint": PLACEMENT_ENUM.FRONT,
-            "connectsCorridors": False,
-        },
-        LAYOUT_ENUM.H_LAYOUT: {
-            "allowed": True,
-            "longAxisRelation": AXIS_RELATION_ENUM.PERPENDICULAR,
-            "placementHint": PLACEMENT_ENUM.FRONT,
-            "connectsCorridors": False,
-        },
-    },
+    "orientation": _all_layouts({
+        "allowed": True,
+        "longAxisRelation": AXIS_RELATION_ENUM.PERPENDICULAR,
+        "placementHint": PLACEMENT_ENUM.FRONT,
+        "connectsCorridors": False,
+    }),
 
     "access": {
-        "entryCountRules": [
+        "entryCountRules": (
             {
                 # Exterior entry + interior entry
                 "treatmentRoomsMin": None,
                 "treatmentRoomsMax": None,
                 "minEntries": 2,
                 "maxEntries": 2,
-            }
-        ],
-        "entryConstraints": [
+            },
+        ),
+        "entryConstraints": (
             {
                 # Must connect to exterior
                 "kind": ENTRY_RULE_ENUM.ENTRY_FROM,
@@ -4139,7 +3813,7 @@ VESTIBULE_RULES = {
                 "distanceMaxInches": None,
                 "hard": True,
             },
-        ],
+        ),
         "ada": {
             # Vestibule is fully ADA-required
             "minClearWidthInches": 36,
@@ -4148,27 +3822,19 @@ VESTIBULE_RULES = {
     },
 
     "adjacency": {
-        "direct": [
-            {
-                "target": SPACE_ID.PATIENT_LOUNGE,
-                "condition": CONDITION_ENUM.NONE,
-                "hard": False,
-            },
-            {
-                "target": SPACE_ID.CHECK_IN,
-                "condition": CONDITION_ENUM.NONE,
-                "hard": False,
-            },
-        ],
-        "preferredProximity": [
+        "direct": _adjacent(
+            (SPACE_ID.PATIENT_LOUNGE, CONDITION_ENUM.NONE, False),
+            (SPACE_ID.CHECK_IN, CONDITION_ENUM.NONE, False),
+        ),
+        "preferredProximity": (
             {
                 # Reception should be immediately visible after vestibule
                 "target": SPACE_ID.CHECK_IN,
                 "maxDistanceInches": 240,  # ~20'
                 "optimizationWeight": 0.9,
-            }
-        ],
-        "separation": [
+            },
+        ),
+        "separation": (
             {
                 # Strong separation from back-of-house
                 "target": SPACE_GROUP.PRIVATE,
@@ -4178,37 +3844,37 @@ VESTIBULE_RULES = {
                 "target": SPACE_GROUP.CLINICAL,
                 "hard": True,
             },
-        ],
+        ),
     },
 
     "visibility": {
-        "mustBeHiddenFrom": [
+        "mustBeHiddenFrom": (
             {
                 # Vestibule should not expose clinical spaces
                 "target": SPACE_GROUP.CLINICAL,
                 "hard": True,
-            }
-        ],
-        "mustBeVisibleFrom": [
+            },
+        ),
+        "mustBeVisibleFrom": (
             {
                 # Vestibule should be visible from reception for supervision
                 "target": SPACE_ID.CHECK_IN,
                 "hard": False,
-            }
-        ],
+            },
+        ),
     },
 
     "circulation": {
         "role": CIRCULATION_ROLE_ENUM.CONNECTOR,
-        "mustConnect": [
+        "mustConnect": (
             SPACE_ID.PATIENT_LOUNGE,
             SPACE_ID.CHECK_IN,
-        ],
-        "mustNotTerminateInto": [
+        ),
+        "mustNotTerminateInto": (
             SPACE_GROUP.CLINICAL,
             SPACE_ID.STAFF_LOUNGE,
             SPACE_ID.STAFF_RESTROOM,
-        ],
+        ),
     },
 
     "optimization": {
@@ -4222,10 +3888,10 @@ VESTIBULE_RULES = {
             "sameCategoryBonus": 0.7,
         },
     },
-}
+})
 # Children's Area
 
-CHILDRENS_RULES = {
+CHILDRENS_RULES = _freeze({
 
     "identity": {
         "roomType": SPACE_ID.CHILDRENS,
@@ -4239,7 +3905,7 @@ CHILDRENS_RULES = {
 
     "existence": {
         "trigger": TRIGGER_ENUM.DERIVED,
-        "countRules": [
+        "countRules": (
             {
                 # Typically provided only for family / pediatric practices
                 "driver": COUNT_DRIVER_ENUM.TREATMENT_ROOMS,
@@ -4254,12 +3920,12 @@ CHILDRENS_RULES = {
                 "max": 1,
                 "condition": CONDITION_ENUM.NONE,
             },
-        ],
+        ),
     },
 
     "geometry": {
         "shape": SHAPE_ENUM.RECTANGULAR,
-        "dimensionModels": [
+        "dimensionModels": (
             {
                 "label": "small_children_zone",
                 "treatmentRoomsMin": 6,
@@ -4280,7 +3946,7 @@ CHILDRENS_RULES = {
                 "longAxisVariable": True,
                 "longAxisIncrementPerDoorInches": None,
             },
-        ],
+        ),
         "fallbackStrategy": GEOMETRY_FALLBACK_ENUM.MINIMUM,
     },
 
@@ -4306,16 +3972,16 @@ CHILDRENS_RULES = {
     },
 
     "access": {
-        "entryCountRules": [
+        "entryCountRules": (
             {
                 # Often open to lounge with no door, but modeled as one entry
                 "treatmentRoomsMin": None,
                 "treatmentRoomsMax": None,
                 "minEntries": 1,
                 "maxEntries": 1,
-            }
-        ],
-        "entryConstraints": [
+            },
+        ),
+        "entryConstraints": (
             {
                 # Must connect to patient lounge
                 "kind": ENTRY_RULE_ENUM.ENTRY_FROM,
@@ -4330,23 +3996,16 @@ CHILDRENS_RULES = {
                 "distanceMaxInches": None,
                 "hard": True,
             },
-        ],
-        "ada": {
-            # Clear access path required, even if furniture-based
-            "minClearWidthInches": 36,
-            "requiredEntries": 1,
-        },
+        ),
+        # Clear access path required, even if furniture-based
+        "ada": _ADA_WIDE,
     },
 
     "adjacency": {
-        "direct": [
-            {
-                "target": SPACE_ID.PATIENT_LOUNGE,
-                "condition": CONDITION_ENUM.NONE,
-                "hard": True,
-            },
-        ],
-        "preferredProximity": [
+        "direct": _adjacent(
+            (SPACE_ID.PATIENT_LOUNGE, CONDITION_ENUM.NONE, True),
+        ),
+        "preferredProximity": (
             {
                 # Visibility from reception for supervision
                 "target": SPACE_ID.CHECK_IN,
@@ -4359,49 +4018,40 @@ CHILDRENS_RULES = {
                 "maxDistanceInches": 240,  # ~20'
                 "optimizationWeight": 0.5,
             },
-        ],
-        "separation": [
-            {
-                "target": SPACE_GROUP.CLINICAL,
-                "hard": True,
-            },
-            {
-                "target": SPACE_ID.STAFF_LOUNGE,
-                "hard": True,
-            },
-            {
-                "target": SPACE_ID.STERILIZATION,
-                "hard": True,
-            },
-        ],
+        ),
+        "separation": _targets(
+            (SPACE_GROUP.CLINICAL, True),
+            (SPACE_ID.STAFF_LOUNGE, True),
+            (SPACE_ID.STERILIZATION, True),
+        ),
     },
 
     "visibility": {
-        "mustBeHiddenFrom": [
+        "mustBeHiddenFrom": (
             {
                 # Children should not see clinical activity
                 "target": SPACE_GROUP.CLINICAL,
                 "hard": True,
-            }
-        ],
-        "mustBeVisibleFrom": [
+            },
+        ),
+        "mustBeVisibleFrom": (
             {
                 # Passive supervision from lounge or reception
                 "target": SPACE_ID.PATIENT_LOUNGE,
                 "hard": False,
             },
-        ],
+        ),
     },
 
     "circulation": {
         "role": CIRCULATION_ROLE_ENUM.DESTINATION,
-        "mustConnect": [
+        "mustConnect": (
             SPACE_ID.PATIENT_LOUNGE,
-        ],
-        "mustNotTerminateInto": [
+        ),
+        "mustNotTerminateInto": (
             SPACE_GROUP.CLINICAL,
             SPACE_ID.CLINICAL_CORRIDOR,
-        ],
+        ),
     },
 
     "optimization": {
@@ -4415,11 +4065,11 @@ CHILDRENS_RULES = {
             "sameCategoryBonus": 0.8,
         },
     },
-}
+})
 
 # Refreshment Area
 
-REFRESHMENT_RULES = {
+REFRESHMENT_RULES = _freeze({
 
     "identity": {
         "roomType": SPACE_ID.REFRESHMENT,
@@ -4433,7 +4083,7 @@ REFRESHMENT_RULES = {
 
     "existence": {
         "trigger": TRIGGER_ENUM.DERIVED,
-        "countRules": [
+        "countRules": (
             {
                 # Common in mid-size and larger practices
                 "driver": COUNT_DRIVER_ENUM.TREATMENT_ROOMS,
@@ -4448,12 +4098,12 @@ REFRESHMENT_RULES = {
                 "max": 1,
                 "condition": CONDITION_ENUM.NONE,
             },
-        ],
+        ),
     },
 
     "geometry": {
         "shape": SHAPE_ENUM.RECTANGULAR,
-        "dimensionModels": [
+        "dimensionModels": (
             {
                 "label": "compact_refreshment",
                 "treatmentRoomsMin": 6,
@@ -4474,7 +4124,7 @@ REFRESHMENT_RULES = {
                 "longAxisVariable": True,
                 "longAxisIncrementPerDoorInches": None,
             },
-        ],
+        ),
         "fallbackStrategy": GEOMETRY_FALLBACK_ENUM.MINIMUM,
     },
 
@@ -4500,76 +4150,63 @@ REFRESHMENT_RULES = {
     },
 
     "access": {
-        "entryCountRules": [
+        "entryCountRules": (
             {
                 # Often open to lounge, modeled as one access point
                 "treatmentRoomsMin": None,
                 "treatmentRoomsMax": None,
                 "minEntries": 1,
                 "maxEntries": 1,
-            }
-        ],
-        "entryConstraints": [
+            },
+        ),
+        "entryConstraints": (
             {
                 "kind": ENTRY_RULE_ENUM.ENTRY_FROM,
                 "target": SPACE_ID.PATIENT_LOUNGE,
                 "distanceMaxInches": None,
                 "hard": True,
             },
-        ],
-        "ada": {
-            "minClearWidthInches": 36,
-            "requiredEntries": 1,
-        },
+        ),
+        "ada": _ADA_WIDE,
     },
 
     "adjacency": {
-        "direct": [
-            {
-                "target": SPACE_ID.PATIENT_LOUNGE,
-                "condition": CONDITION_ENUM.NONE,
-                "hard": True,
-            },
-        ],
-        "preferredProximity": [
+        "direct": _adjacent(
+            (SPACE_ID.PATIENT_LOUNGE, CONDITION_ENUM.NONE, True),
+        ),
+        "preferredProximity": (
             {
                 "target": SPACE_ID.CHECK_OUT,
                 "maxDistanceInches": 120,  # ~10'
                 "optimizationWeight": 0.6,
             },
-        ],
-        "separation": [
-            {
-                "target": SPACE_GROUP.CLINICAL,
-                "hard": True,
-            },
-        ],
+        ),
+        "separation": _targets(
+            (SPACE_GROUP.CLINICAL, True),
+        ),
     },
 
     "visibility": {
-        "mustBeHiddenFrom": [
-            {
-                "target": SPACE_GROUP.CLINICAL,
-                "hard": True,
-            }
-        ],
-        "mustBeVisibleFrom": [
+        "mustBeHiddenFrom": _targets(
+            (SPACE_GROUP.CLINICAL, True),
+        ),
+        "mustBeVisibleFrom": (
             {
                 # Passive visibility from lounge
                 "target": SPACE_ID.PATIENT_LOUNGE,
                 "hard": False,
-            }
-        ],
+            },
+        ),
     },
 
     "circulation": {
         "role": CIRCULATION_ROLE_ENUM.DESTINATION,
-        "mustConnect": [
+        "mustConnect": (
             SPACE_ID.PATIENT_LOUNGE,
-        ],
-        "mustNotTerminateInto": [
+        ),
+        "mustNotTerminateInto": (
             SPACE_GROUP.CLINICAL,
-        ],
+        ),
     },
 
     "optimization": {
@@ -4581,11 +4218,11 @@ REFRESHMENT_RULES = {
             "sameCategoryBonus": 0.7,
         },
     },
-}
+})
 
 # Retail Area
 
-RETAIL_RULES = {
+RETAIL_RULES = _freeze({
 
     "identity": {
         "roomType": SPACE_ID.RETAIL,
@@ -4599,7 +4236,7 @@ RETAIL_RULES = {
 
     "existence": {
         "trigger": TRIGGER_ENUM.DERIVED,
-        "countRules": [
+        "countRules": (
             {
                 "driver": COUNT_DRIVER_ENUM.TREATMENT_ROOMS,
                 "min": 5,
@@ -4613,13 +4250,13 @@ RETAIL_RULES = {
                 "max": 1,
                 "condition": CONDITION_ENUM.NONE,
             },
-        ],
+        ),
     },
 
     "geometry": {
         # Often wall-based or shallow footprint
         "shape": SHAPE_ENUM.RECTANGULAR,
-        "dimensionModels": [
+        "dimensionModels": (
             {
                 "label": "wall_retail_zone",
                 "treatmentRoomsMin": 5,
@@ -4630,7 +4267,7 @@ RETAIL_RULES = {
                 "longAxisVariable": True,
                 "longAxisIncrementPerDoorInches": None,
             },
-        ],
+        ),
         "fallbackStrategy": GEOMETRY_FALLBACK_ENUM.MINIMUM,
     },
 
@@ -4656,77 +4293,64 @@ RETAIL_RULES = {
     },
 
     "access": {
-        "entryCountRules": [
+        "entryCountRules": (
             {
                 # Often open-access with no door
                 "treatmentRoomsMin": None,
                 "treatmentRoomsMax": None,
                 "minEntries": 1,
                 "maxEntries": 1,
-            }
-        ],
-        "entryConstraints": [
+            },
+        ),
+        "entryConstraints": (
             {
                 "kind": ENTRY_RULE_ENUM.ENTRY_FROM,
                 "target": SPACE_ID.CHECK_OUT,
                 "distanceMaxInches": None,
                 "hard": False,
             },
-        ],
-        "ada": {
-            # Clear aisle in front of retail wall
-            "minClearWidthInches": 36,
-            "requiredEntries": 1,
-        },
+        ),
+        # Clear aisle in front of retail wall
+        "ada": _ADA_WIDE,
     },
 
     "adjacency": {
-        "direct": [
-            {
-                "target": SPACE_ID.CHECK_OUT,
-                "condition": CONDITION_ENUM.NONE,
-                "hard": False,
-            },
-        ],
-        "preferredProximity": [
+        "direct": _adjacent(
+            (SPACE_ID.CHECK_OUT, CONDITION_ENUM.NONE, False),
+        ),
+        "preferredProximity": (
             {
                 "target": SPACE_ID.CHECK_IN,
                 "maxDistanceInches": 120,
                 "optimizationWeight": 0.6,
             },
-        ],
-        "separation": [
-            {
-                "target": SPACE_GROUP.CLINICAL,
-                "hard": True,
-            },
-        ],
+        ),
+        "separation": _targets(
+            (SPACE_GROUP.CLINICAL, True),
+        ),
     },
 
     "visibility": {
-        "mustBeHiddenFrom": [
-            {
-                "target": SPACE_GROUP.CLINICAL,
-                "hard": True,
-            }
-        ],
-        "mustBeVisibleFrom": [
+        "mustBeHiddenFrom": _targets(
+            (SPACE_GROUP.CLINICAL, True),
+        ),
+        "mustBeVisibleFrom": (
             {
                 # Encourages browsing near checkout
                 "target": SPACE_ID.CHECK_OUT,
                 "hard": False,
-            }
-        ],
+            },
+        ),
     },
 
     "circulation": {
         "role": CIRCULATION_ROLE_ENUM.DESTINATION,
-        "mustConnect": [
+        "mustConnect": (
             SPACE_ID.CHECK_OUT,
-        ],
-        "mustNotTerminateInto": [
+        ),
+        "mustNotTerminateInto": (
             SPACE_GROUP.CLINICAL,
-        ],
+        ),
     },
 
     "optimization": {
@@ -4738,11 +4362,11 @@ RETAIL_RULES = {
             "sameCategoryBonus": 0.6,
         },
     },
-}
+})
 
 # Imaging Room
 
-IMAGING_RULES = {
+IMAGING_RULES = _freeze({
 
     "identity": {
         "roomType": SPACE_ID.IMAGING,
@@ -4756,7 +4380,7 @@ IMAGING_RULES = {
 
     "existence": {
         "trigger": TRIGGER_ENUM.DERIVED,
-        "countRules": [
+        "countRules": (
             {
                 # One imaging room serves multiple operatories
                 "driver": COUNT_DRIVER_ENUM.TREATMENT_ROOMS,
@@ -4771,12 +4395,12 @@ IMAGING_RULES = {
                 "max": 2,  # TODO: confirm if multiple imaging modalities are separated
                 "condition": CONDITION_ENUM.NONE,
             },
-        ],
+        ),
     },
 
     "geometry": {
         "shape": SHAPE_ENUM.RECTANGULAR,
-        "dimensionModels": [
+        "dimensionModels": (
             {
                 "label": "intraoral_or_pano",
                 "treatmentRoomsMin": 4,
@@ -4797,7 +4421,7 @@ IMAGING_RULES = {
                 "longAxisVariable": False,
                 "longAxisIncrementPerDoorInches": None,
             },
-        ],
+        ),
         "fallbackStrategy": GEOMETRY_FALLBACK_ENUM.MINIMUM,
     },
 
@@ -4823,15 +4447,8 @@ IMAGING_RULES = {
     },
 
     "access": {
-        "entryCountRules": [
-            {
-                "treatmentRoomsMin": None,
-                "treatmentRoomsMax": None,
-                "minEntries": 1,
-                "maxEntries": 1,
-            }
-        ],
-        "entryConstraints": [
+        "entryCountRules": _ONE_ENTRY,
+        "entryConstraints": (
             {
                 # Must be accessed from clinical circulation
                 "kind": ENTRY_RULE_ENUM.ENTRY_FROM,
@@ -4839,50 +4456,44 @@ IMAGING_RULES = {
                 "distanceMaxInches": None,
                 "hard": True,
             },
-        ],
-        "ada": {
-            "minClearWidthInches": 36,
-            "requiredEntries": 1,
-        },
+        ),
+        "ada": _ADA_WIDE,
     },
 
     "adjacency": {
-        "direct": [],
-        "preferredProximity": [
+        "direct": (),
+        "preferredProximity": (
             {
                 # Imaging should be near treatment rooms
                 "target": SPACE_GROUP.CLINICAL,
                 "maxDistanceInches": 240,  # ~20'
                 "optimizationWeight": 0.8,
             },
-        ],
-        "separation": [
+        ),
+        "separation": (
             {
                 # Keep imaging away from public spaces
                 "target": SPACE_GROUP.PUBLIC,
                 "hard": True,
             },
-        ],
+        ),
     },
 
     "visibility": {
-        "mustBeHiddenFrom": [
-            {
-                "target": SPACE_GROUP.PUBLIC,
-                "hard": True,
-            }
-        ],
-        "mustBeVisibleFrom": [],
+        "mustBeHiddenFrom": _targets(
+            (SPACE_GROUP.PUBLIC, True),
+        ),
+        "mustBeVisibleFrom": (),
     },
 
     "circulation": {
         "role": CIRCULATION_ROLE_ENUM.DESTINATION,
-        "mustConnect": [
+        "mustConnect": (
             SPACE_GROUP.CLINICAL,
-        ],
-        "mustNotTerminateInto": [
+        ),
+        "mustNotTerminateInto": (
             SPACE_GROUP.PUBLIC,
-        ],
+        ),
     },
 
     "optimization": {
@@ -4894,11 +4505,11 @@ IMAGING_RULES = {
             "sameCategoryBonus": 0.8,
         },
     },
-}
+})
 
 # Photo Room
 
-PHOTO_RULES = {
+PHOTO_RULES = _freeze({
 
     "identity": {
         "roomType": SPACE_ID.PHOTO,
@@ -4912,7 +4523,7 @@ PHOTO_RULES = {
 
     "existence": {
         "trigger": TRIGGER_ENUM.DERIVED,
-        "countRules": [
+        "countRules": (
             {
                 # Often present in ortho / cosmetic practices
                 "driver": COUNT_DRIVER_ENUM.TREATMENT_ROOMS,
@@ -4927,12 +4538,12 @@ PHOTO_RULES = {
                 "max": 1,
                 "condition": CONDITION_ENUM.NONE,
             },
-        ],
+        ),
     },
 
     "geometry": {
         "shape": SHAPE_ENUM.RECTANGULAR,
-        "dimensionModels": [
+        "dimensionModels": (
             {
                 "label": "standard_photo",
                 "treatmentRoomsMin": 6,
@@ -4943,90 +4554,60 @@ PHOTO_RULES = {
                 "longAxisVariable": True,
                 "longAxisIncrementPerDoorInches": None,
             },
-        ],
+        ),
         "fallbackStrategy": GEOMETRY_FALLBACK_ENUM.MINIMUM,
     },
 
-    "orientation": {
-        LAYOUT_ENUM.NARROW: {
-            "allowed": True,
-            "longAxisRelation": AXIS_RELATION_ENUM.PARALLEL,
-            "placementHint": PLACEMENT_ENUM.BACK,
-            "connectsCorridors": False,
-        },
-        LAYOUT_ENUM.THREE_LAYER_CAKE: {
-            "allowed": True,
-            "longAxisRelation": AXIS_RELATION_ENUM.PARALLEL,
-            "placementHint": PLACEMENT_ENUM.BACK,
-            "connectsCorridors": False,
-        },
-        LAYOUT_ENUM.H_LAYOUT: {
-            "allowed": True,
-            "longAxisRelation": AXIS_RELATION_ENUM.PARALLEL,
-            "placementHint": PLACEMENT_ENUM.BACK,
-            "connectsCorridors": False,
-        },
-    },
+    "orientation": _all_layouts({
+        "allowed": True,
+        "longAxisRelation": AXIS_RELATION_ENUM.PARALLEL,
+        "placementHint": PLACEMENT_ENUM.BACK,
+        "connectsCorridors": False,
+    }),
 
     "access": {
-        "entryCountRules": [
-            {
-                "treatmentRoomsMin": None,
-                "treatmentRoomsMax": None,
-                "minEntries": 1,
-                "maxEntries": 1,
-            }
-        ],
-        "entryConstraints": [
+        "entryCountRules": _ONE_ENTRY,
+        "entryConstraints": (
             {
                 "kind": ENTRY_RULE_ENUM.ENTRY_FROM,
                 "target": SPACE_GROUP.CLINICAL,
                 "distanceMaxInches": None,
                 "hard": True,
             },
-        ],
-        "ada": {
-            "minClearWidthInches": 36,
-            "requiredEntries": 1,
-        },
+        ),
+        "ada": _ADA_WIDE,
     },
 
     "adjacency": {
-        "direct": [],
-        "preferredProximity": [
+        "direct": (),
+        "preferredProximity": (
             {
                 # Often paired with imaging or consult
                 "target": SPACE_ID.IMAGING,
                 "maxDistanceInches": 180,  # ~15'
                 "optimizationWeight": 0.6,
             },
-        ],
-        "separation": [
-            {
-                "target": SPACE_GROUP.PUBLIC,
-                "hard": True,
-            },
-        ],
+        ),
+        "separation": _targets(
+            (SPACE_GROUP.PUBLIC, True),
+        ),
     },
 
     "visibility": {
-        "mustBeHiddenFrom": [
-            {
-                "target": SPACE_GROUP.PUBLIC,
-                "hard": True,
-            }
-        ],
-        "mustBeVisibleFrom": [],
+        "mustBeHiddenFrom": _targets(
+            (SPACE_GROUP.PUBLIC, True),
+        ),
+        "mustBeVisibleFrom": (),
     },
 
     "circulation": {
         "role": CIRCULATION_ROLE_ENUM.DESTINATION,
-        "mustConnect": [
+        "mustConnect": (
             SPACE_GROUP.CLINICAL,
-        ],
-        "mustNotTerminateInto": [
+        ),
+        "mustNotTerminateInto": (
             SPACE_GROUP.PUBLIC,
-        ],
+        ),
     },
 
     "optimization": {
@@ -5038,11 +4619,11 @@ PHOTO_RULES = {
             "sameCategoryBonus": 0.7,
         },
     },
-}
+})
 
 # Multi Stall Restroom
 
-MULTI_STALLS_RULES = {
+MULTI_STALLS_RULES = _freeze({
 
     "identity": {
         "roomType": SPACE_ID.MULTI_STALLS,
@@ -5056,7 +4637,7 @@ MULTI_STALLS_RULES = {
 
     "existence": {
         "trigger": TRIGGER_ENUM.DERIVED,
-        "countRules": [
+        "countRules": (
             {
                 # Multi-stall restrooms appear once patient volume exceeds a threshold
                 "driver": COUNT_DRIVER_ENUM.TREATMENT_ROOMS,
@@ -5071,12 +4652,12 @@ MULTI_STALLS_RULES = {
                 "max": 2,  # TODO: confirm if gender-separated or duplicated per wing
                 "condition": CONDITION_ENUM.NONE,
             },
-        ],
+        ),
     },
 
     "geometry": {
         "shape": SHAPE_ENUM.RECTILINEAR,
-        "dimensionModels": [
+        "dimensionModels": (
             {
                 "label": "two_to_three_stalls",
                 "treatmentRoomsMin": 8,
@@ -5097,7 +4678,7 @@ MULTI_STALLS_RULES = {
                 "longAxisVariable": True,
                 "longAxisIncrementPerDoorInches": 36,
             },
-        ],
+        ),
         "fallbackStrategy": GEOMETRY_FALLBACK_ENUM.EXPAND_LONG_AXIS,
     },
 
@@ -5123,15 +4704,8 @@ MULTI_STALLS_RULES = {
     },
 
     "access": {
-        "entryCountRules": [
-            {
-                "treatmentRoomsMin": None,
-                "treatmentRoomsMax": None,
-                "minEntries": 1,
-                "maxEntries": 1,
-            }
-        ],
-        "entryConstraints": [
+        "entryCountRules": _ONE_ENTRY,
+        "entryConstraints": (
             {
                 # Must be accessed from public circulation
                 "kind": ENTRY_RULE_ENUM.ENTRY_FROM,
@@ -5146,24 +4720,21 @@ MULTI_STALLS_RULES = {
                 "distanceMaxInches": 120,
                 "hard": False,
             },
-        ],
-        "ada": {
-            "minClearWidthInches": 36,
-            "requiredEntries": 1,
-        },
+        ),
+        "ada": _ADA_WIDE,
     },
 
     "adjacency": {
-        "direct": [],
-        "preferredProximity": [
+        "direct": (),
+        "preferredProximity": (
             {
                 # Should be near waiting / reception
                 "target": SPACE_GROUP.PUBLIC,
                 "maxDistanceInches": 300,  # ~25'
                 "optimizationWeight": 0.8,
             },
-        ],
-        "separation": [
+        ),
+        "separation": (
             {
                 # Should not open directly into clinical rooms
                 "target": SPACE_GROUP.CLINICAL,
@@ -5174,28 +4745,28 @@ MULTI_STALLS_RULES = {
                 "target": SPACE_ID.STERILIZATION,
                 "hard": True,
             },
-        ],
+        ),
     },
 
     "visibility": {
-        "mustBeHiddenFrom": [
+        "mustBeHiddenFrom": (
             {
                 # Restroom interiors must not be visible from public spaces
                 "target": SPACE_GROUP.PUBLIC,
                 "hard": True,
-            }
-        ],
-        "mustBeVisibleFrom": [],
+            },
+        ),
+        "mustBeVisibleFrom": (),
     },
 
     "circulation": {
         "role": CIRCULATION_ROLE_ENUM.DESTINATION,
-        "mustConnect": [
+        "mustConnect": (
             SPACE_GROUP.PUBLIC,
-        ],
-        "mustNotTerminateInto": [
+        ),
+        "mustNotTerminateInto": (
             SPACE_GROUP.CLINICAL,
-        ],
+        ),
     },
 
     "optimization": {
@@ -5207,11 +4778,11 @@ MULTI_STALLS_RULES = {
             "sameCategoryBonus": 0.6,
         },
     },
-}
+})
 
 # Toy Room
 
-TOY_RULES = {
+TOY_RULES = _freeze({
 
     "identity": {
         "roomType": SPACE_ID.TOY,
@@ -5225,7 +4796,7 @@ TOY_RULES = {
 
     "existence": {
         "trigger": TRIGGER_ENUM.DERIVED,
-        "countRules": [
+        "countRules": (
             {
                 # Only needed if clinic serves children
                 "driver": COUNT_DRIVER_ENUM.TREATMENT_ROOMS,
@@ -5240,12 +4811,12 @@ TOY_RULES = {
                 "max": 1,
                 "condition": CONDITION_ENUM.NONE,
             },
-        ],
+        ),
     },
 
     "geometry": {
         "shape": SHAPE_ENUM.RECTILINEAR,
-        "dimensionModels": [
+        "dimensionModels": (
             {
                 "label": "toy_alcove",
                 "treatmentRoomsMin": 4,
@@ -5266,7 +4837,7 @@ TOY_RULES = {
                 "longAxisVariable": True,
                 "longAxisIncrementPerDoorInches": None,
             },
-        ],
+        ),
         "fallbackStrategy": GEOMETRY_FALLBACK_ENUM.NEAREST_MATCH,
     },
 
@@ -5292,15 +4863,8 @@ TOY_RULES = {
     },
 
     "access": {
-        "entryCountRules": [
-            {
-                "treatmentRoomsMin": None,
-                "treatmentRoomsMax": None,
-                "minEntries": 1,
-                "maxEntries": 1,
-            }
-        ],
-        "entryConstraints": [
+        "entryCountRules": _ONE_ENTRY,
+        "entryConstraints": (
             {
                 # Must be accessed from a public or waiting area
                 "kind": ENTRY_RULE_ENUM.ENTRY_FROM,
@@ -5315,58 +4879,55 @@ TOY_RULES = {
                 "distanceMaxInches": 120,
                 "hard": False,
             },
-        ],
-        "ada": {
-            "minClearWidthInches": 36,
-            "requiredEntries": 1,
-        },
+        ),
+        "ada": _ADA_WIDE,
     },
 
     "adjacency": {
-        "direct": [
+        "direct": (
             {
                 # Commonly adjacent to children’s waiting
                 "target": SPACE_ID.CHILDRENS,
                 "condition": CONDITION_ENUM.IF_PRESENT,
                 "hard": False,
             },
-        ],
-        "preferredProximity": [
+        ),
+        "preferredProximity": (
             {
                 # Should be near waiting for supervision
                 "target": SPACE_ID.PATIENT_LOUNGE,
                 "maxDistanceInches": 120,  # ~10'
                 "optimizationWeight": 0.9,
             },
-        ],
-        "separation": [
+        ),
+        "separation": (
             {
                 # Should not be adjacent to imaging or lab
                 "target": SPACE_GROUP.CLINICAL,
                 "hard": False,
             },
-        ],
+        ),
     },
 
     "visibility": {
-        "mustBeHiddenFrom": [],
-        "mustBeVisibleFrom": [
+        "mustBeHiddenFrom": (),
+        "mustBeVisibleFrom": (
             {
                 # Prefer line-of-sight from waiting / reception
                 "target": SPACE_ID.PATIENT_LOUNGE,
                 "hard": False,
             },
-        ],
+        ),
     },
 
     "circulation": {
         "role": CIRCULATION_ROLE_ENUM.DESTINATION,
-        "mustConnect": [
+        "mustConnect": (
             SPACE_GROUP.PUBLIC,
-        ],
-        "mustNotTerminateInto": [
+        ),
+        "mustNotTerminateInto": (
             SPACE_GROUP.CLINICAL,
-        ],
+        ),
     },
 
     "optimization": {
@@ -5378,11 +4939,11 @@ TOY_RULES = {
             "sameCategoryBonus": 0.7,
         },
     },
-}
+})
 
 # Universal Room
 
-UNIVERSAL_RULES = {
+UNIVERSAL_RULES = _freeze({
 
     "identity": {
         "roomType": SPACE_ID.UNIVERSAL,
@@ -5396,7 +4957,7 @@ UNIVERSAL_RULES = {
 
     "existence": {
         "trigger": TRIGGER_ENUM.DERIVED,
-        "countRules": [
+        "countRules": (
             {
                 # Optional but common in medium+ clinics
                 "driver": COUNT_DRIVER_ENUM.TREATMENT_ROOMS,
@@ -5411,12 +4972,12 @@ UNIVERSAL_RULES = {
                 "max": 2,
                 "condition": CONDITION_ENUM.NONE,
             },
-        ],
+        ),
     },
 
     "geometry": {
         "shape": SHAPE_ENUM.RECTANGULAR,
-        "dimensionModels": [
+        "dimensionModels": (
             {
                 "label": "small_universal",
                 "treatmentRoomsMin": 6,
@@ -5437,7 +4998,7 @@ UNIVERSAL_RULES = {
                 "longAxisVariable": True,
                 "longAxisIncrementPerDoorInches": None,
             },
-        ],
+        ),
         "fallbackStrategy": GEOMETRY_FALLBACK_ENUM.NEAREST_MATCH,
     },
 
@@ -5463,15 +5024,8 @@ UNIVERSAL_RULES = {
     },
 
     "access": {
-        "entryCountRules": [
-            {
-                "treatmentRoomsMin": None,
-                "treatmentRoomsMax": None,
-                "minEntries": 1,
-                "maxEntries": 1,
-            }
-        ],
-        "entryConstraints": [
+        "entryCountRules": _ONE_ENTRY,
+        "entryConstraints": (
             {
                 # Must connect to clinical circulation
                 "kind": ENTRY_RULE_ENUM.ENTRY_FROM,
@@ -5479,58 +5033,55 @@ UNIVERSAL_RULES = {
                 "distanceMaxInches": None,
                 "hard": True,
             },
-        ],
-        "ada": {
-            "minClearWidthInches": 36,
-            "requiredEntries": 1,
-        },
+        ),
+        "ada": _ADA_WIDE,
     },
 
     "adjacency": {
-        "direct": [
+        "direct": (
             {
                 # Always clinical-facing
                 "target": SPACE_ID.CLINICAL_CORRIDOR,
                 "condition": CONDITION_ENUM.NONE,
                 "hard": True,
             },
-        ],
-        "preferredProximity": [
+        ),
+        "preferredProximity": (
             {
                 # Useful near consult or imaging
                 "target": SPACE_GROUP.CLINICAL,
                 "maxDistanceInches": 240,  # ~20'
                 "optimizationWeight": 0.6,
             },
-        ],
-        "separation": [
+        ),
+        "separation": (
             {
                 # Avoid public-facing adjacency due to variable use
                 "target": SPACE_GROUP.PUBLIC,
                 "hard": False,
             },
-        ],
+        ),
     },
 
     "visibility": {
-        "mustBeHiddenFrom": [
+        "mustBeHiddenFrom": (
             {
                 # Avoid exposure to waiting / reception
                 "target": SPACE_GROUP.PUBLIC,
                 "hard": False,
             },
-        ],
-        "mustBeVisibleFrom": [],
+        ),
+        "mustBeVisibleFrom": (),
     },
 
     "circulation": {
         "role": CIRCULATION_ROLE_ENUM.DESTINATION,
-        "mustConnect": [
+        "mustConnect": (
             SPACE_ID.CLINICAL_CORRIDOR,
-        ],
-        "mustNotTerminateInto": [
+        ),
+        "mustNotTerminateInto": (
             SPACE_GROUP.PUBLIC,
-        ],
+        ),
     },
 
     "optimization": {
@@ -5543,11 +5094,11 @@ UNIVERSAL_RULES = {
             "sameCategoryBonus": 0.6,
         },
     },
-}
+})
 
 # Hygiene Room
 
-HYGIENE_RULES = {
+HYGIENE_RULES = _freeze({
 
     "identity": {
         "roomType": SPACE_ID.HYGIENE,
@@ -5560,19 +5111,19 @@ HYGIENE_RULES = {
 
     "existence": {
         "trigger": TRIGGER_ENUM.ALWAYS,
-        "countRules": [
+        "countRules": (
             {
                 "driver": COUNT_DRIVER_ENUM.TREATMENT_ROOMS,
                 "min": 1,
                 "max": None,
                 "condition": CONDITION_ENUM.NONE,
             },
-        ],
+        ),
     },
 
     "geometry": {
         "shape": SHAPE_ENUM.RECTANGULAR,
-        "dimensionModels": [
+        "dimensionModels": (
             {
                 "label": "small_hygiene",
                 "treatmentRoomsMin": 1,
@@ -5593,7 +5144,7 @@ HYGIENE_RULES = {
                 "longAxisVariable": True,
                 "longAxisIncrementPerDoorInches": None,
             },
-        ],
+        ),
         "fallbackStrategy": GEOMETRY_FALLBACK_ENUM.NEAREST_MATCH,
     },
 
@@ -5619,72 +5170,56 @@ HYGIENE_RULES = {
     },
 
     "access": {
-        "entryCountRules": [
+        "entryCountRules": (
             {
                 "treatmentRoomsMin": 1,
                 "treatmentRoomsMax": 2,
                 "minEntries": 1,
                 "maxEntries": 2,
-            }
-        ],
-        "entryConstraints": [
+            },
+        ),
+        "entryConstraints": (
             {
                 "kind": ENTRY_RULE_ENUM.ENTRY_FROM,
                 "target": SPACE_ID.CLINICAL_CORRIDOR,
                 "distanceMaxInches": 60,  # ~5' from corridor
                 "hard": True,
-            }
-        ],
-        "ada": {
-            "minClearWidthInches": 36,
-            "requiredEntries": 1,
-        },
+            },
+        ),
+        "ada": _ADA_WIDE,
     },
 
     "adjacency": {
-        "direct": [
-            {
-                "target": SPACE_ID.CLINICAL_CORRIDOR,
-                "condition": CONDITION_ENUM.NONE,
-                "hard": True,
-            },
-        ],
-        "preferredProximity": [
+        "direct": _adjacent(
+            (SPACE_ID.CLINICAL_CORRIDOR, CONDITION_ENUM.NONE, True),
+        ),
+        "preferredProximity": (
             {
                 "target": SPACE_GROUP.CLINICAL,
                 "maxDistanceInches": 120,  # ~10'
                 "optimizationWeight": 0.8,
             },
-        ],
-        "separation": [
-            {
-                "target": SPACE_GROUP.PUBLIC,
-                "hard": False,
-            },
-        ],
+        ),
+        "separation": _targets(
+            (SPACE_GROUP.PUBLIC, False),
+        ),
     },
 
     "visibility": {
-        "mustBeHiddenFrom": [
-            {
-                "target": SPACE_GROUP.PUBLIC,
-                "hard": False,
-            }
-        ],
-        "mustBeVisibleFrom": [
-            {
-                "target": SPACE_ID.CLINICAL_CORRIDOR,
-                "hard": True,
-            }
-        ],
+        "mustBeHiddenFrom": _targets(
+            (SPACE_GROUP.PUBLIC, False),
+        ),
+        "mustBeVisibleFrom": _targets(
+            (SPACE_ID.CLINICAL_CORRIDOR, True),
+        ),
     },
 
     "circulation": {
         "role": CIRCULATION_ROLE_ENUM.CONNECTOR,
-        "mustConnect": [
+        "mustConnect": (
             SPACE_ID.CLINICAL_CORRIDOR,
-        ],
-        "mustNotTerminateInto": [],
+        ),
+        "mustNotTerminateInto": (),
     },
 
     "optimization": {
@@ -5696,11 +5231,11 @@ HYGIENE_RULES = {
             "sameCategoryBonus": 0.7,
         },
     },
-}
+})
 
 # Private Room
 
-PRIVATE_RULES = {
+PRIVATE_RULES = _freeze({
 
     "identity": {
         "roomType": SPACE_ID.PRIVATE,
@@ -5713,19 +5248,19 @@ PRIVATE_RULES = {
 
     "existence": {
         "trigger": TRIGGER_ENUM.DERIVED,
-        "countRules": [
+        "countRules": (
             {
                 "driver": COUNT_DRIVER_ENUM.OCCUPANCY,
                 "min": 1,
                 "max": None,
                 "condition": CONDITION_ENUM.NONE,
             },
-        ],
+        ),
     },
 
     "geometry": {
         "shape": SHAPE_ENUM.RECTANGULAR,
-        "dimensionModels": [
+        "dimensionModels": (
             {
                 "label": "small_private",
                 "treatmentRoomsMin": 1,
@@ -5746,7 +5281,7 @@ PRIVATE_RULES = {
                 "longAxisVariable": True,
                 "longAxisIncrementPerDoorInches": None,
             },
-        ],
+        ),
         "fallbackStrategy": GEOMETRY_FALLBACK_ENUM.NEAREST_MATCH,
     },
 
@@ -5772,72 +5307,59 @@ PRIVATE_RULES = {
     },
 
     "access": {
-        "entryCountRules": [
+        "entryCountRules": (
             {
                 "treatmentRoomsMin": 1,
                 "treatmentRoomsMax": 2,
                 "minEntries": 1,
                 "maxEntries": 1,
-            }
-        ],
-        "entryConstraints": [
+            },
+        ),
+        "entryConstraints": (
             {
                 "kind": ENTRY_RULE_ENUM.ENTRY_FROM,
                 "target": SPACE_ID.CLINICAL_CORRIDOR,
                 "distanceMaxInches": 60,  # ~5' from corridor
                 "hard": True,
-            }
-        ],
-        "ada": {
-            "minClearWidthInches": 36,
-            "requiredEntries": 1,
-        },
+            },
+        ),
+        "ada": _ADA_WIDE,
     },
 
     "adjacency": {
-        "direct": [
-            {
-                "target": SPACE_ID.CLINICAL_CORRIDOR,
-                "condition": CONDITION_ENUM.NONE,
-                "hard": True,
-            },
-        ],
-        "preferredProximity": [
+        "direct": _adjacent(
+            (SPACE_ID.CLINICAL_CORRIDOR, CONDITION_ENUM.NONE, True),
+        ),
+        "preferredProximity": (
             {
                 "target": SPACE_GROUP.CLINICAL,
                 "maxDistanceInches": 120,  # ~10'
                 "optimizationWeight": 0.9,
             },
-        ],
-        "separation": [
+        ),
+        "separation": (
             {
                 "target": SPACE_GROUP.PUBLIC,
                 "hard": True,  # Ensure privacy
             },
-        ],
+        ),
     },
 
     "visibility": {
-        "mustBeHiddenFrom": [
-            {
-                "target": SPACE_GROUP.PUBLIC,
-                "hard": True,
-            }
-        ],
-        "mustBeVisibleFrom": [
-            {
-                "target": SPACE_ID.CLINICAL_CORRIDOR,
-                "hard": False,
-            }
-        ],
+        "mustBeHiddenFrom": _targets(
+            (SPACE_GROUP.PUBLIC, True),
+        ),
+        "mustBeVisibleFrom": _targets(
+            (SPACE_ID.CLINICAL_CORRIDOR, False),
+        ),
     },
 
     "circulation": {
         "role": CIRCULATION_ROLE_ENUM.DESTINATION,
-        "mustConnect": [
+        "mustConnect": (
             SPACE_ID.CLINICAL_CORRIDOR,
-        ],
-        "mustNotTerminateInto": [],
+        ),
+        "mustNotTerminateInto": (),
     },
 
     "optimization": {
@@ -5849,11 +5371,11 @@ PRIVATE_RULES = {
             "sameCategoryBonus": 0.7,
         },
     },
-}
+})
 
 # Surgical Room
 
-SURGICAL_RULES = {
+SURGICAL_RULES = _freeze({
 
     "identity": {
         "roomType": SPACE_ID.SURGICAL,
@@ -5867,19 +5389,19 @@ SURGICAL_RULES = {
 
     "existence": {
         "trigger": TRIGGER_ENUM.DERIVED,
-        "countRules": [
+        "countRules": (
             {
                 "driver": COUNT_DRIVER_ENUM.OCCUPANCY,
                 "min": 1,
                 "max": None,
                 "condition": CONDITION_ENUM.NONE,
             },
-        ],
+        ),
     },
 
     "geometry": {
         "shape": SHAPE_ENUM.RECTANGULAR,
-        "dimensionModels": [
+        "dimensionModels": (
             {
                 "label": "standard_surgical",
                 "treatmentRoomsMin": 1,
@@ -5890,7 +5412,7 @@ SURGICAL_RULES = {
                 "longAxisVariable": True,
                 "longAxisIncrementPerDoorInches": 24,
             },
-        ],
+        ),
         "fallbackStrategy": GEOMETRY_FALLBACK_ENUM.NEAREST_MATCH,
     },
 
@@ -5916,37 +5438,34 @@ SURGICAL_RULES = {
     },
 
     "access": {
-        "entryCountRules": [
+        "entryCountRules": (
             {
                 "treatmentRoomsMin": 1,
                 "treatmentRoomsMax": 1,
                 "minEntries": 1,
                 "maxEntries": 1,
-            }
-        ],
-        "entryConstraints": [
+            },
+        ),
+        "entryConstraints": (
             {
                 "kind": ENTRY_RULE_ENUM.ENTRY_FROM,
                 "target": SPACE_GROUP.CLINICAL,
                 "distanceMaxInches": 60,  # ~5' from corridor
                 "hard": True,
-            }
-        ],
-        "ada": {
-            "minClearWidthInches": 44,
-            "requiredEntries": 1,
-        },
+            },
+        ),
+        "ada": _ADA_CORRIDOR,
     },
 
     "adjacency": {
-        "direct": [
+        "direct": (
             {
                 "target": SPACE_GROUP.PRIVATE,  # prep, scrub, recovery
                 "condition": CONDITION_ENUM.NONE,
                 "hard": True,
             },
-        ],
-        "preferredProximity": [
+        ),
+        "preferredProximity": (
             {
                 "target": SPACE_ID.STERILIZATION,
                 "maxDistanceInches": 120,  # ~10'
@@ -5957,42 +5476,30 @@ SURGICAL_RULES = {
                 "maxDistanceInches": 72,   # ~6'
                 "optimizationWeight": 0.8,
             }
-        ],
-        "separation": [
-            {
-                "target": SPACE_GROUP.PUBLIC,
-                "hard": True,
-            },
-            {
-                "target": SPACE_GROUP.FRONT_OF_HOUSE,
-                "hard": True,
-            }
-        ],
+        ),
+        "separation": _targets(
+            (SPACE_GROUP.PUBLIC, True),
+            (SPACE_GROUP.FRONT_OF_HOUSE, True),
+        ),
     },
 
     "visibility": {
-        "mustBeHiddenFrom": [
-            {
-                "target": SPACE_GROUP.PUBLIC,
-                "hard": True,
-            }
-        ],
-        "mustBeVisibleFrom": [
-            {
-                "target": SPACE_GROUP.CLINICAL,
-                "hard": False,
-            }
-        ],
+        "mustBeHiddenFrom": _targets(
+            (SPACE_GROUP.PUBLIC, True),
+        ),
+        "mustBeVisibleFrom": _targets(
+            (SPACE_GROUP.CLINICAL, False),
+        ),
     },
 
     "circulation": {
         "role": CIRCULATION_ROLE_ENUM.DESTINATION,
-        "mustConnect": [
+        "mustConnect": (
             SPACE_ID.CLINICAL_CORRIDOR,
-        ],
-        "mustNotTerminateInto": [
+        ),
+        "mustNotTerminateInto": (
             SPACE_ID.PATIENT_LOUNGE,
-        ],
+        ),
     },
 
     "optimization": {
@@ -6004,11 +5511,11 @@ SURGICAL_RULES = {
             "sameCategoryBonus": 1.0,
         },
     },
-}
+})
 
 # Open Bay Room
 
-OPEN_BAY_RULES = {
+OPEN_BAY_RULES = _freeze({
 
     "identity": {
         "roomType": SPACE_ID.OPEN_BAY,
@@ -6022,19 +5529,19 @@ OPEN_BAY_RULES = {
 
     "existence": {
         "trigger": TRIGGER_ENUM.ALWAYS,
-        "countRules": [
+        "countRules": (
             {
                 "driver": COUNT_DRIVER_ENUM.OCCUPANCY,
                 "min": 1,
                 "max": None,
                 "condition": CONDITION_ENUM.NONE,
             },
-        ],
+        ),
     },
 
     "geometry": {
         "shape": SHAPE_ENUM.RECTANGULAR,
-        "dimensionModels": [
+        "dimensionModels": (
             {
                 "label": "standard_open_bay",
                 "treatmentRoomsMin": 1,
@@ -6045,7 +5552,7 @@ OPEN_BAY_RULES = {
                 "longAxisVariable": True,
                 "longAxisIncrementPerDoorInches": 24,
             },
-        ],
+        ),
         "fallbackStrategy": GEOMETRY_FALLBACK_ENUM.NEAREST_MATCH,
     },
 
@@ -6071,70 +5578,60 @@ OPEN_BAY_RULES = {
     },
     
     "access": {
-        "entryCountRules": [
+        "entryCountRules": (
             {
                 "treatmentRoomsMin": 1,
                 "treatmentRoomsMax": 2,
                 "minEntries": 1,
                 "maxEntries": 2,
-            }
-        ],
-        "entryConstraints": [
+            },
+        ),
+        "entryConstraints": (
             {
                 "kind": ENTRY_RULE_ENUM.ENTRY_FROM,
                 "target": SPACE_GROUP.CLINICAL,
                 "distanceMaxInches": 60,  # ~5' max from corridor
                 "hard": True,
-            }
-        ],
-        "ada": {
-            "minClearWidthInches": 44,
-            "requiredEntries": 1,
-        },
+            },
+        ),
+        "ada": _ADA_CORRIDOR,
     },
 
     "adjacency": {
-        "direct": [
-            {
-                "target": SPACE_ID.NURSING,
-                "condition": CONDITION_ENUM.NONE,
-                "hard": True,
-            },
-        ],
-        "preferredProximity": [
+        "direct": _adjacent(
+            (SPACE_ID.NURSING, CONDITION_ENUM.NONE, True),
+        ),
+        "preferredProximity": (
             {
                 "target": SPACE_GROUP.SUPPORT,
                 "maxDistanceInches": 120,  # ~10'
                 "optimizationWeight": 1.0,
-            }
-        ],
-        "separation": [
-            {
-                "target": SPACE_GROUP.PUBLIC,
-                "hard": True,
-            }
-        ],
+            },
+        ),
+        "separation": _targets(
+            (SPACE_GROUP.PUBLIC, True),
+        ),
     },
 
     "visibility": {
-        "mustBeHiddenFrom": [],
-        "mustBeVisibleFrom": [
+        "mustBeHiddenFrom": (),
+        "mustBeVisibleFrom": (
             {
                 "target": SPACE_ID.NURSING,
                 "hard": True,
-            }
-        ],
+            },
+        ),
     },
 
     "circulation": {
         "role": CIRCULATION_ROLE_ENUM.DESTINATION,
-        "mustConnect": [
+        "mustConnect": (
             SPACE_ID.CLINICAL_CORRIDOR,
             SPACE_ID.NURSING,
-        ],
-        "mustNotTerminateInto": [
+        ),
+        "mustNotTerminateInto": (
             SPACE_ID.PATIENT_LOUNGE,
-        ],
+        ),
     },
 
     "optimization": {
@@ -6146,11 +5643,11 @@ OPEN_BAY_RULES = {
             "sameCategoryBonus": 1.0,
         },
     },
-}
+})
 
 # Brushing Station
 
-BRUSHING_STATION_RULES = {
+BRUSHING_STATION_RULES = _freeze({
 
     "identity": {
         "roomType": SPACE_ID.BRUSHING_STATION,
@@ -6164,7 +5661,7 @@ BRUSHING_STATION_RULES = {
 
     "existence": {
         "trigger": TRIGGER_ENUM.DERIVED,
-        "countRules": [
+        "countRules": (
             {
                 # One brushing station cluster per clinic is typical
                 "driver": COUNT_DRIVER_ENUM.FIXED,
@@ -6179,12 +5676,12 @@ BRUSHING_STATION_RULES = {
                 "max": None,
                 "condition": CONDITION_ENUM.IF_THRESHOLD,
             },
-        ],
+        ),
     },
 
     "geometry": {
         "shape": SHAPE_ENUM.RECTILINEAR,
-        "dimensionModels": [
+        "dimensionModels": (
             {
                 "label": "compact_brushing_station",
                 "treatmentRoomsMin": None,
@@ -6205,7 +5702,7 @@ BRUSHING_STATION_RULES = {
                 "longAxisVariable": True,
                 "longAxisIncrementPerDoorInches": 24,
             },
-        ],
+        ),
         "fallbackStrategy": GEOMETRY_FALLBACK_ENUM.MINIMUM,
     },
 
@@ -6231,15 +5728,8 @@ BRUSHING_STATION_RULES = {
     },
 
     "access": {
-        "entryCountRules": [
-            {
-                "treatmentRoomsMin": None,
-                "treatmentRoomsMax": None,
-                "minEntries": 1,
-                "maxEntries": 2,
-            }
-        ],
-        "entryConstraints": [
+        "entryCountRules": _ONE_OR_TWO_ENTRIES,
+        "entryConstraints": (
             {
                 # Should be accessible from public circulation
                 "kind": ENTRY_RULE_ENUM.ENTRY_FROM,
@@ -6247,23 +5737,20 @@ BRUSHING_STATION_RULES = {
                 "distanceMaxInches": None,
                 "hard": True,
             },
-        ],
-        "ada": {
-            "minClearWidthInches": 36,
-            "requiredEntries": 1,
-        },
+        ),
+        "ada": _ADA_WIDE,
     },
 
     "adjacency": {
-        "direct": [
+        "direct": (
             {
                 # Often directly adjacent to waiting or hygiene areas
                 "target": SPACE_ID.PATIENT_LOUNGE,
                 "condition": CONDITION_ENUM.NONE,
                 "hard": False,
             },
-        ],
-        "preferredProximity": [
+        ),
+        "preferredProximity": (
             {
                 "target": SPACE_GROUP.CLINICAL,
                 "maxDistanceInches": 240,  # ~20'
@@ -6274,41 +5761,41 @@ BRUSHING_STATION_RULES = {
                 "maxDistanceInches": 180,  # ~15'
                 "optimizationWeight": 0.8,
             },
-        ],
-        "separation": [
+        ),
+        "separation": (
             {
                 # Avoid sterile or surgical spaces
                 "target": SPACE_GROUP.CLINICAL,
                 "hard": True,
             },
-        ],
+        ),
     },
 
     "visibility": {
-        "mustBeHiddenFrom": [
+        "mustBeHiddenFrom": (
             {
                 # Avoid visibility from private or staff-only spaces
                 "target": SPACE_GROUP.PRIVATE,
                 "hard": False,
             },
-        ],
-        "mustBeVisibleFrom": [
+        ),
+        "mustBeVisibleFrom": (
             {
                 # Staff or parents should have passive visibility
                 "target": SPACE_GROUP.PUBLIC,
                 "hard": False,
             },
-        ],
+        ),
     },
 
     "circulation": {
         "role": CIRCULATION_ROLE_ENUM.DESTINATION,
-        "mustConnect": [
+        "mustConnect": (
             SPACE_ID.PATIENT_LOUNGE,
-        ],
-        "mustNotTerminateInto": [
+        ),
+        "mustNotTerminateInto": (
             SPACE_GROUP.CLINICAL,
-        ],
+        ),
     },
 
     "optimization": {
@@ -6320,11 +5807,11 @@ BRUSHING_STATION_RULES = {
             "sameCategoryBonus": 0.8,
         },
     },
-}
+})
 
 # Recovery Room
 
-RECOVERY_RULES = {
+RECOVERY_RULES = _freeze({
 
     "identity": {
         "roomType": SPACE_ID.RECOVERY,
@@ -6338,7 +5825,7 @@ RECOVERY_RULES = {
 
     "existence": {
         "trigger": TRIGGER_ENUM.DERIVED,
-        "countRules": [
+        "countRules": (
             {
                 # Recovery required when surgical or sedation procedures exist
                 "driver": COUNT_DRIVER_ENUM.TREATMENT_ROOMS,
@@ -6353,12 +5840,12 @@ RECOVERY_RULES = {
                 "max": None,
                 "condition": CONDITION_ENUM.IF_GREATER_THAN,
             },
-        ],
+        ),
     },
 
     "geometry": {
         "shape": SHAPE_ENUM.RECTANGULAR,
-        "dimensionModels": [
+        "dimensionModels": (
             {
                 "label": "single_patient_recovery",
                 "treatmentRoomsMin": None,
@@ -6379,7 +5866,7 @@ RECOVERY_RULES = {
                 "longAxisVariable": True,
                 "longAxisIncrementPerDoorInches": 36,
             },
-        ],
+        ),
         "fallbackStrategy": GEOMETRY_FALLBACK_ENUM.MINIMUM,
     },
 
@@ -6405,15 +5892,15 @@ RECOVERY_RULES = {
     },
 
     "access": {
-        "entryCountRules": [
+        "entryCountRules": (
             {
                 "treatmentRoomsMin": None,
                 "treatmentRoomsMax": None,
                 "minEntries": 1,
                 "maxEntries": 2,  # Staff + optional secondary egress
-            }
-        ],
-        "entryConstraints": [
+            },
+        ),
+        "entryConstraints": (
             {
                 # Must be easily reachable from surgical / sedation areas
                 "kind": ENTRY_RULE_ENUM.ENTRY_FROM,
@@ -6428,27 +5915,16 @@ RECOVERY_RULES = {
                 "distanceMaxInches": None,
                 "hard": True,
             },
-        ],
-        "ada": {
-            "minClearWidthInches": 36,
-            "requiredEntries": 1,
-        },
+        ),
+        "ada": _ADA_WIDE,
     },
 
     "adjacency": {
-        "direct": [
-            {
-                "target": SPACE_ID.SURGICAL,
-                "condition": CONDITION_ENUM.IF_PRESENT,
-                "hard": True,
-            },
-            {
-                "target": SPACE_ID.CLINICAL_CORRIDOR,
-                "condition": CONDITION_ENUM.NONE,
-                "hard": True,
-            },
-        ],
-        "preferredProximity": [
+        "direct": _adjacent(
+            (SPACE_ID.SURGICAL, CONDITION_ENUM.IF_PRESENT, True),
+            (SPACE_ID.CLINICAL_CORRIDOR, CONDITION_ENUM.NONE, True),
+        ),
+        "preferredProximity": (
             {
                 # Nursing / staff monitoring nearby
                 "target": SPACE_GROUP.CLINICAL,
@@ -6461,42 +5937,42 @@ RECOVERY_RULES = {
                 "maxDistanceInches": 240,
                 "optimizationWeight": 0.6,
             },
-        ],
-        "separation": [
+        ),
+        "separation": (
             {
                 # Must not open directly to waiting / check-in
                 "target": SPACE_GROUP.PUBLIC,
                 "hard": True,
             },
-        ],
+        ),
     },
 
     "visibility": {
-        "mustBeHiddenFrom": [
+        "mustBeHiddenFrom": (
             {
                 # Patient privacy is critical
                 "target": SPACE_GROUP.PUBLIC,
                 "hard": True,
             },
-        ],
-        "mustBeVisibleFrom": [
+        ),
+        "mustBeVisibleFrom": (
             {
                 # Staff must be able to observe patients
                 "target": SPACE_GROUP.CLINICAL,
                 "hard": False,  # May be via glazing, monitors, or doors
             },
-        ],
+        ),
     },
 
     "circulation": {
         "role": CIRCULATION_ROLE_ENUM.DESTINATION,
-        "mustConnect": [
+        "mustConnect": (
             SPACE_ID.CLINICAL_CORRIDOR,
-        ],
-        "mustNotTerminateInto": [
+        ),
+        "mustNotTerminateInto": (
             SPACE_ID.PATIENT_LOUNGE,
             SPACE_ID.CHECK_IN,
-        ],
+        ),
     },
 
     "optimization": {
@@ -6509,11 +5985,11 @@ RECOVERY_RULES = {
             "sameCategoryBonus": 0.7,
         },
     },
-}
+})
 
 # Records Room
 
-RECORDS_RULES = {
+RECORDS_RULES = _freeze({
 
     "identity": {
         "roomType": SPACE_ID.RECORDS,
@@ -6527,7 +6003,7 @@ RECORDS_RULES = {
 
     "existence": {
         "trigger": TRIGGER_ENUM.DERIVED,
-        "countRules": [
+        "countRules": (
             {
                 # Typically required when physical records are maintained
                 "driver": COUNT_DRIVER_ENUM.FIXED,
@@ -6542,12 +6018,12 @@ RECORDS_RULES = {
                 "max": 1,
                 "condition": CONDITION_ENUM.IF_ABSENT,
             },
-        ],
+        ),
     },
 
     "geometry": {
         "shape": SHAPE_ENUM.RECTANGULAR,
-        "dimensionModels": [
+        "dimensionModels": (
             {
                 "label": "compact_records_storage",
                 "treatmentRoomsMin": None,
@@ -6568,7 +6044,7 @@ RECORDS_RULES = {
                 "longAxisVariable": True,
                 "longAxisIncrementPerDoorInches": 24,
             },
-        ],
+        ),
         "fallbackStrategy": GEOMETRY_FALLBACK_ENUM.MINIMUM,
     },
 
@@ -6594,15 +6070,15 @@ RECORDS_RULES = {
     },
 
     "access": {
-        "entryCountRules": [
+        "entryCountRules": (
             {
                 "treatmentRoomsMin": None,
                 "treatmentRoomsMax": None,
                 "minEntries": 1,
                 "maxEntries": 1,  # Single controlled access point
-            }
-        ],
-        "entryConstraints": [
+            },
+        ),
+        "entryConstraints": (
             {
                 # Must not be publicly accessible
                 "kind": ENTRY_RULE_ENUM.ENTRY_NOT_FROM,
@@ -6617,7 +6093,7 @@ RECORDS_RULES = {
                 "distanceMaxInches": None,
                 "hard": False,
             },
-        ],
+        ),
         "ada": {
             # ADA applies only if staff regularly occupy space
             "minClearWidthInches": 32,
@@ -6626,15 +6102,15 @@ RECORDS_RULES = {
     },
 
     "adjacency": {
-        "direct": [
+        "direct": (
             {
                 # Commonly near admin or staff work areas
                 "target": SPACE_GROUP.ADMIN,
                 "condition": CONDITION_ENUM.NONE,
                 "hard": False,
             },
-        ],
-        "preferredProximity": [
+        ),
+        "preferredProximity": (
             {
                 "target": SPACE_ID.BUSINESS_OFFICE,
                 "maxDistanceInches": 120,
@@ -6645,8 +6121,8 @@ RECORDS_RULES = {
                 "maxDistanceInches": 180,
                 "optimizationWeight": 0.4,
             },
-        ],
-        "separation": [
+        ),
+        "separation": (
             {
                 # Hard privacy separation
                 "target": SPACE_GROUP.PATIENT_FACING,
@@ -6656,29 +6132,29 @@ RECORDS_RULES = {
                 "target": SPACE_GROUP.CLINICAL,
                 "hard": False,
             },
-        ],
+        ),
     },
 
     "visibility": {
-        "mustBeHiddenFrom": [
+        "mustBeHiddenFrom": (
             {
                 # Records must never be visible to patients or visitors
                 "target": SPACE_GROUP.PUBLIC,
                 "hard": True,
             },
-        ],
-        "mustBeVisibleFrom": [],
+        ),
+        "mustBeVisibleFrom": (),
     },
 
     "circulation": {
         "role": CIRCULATION_ROLE_ENUM.DESTINATION,
-        "mustConnect": [
+        "mustConnect": (
             SPACE_GROUP.ADMIN,
-        ],
-        "mustNotTerminateInto": [
+        ),
+        "mustNotTerminateInto": (
             SPACE_ID.PATIENT_LOUNGE,
             SPACE_ID.CHECK_IN,
-        ],
+        ),
     },
 
     "optimization": {
@@ -6691,11 +6167,11 @@ RECORDS_RULES = {
             "sameCategoryBonus": 0.9,
         },
     },
-}
+})
 
 # Changing Room
 
-CHANGING_RULES = {
+CHANGING_RULES = _freeze({
 
     "identity": {
         "roomType": SPACE_ID.CHANGING,
@@ -6708,7 +6184,7 @@ CHANGING_RULES = {
 
     "existence": {
         "trigger": TRIGGER_ENUM.DERIVED,
-        "countRules": [
+        "countRules": (
             {
                 # Typically required for procedures involving gowns or uniforms
                 "driver": COUNT_DRIVER_ENUM.TREATMENT_ROOMS,
@@ -6723,12 +6199,12 @@ CHANGING_RULES = {
                 "max": 1,
                 "condition": CONDITION_ENUM.IF_ABSENT,
             },
-        ],
+        ),
     },
 
     "geometry": {
         "shape": SHAPE_ENUM.RECTANGULAR,
-        "dimensionModels": [
+        "dimensionModels": (
             {
                 "label": "single_person_changing",
                 "treatmentRoomsMin": None,
@@ -6749,7 +6225,7 @@ CHANGING_RULES = {
                 "longAxisVariable": False,
                 "longAxisIncrementPerDoorInches": None,
             },
-        ],
+        ),
         "fallbackStrategy": GEOMETRY_FALLBACK_ENUM.MINIMUM,
     },
 
@@ -6775,15 +6251,8 @@ CHANGING_RULES = {
     },
 
     "access": {
-        "entryCountRules": [
-            {
-                "treatmentRoomsMin": None,
-                "treatmentRoomsMax": None,
-                "minEntries": 1,
-                "maxEntries": 1,
-            }
-        ],
-        "entryConstraints": [
+        "entryCountRules": _ONE_ENTRY,
+        "entryConstraints": (
             {
                 # Must not open directly to public waiting
                 "kind": ENTRY_RULE_ENUM.ENTRY_NOT_FROM,
@@ -6798,7 +6267,7 @@ CHANGING_RULES = {
                 "distanceMaxInches": None,
                 "hard": False,
             },
-        ],
+        ),
         "ada": {
             # TODO: Confirm whether this changing room must be fully ADA accessible
             "minClearWidthInches": 32,
@@ -6807,15 +6276,15 @@ CHANGING_RULES = {
     },
 
     "adjacency": {
-        "direct": [
+        "direct": (
             {
                 # Often near treatment or recovery spaces
                 "target": SPACE_GROUP.CLINICAL,
                 "condition": CONDITION_ENUM.NONE,
                 "hard": False,
             },
-        ],
-        "preferredProximity": [
+        ),
+        "preferredProximity": (
             {
                 "target": SPACE_ID.RECOVERY,
                 "maxDistanceInches": 120,
@@ -6826,35 +6295,32 @@ CHANGING_RULES = {
                 "maxDistanceInches": 180,
                 "optimizationWeight": 0.4,
             },
-        ],
-        "separation": [
+        ),
+        "separation": (
             {
                 # Privacy requirement
                 "target": SPACE_GROUP.PUBLIC,
                 "hard": True,
             },
-        ],
+        ),
     },
 
     "visibility": {
-        "mustBeHiddenFrom": [
-            {
-                "target": SPACE_GROUP.PUBLIC,
-                "hard": True,
-            },
-        ],
-        "mustBeVisibleFrom": [],
+        "mustBeHiddenFrom": _targets(
+            (SPACE_GROUP.PUBLIC, True),
+        ),
+        "mustBeVisibleFrom": (),
     },
 
     "circulation": {
         "role": CIRCULATION_ROLE_ENUM.DESTINATION,
-        "mustConnect": [
+        "mustConnect": (
             SPACE_GROUP.CLINICAL,
-        ],
-        "mustNotTerminateInto": [
+        ),
+        "mustNotTerminateInto": (
             SPACE_ID.PATIENT_LOUNGE,
             SPACE_ID.CHECK_IN,
-        ],
+        ),
     },
 
     "optimization": {
@@ -6867,11 +6333,11 @@ CHANGING_RULES = {
             "sameCategoryBonus": 0.8,
         },
     },
-}
+})
 
 # Nursing Room
 
-NURSING_RULES = {
+NURSING_RULES = _freeze({
 
     "identity": {
         "roomType": SPACE_ID.NURSING,
@@ -6885,7 +6351,7 @@ NURSING_RULES = {
 
     "existence": {
         "trigger": TRIGGER_ENUM.DERIVED,
-        "countRules": [
+        "countRules": (
             {
                 # One nursing station typically supports multiple treatment rooms
                 "driver": COUNT_DRIVER_ENUM.TREATMENT_ROOMS,
@@ -6900,12 +6366,12 @@ NURSING_RULES = {
                 "max": None,
                 "condition": CONDITION_ENUM.IF_GREATER_THAN,
             },
-        ],
+        ),
     },
 
     "geometry": {
         "shape": SHAPE_ENUM.RECTILINEAR,
-        "dimensionModels": [
+        "dimensionModels": (
             {
                 "label": "small_nursing_station",
                 "treatmentRoomsMin": 1,
@@ -6926,7 +6392,7 @@ NURSING_RULES = {
                 "longAxisVariable": True,
                 "longAxisIncrementPerDoorInches": None,
             },
-        ],
+        ),
         "fallbackStrategy": GEOMETRY_FALLBACK_ENUM.MINIMUM,
     },
 
@@ -6952,16 +6418,16 @@ NURSING_RULES = {
     },
 
     "access": {
-        "entryCountRules": [
+        "entryCountRules": (
             {
                 # Typically one primary entry
                 "treatmentRoomsMin": None,
                 "treatmentRoomsMax": None,
                 "minEntries": 1,
                 "maxEntries": 2,
-            }
-        ],
-        "entryConstraints": [
+            },
+        ),
+        "entryConstraints": (
             {
                 # Must not open directly to public waiting
                 "kind": ENTRY_RULE_ENUM.ENTRY_NOT_FROM,
@@ -6976,7 +6442,7 @@ NURSING_RULES = {
                 "distanceMaxInches": None,
                 "hard": True,
             },
-        ],
+        ),
         "ada": {
             # TODO: Confirm whether nursing station requires full ADA compliance
             "minClearWidthInches": 32,
@@ -6985,15 +6451,15 @@ NURSING_RULES = {
     },
 
     "adjacency": {
-        "direct": [
+        "direct": (
             {
                 # Strong adjacency to treatment rooms
                 "target": SPACE_GROUP.CLINICAL,
                 "condition": CONDITION_ENUM.NONE,
                 "hard": True,
             },
-        ],
-        "preferredProximity": [
+        ),
+        "preferredProximity": (
             {
                 "target": SPACE_ID.STORAGE_CLOSET,
                 "maxDistanceInches": 120,
@@ -7009,8 +6475,8 @@ NURSING_RULES = {
                 "maxDistanceInches": 120,
                 "optimizationWeight": 0.6,
             },
-        ],
-        "separation": [
+        ),
+        "separation": (
             {
                 # Avoid public exposure
                 "target": SPACE_GROUP.PATIENT_FACING,
@@ -7021,35 +6487,35 @@ NURSING_RULES = {
                 "target": SPACE_GROUP.ADMIN,
                 "hard": False,
             },
-        ],
+        ),
     },
 
     "visibility": {
-        "mustBeHiddenFrom": [
+        "mustBeHiddenFrom": (
             {
                 # PHI protection
                 "target": SPACE_GROUP.PUBLIC,
                 "hard": True,
             },
-        ],
-        "mustBeVisibleFrom": [
+        ),
+        "mustBeVisibleFrom": (
             {
                 # Nurses should visually monitor treatment areas
                 "target": SPACE_GROUP.CLINICAL,
                 "hard": False,
             },
-        ],
+        ),
     },
 
     "circulation": {
         "role": CIRCULATION_ROLE_ENUM.DESTINATION,
-        "mustConnect": [
+        "mustConnect": (
             SPACE_GROUP.CLINICAL,
-        ],
-        "mustNotTerminateInto": [
+        ),
+        "mustNotTerminateInto": (
             SPACE_ID.PATIENT_LOUNGE,
             SPACE_ID.CHECK_IN,
-        ],
+        ),
     },
 
     "optimization": {
@@ -7062,11 +6528,11 @@ NURSING_RULES = {
             "sameCategoryBonus": 1.0,
         },
     },
-}
+})
 
 # Laundry Room
 
-LAUNDRY_RULES = {
+LAUNDRY_RULES = _freeze({
 
     "identity": {
         "roomType": SPACE_ID.LAUNDRY,
@@ -7080,7 +6546,7 @@ LAUNDRY_RULES = {
 
     "existence": {
         "trigger": TRIGGER_ENUM.DERIVED,
-        "countRules": [
+        "countRules": (
             {
                 # Small clinics typically require at least one laundry room
                 "driver": COUNT_DRIVER_ENUM.TREATMENT_ROOMS,
@@ -7095,12 +6561,12 @@ LAUNDRY_RULES = {
                 "max": None,
                 "condition": CONDITION_ENUM.IF_GREATER_THAN,
             },
-        ],
+        ),
     },
 
     "geometry": {
         "shape": SHAPE_ENUM.RECTANGULAR,
-        "dimensionModels": [
+        "dimensionModels": (
             {
                 "label": "compact_laundry",
                 "treatmentRoomsMin": 1,
@@ -7121,7 +6587,7 @@ LAUNDRY_RULES = {
                 "longAxisVariable": True,
                 "longAxisIncrementPerDoorInches": None,
             },
-        ],
+        ),
         "fallbackStrategy": GEOMETRY_FALLBACK_ENUM.MINIMUM,
     },
 
@@ -7147,16 +6613,16 @@ LAUNDRY_RULES = {
     },
 
     "access": {
-        "entryCountRules": [
+        "entryCountRules": (
             {
                 # Typically one controlled staff entry
                 "treatmentRoomsMin": None,
                 "treatmentRoomsMax": None,
                 "minEntries": 1,
                 "maxEntries": 1,
-            }
-        ],
-        "entryConstraints": [
+            },
+        ),
+        "entryConstraints": (
             {
                 # Must not open directly to public areas
                 "kind": ENTRY_RULE_ENUM.ENTRY_NOT_FROM,
@@ -7171,7 +6637,7 @@ LAUNDRY_RULES = {
                 "distanceMaxInches": None,
                 "hard": True,
             },
-        ],
+        ),
         "ada": {
             # TODO: Confirm ADA requirements if staff-only room is exempt
             "minClearWidthInches": 32,
@@ -7180,15 +6646,15 @@ LAUNDRY_RULES = {
     },
 
     "adjacency": {
-        "direct": [
+        "direct": (
             {
                 # Direct access to service circulation is important
                 "target": SPACE_GROUP.CLINICAL,
                 "condition": CONDITION_ENUM.NONE,
                 "hard": True,
             },
-        ],
-        "preferredProximity": [
+        ),
+        "preferredProximity": (
             {
                 "target": SPACE_ID.STORAGE_CLOSET,
                 "maxDistanceInches": 120,
@@ -7199,8 +6665,8 @@ LAUNDRY_RULES = {
                 "maxDistanceInches": 180,
                 "optimizationWeight": 0.5,
             },
-        ],
-        "separation": [
+        ),
+        "separation": (
             {
                 # Infection control and noise concerns
                 "target": SPACE_GROUP.CLINICAL,
@@ -7210,29 +6676,29 @@ LAUNDRY_RULES = {
                 "target": SPACE_GROUP.PATIENT_FACING,
                 "hard": True,
             },
-        ],
+        ),
     },
 
     "visibility": {
-        "mustBeHiddenFrom": [
+        "mustBeHiddenFrom": (
             {
                 # Soiled materials must not be visible publicly
                 "target": SPACE_GROUP.PUBLIC,
                 "hard": True,
             },
-        ],
-        "mustBeVisibleFrom": [],
+        ),
+        "mustBeVisibleFrom": (),
     },
 
     "circulation": {
         "role": CIRCULATION_ROLE_ENUM.DESTINATION,
-        "mustConnect": [
+        "mustConnect": (
             SPACE_GROUP.CLINICAL,
-        ],
-        "mustNotTerminateInto": [
+        ),
+        "mustNotTerminateInto": (
             SPACE_ID.PATIENT_LOUNGE,
             SPACE_ID.CHECK_IN,
-        ],
+        ),
     },
 
     "optimization": {
@@ -7245,11 +6711,11 @@ LAUNDRY_RULES = {
             "sameCategoryBonus": 0.8,
         },
     },
-}
+})
 
 # Server Room
 
-SERVER_CLOSET_RULES = {
+SERVER_CLOSET_RULES = _freeze({
 
     "identity": {
         "roomType": SPACE_ID.SERVER_CLOSET,
@@ -7263,19 +6729,19 @@ SERVER_CLOSET_RULES = {
 
     "existence": {
         "trigger": TRIGGER_ENUM.DERIVED,
-        "countRules": [
+        "countRules": (
             {
                 "driver": COUNT_DRIVER_ENUM.BUILDING_SQFT,
                 "min": 1,
                 "max": None,
                 "condition": CONDITION_ENUM.NONE,
             },
-        ],
+        ),
     },
 
     "geometry": {
         "shape": SHAPE_ENUM.RECTANGULAR,
-        "dimensionModels": [
+        "dimensionModels": (
             {
                 "label": "small_server_closet",
                 "treatmentRoomsMin": None,
@@ -7296,29 +6762,22 @@ SERVER_CLOSET_RULES = {
                 "longAxisVariable": False,
                 "longAxisIncrementPerDoorInches": None,
             },
-        ],
+        ),
         "fallbackStrategy": GEOMETRY_FALLBACK_ENUM.MINIMUM,
     },
 
     #orientation not rlly needed?
 
     "access": {
-        "entryCountRules": [
-            {
-                "treatmentRoomsMin": None,
-                "treatmentRoomsMax": None,
-                "minEntries": 1,
-                "maxEntries": 1,
-            }
-        ],
-        "entryConstraints": [
+        "entryCountRules": _ONE_ENTRY,
+        "entryConstraints": (
             {
                 "kind": ENTRY_RULE_ENUM.ENTRY_NOT_FROM,
                 "target": SPACE_GROUP.PUBLIC,
                 "distanceMaxInches": None,
                 "hard": True,
-            }
-        ],
+            },
+        ),
         "ada": {
             "minClearWidthInches": 32,  # Typical closet / service access
             "requiredEntries": 1,
@@ -7326,40 +6785,34 @@ SERVER_CLOSET_RULES = {
     },
 
     "adjacency": {
-        "direct": [],
-        "preferredProximity": [
+        "direct": (),
+        "preferredProximity": (
             {
                 "target": SPACE_GROUP.SUPPORT,
                 "maxDistanceInches": 240,  # ~20'
                 "optimizationWeight": 0.7,
-            }
-        ],
-        "separation": [
-            {
-                "target": SPACE_GROUP.CLINICAL,
-                "hard": True,
-            }
-        ],
+            },
+        ),
+        "separation": _targets(
+            (SPACE_GROUP.CLINICAL, True),
+        ),
     },
 
     "visibility": {
-        "mustBeHiddenFrom": [
-            {
-                "target": SPACE_GROUP.PUBLIC,
-                "hard": True,
-            }
-        ],
-        "mustBeVisibleFrom": [],
+        "mustBeHiddenFrom": _targets(
+            (SPACE_GROUP.PUBLIC, True),
+        ),
+        "mustBeVisibleFrom": (),
     },
 
     "circulation": {
         "role": CIRCULATION_ROLE_ENUM.DESTINATION,
-        "mustConnect": [
+        "mustConnect": (
             SPACE_ID.CLINICAL_CORRIDOR,
-        ],
-        "mustNotTerminateInto": [
+        ),
+        "mustNotTerminateInto": (
             SPACE_ID.PATIENT_LOUNGE,
-        ],
+        ),
     },
 
     "optimization": {
@@ -7371,11 +6824,11 @@ SERVER_CLOSET_RULES = {
             "sameCategoryBonus": 0.8,
         },
     },
-}
+})
 
 # Janitor Closet
 
-JANITOR_CLOSET_RULES = {
+JANITOR_CLOSET_RULES = _freeze({
 
     "identity": {
         "roomType": SPACE_ID.JANITOR_CLOSET,
@@ -7389,19 +6842,19 @@ JANITOR_CLOSET_RULES = {
 
     "existence": {
         "trigger": TRIGGER_ENUM.DERIVED,
-        "countRules": [
+        "countRules": (
             {
                 "driver": COUNT_DRIVER_ENUM.BUILDING_SQFT,
                 "min": 1,
                 "max": None,
                 "condition": CONDITION_ENUM.NONE,
-            }
-        ],
+            },
+        ),
     },
 
     "geometry": {
         "shape": SHAPE_ENUM.RECTANGULAR,
-        "dimensionModels": [
+        "dimensionModels": (
             {
                 "label": "minimum_janitor_closet",
                 "treatmentRoomsMin": None,
@@ -7422,7 +6875,7 @@ JANITOR_CLOSET_RULES = {
                 "longAxisVariable": False,
                 "longAxisIncrementPerDoorInches": None,
             },
-        ],
+        ),
         "fallbackStrategy": GEOMETRY_FALLBACK_ENUM.MINIMUM,
     },
 
@@ -7448,22 +6901,15 @@ JANITOR_CLOSET_RULES = {
     },
 
     "access": {
-        "entryCountRules": [
-            {
-                "treatmentRoomsMin": None,
-                "treatmentRoomsMax": None,
-                "minEntries": 1,
-                "maxEntries": 1,
-            }
-        ],
-        "entryConstraints": [
+        "entryCountRules": _ONE_ENTRY,
+        "entryConstraints": (
             {
                 "kind": ENTRY_RULE_ENUM.ENTRY_NOT_FROM,
                 "target": SPACE_GROUP.PUBLIC,
                 "distanceMaxInches": None,
                 "hard": True,
-            }
-        ],
+            },
+        ),
         "ada": {
             "minClearWidthInches": 32,
             "requiredEntries": 1,
@@ -7471,40 +6917,34 @@ JANITOR_CLOSET_RULES = {
     },
 
     "adjacency": {
-        "direct": [],
-        "preferredProximity": [
+        "direct": (),
+        "preferredProximity": (
             {
                 "target": SPACE_GROUP.SUPPORT,
                 "maxDistanceInches": 300,  # ~25'
                 "optimizationWeight": 0.6,
-            }
-        ],
-        "separation": [
-            {
-                "target": SPACE_GROUP.PUBLIC,
-                "hard": True,
-            }
-        ],
+            },
+        ),
+        "separation": _targets(
+            (SPACE_GROUP.PUBLIC, True),
+        ),
     },
 
     "visibility": {
-        "mustBeHiddenFrom": [
-            {
-                "target": SPACE_GROUP.PUBLIC,
-                "hard": True,
-            }
-        ],
-        "mustBeVisibleFrom": [],
+        "mustBeHiddenFrom": _targets(
+            (SPACE_GROUP.PUBLIC, True),
+        ),
+        "mustBeVisibleFrom": (),
     },
 
     "circulation": {
         "role": CIRCULATION_ROLE_ENUM.DESTINATION,
-        "mustConnect": [
+        "mustConnect": (
             SPACE_ID.CLINICAL_CORRIDOR,
-        ],
-        "mustNotTerminateInto": [
+        ),
+        "mustNotTerminateInto": (
             SPACE_ID.PATIENT_LOUNGE,
-        ],
+        ),
     },
 
     "optimization": {
@@ -7516,11 +6956,11 @@ JANITOR_CLOSET_RULES = {
             "sameCategoryBonus": 0.9,
         },
     },
-}
+})
 
 # Medical Gas Room
 
-MED_GAS_RULES = {
+MED_GAS_RULES = _freeze({
 
     "identity": {
         "roomType": SPACE_ID.MED_GAS,
@@ -7534,20 +6974,20 @@ MED_GAS_RULES = {
 
     "existence": {
         "trigger": TRIGGER_ENUM.DERIVED,
-        "countRules": [
+        "countRules": (
             {
                 "driver": COUNT_DRIVER_ENUM.TREATMENT_ROOMS,
                 "min": 1,
                 "max": 1,
                 "condition": CONDITION_ENUM.IF_GREATER_THAN,
                 # TODO: Confirm treatment room threshold at which med gas is required
-            }
-        ],
+            },
+        ),
     },
 
     "geometry": {
         "shape": SHAPE_ENUM.RECTANGULAR,
-        "dimensionModels": [
+        "dimensionModels": (
             {
                 "label": "minimum_med_gas_room",
                 "treatmentRoomsMin": None,
@@ -7568,7 +7008,7 @@ MED_GAS_RULES = {
                 "longAxisVariable": False,
                 "longAxisIncrementPerDoorInches": None,
             },
-        ],
+        ),
         "fallbackStrategy": GEOMETRY_FALLBACK_ENUM.MINIMUM,
     },
 
@@ -7594,15 +7034,8 @@ MED_GAS_RULES = {
     },
 
     "access": {
-        "entryCountRules": [
-            {
-                "treatmentRoomsMin": None,
-                "treatmentRoomsMax": None,
-                "minEntries": 1,
-                "maxEntries": 1,
-            }
-        ],
-        "entryConstraints": [
+        "entryCountRules": _ONE_ENTRY,
+        "entryConstraints": (
             {
                 "kind": ENTRY_RULE_ENUM.ENTRY_NOT_FROM,
                 "target": SPACE_GROUP.PUBLIC,
@@ -7615,7 +7048,7 @@ MED_GAS_RULES = {
                 "distanceMaxInches": None,
                 "hard": True,
             },
-        ],
+        ),
         "ada": {
             "minClearWidthInches": 32,
             "requiredEntries": 1,
@@ -7624,8 +7057,8 @@ MED_GAS_RULES = {
     },
 
     "adjacency": {
-        "direct": [],
-        "preferredProximity": [
+        "direct": (),
+        "preferredProximity": (
             {
                 "target": SPACE_GROUP.CLINICAL,
                 "maxDistanceInches": None,
@@ -7636,43 +7069,31 @@ MED_GAS_RULES = {
                 "maxDistanceInches": 360,  # ~30'
                 "optimizationWeight": 0.5,
             },
-        ],
-        "separation": [
-            {
-                "target": SPACE_GROUP.PUBLIC,
-                "hard": True,
-            },
-            {
-                "target": SPACE_GROUP.PATIENT_FACING,
-                "hard": True,
-            },
-        ],
+        ),
+        "separation": _targets(
+            (SPACE_GROUP.PUBLIC, True),
+            (SPACE_GROUP.PATIENT_FACING, True),
+        ),
     },
 
     "visibility": {
-        "mustBeHiddenFrom": [
-            {
-                "target": SPACE_GROUP.PUBLIC,
-                "hard": True,
-            },
-            {
-                "target": SPACE_GROUP.PATIENT_FACING,
-                "hard": True,
-            },
-        ],
-        "mustBeVisibleFrom": [],
+        "mustBeHiddenFrom": _targets(
+            (SPACE_GROUP.PUBLIC, True),
+            (SPACE_GROUP.PATIENT_FACING, True),
+        ),
+        "mustBeVisibleFrom": (),
     },
 
     "circulation": {
         "role": CIRCULATION_ROLE_ENUM.DESTINATION,
-        "mustConnect": [
+        "mustConnect": (
             SPACE_ID.CLINICAL_CORRIDOR,
-        ],
-        "mustNotTerminateInto": [
+        ),
+        "mustNotTerminateInto": (
             SPACE_ID.PATIENT_LOUNGE,
             SPACE_ID.CHECK_IN,
             SPACE_ID.CHECK_OUT,
-        ],
+        ),
     },
 
     "optimization": {
@@ -7684,11 +7105,11 @@ MED_GAS_RULES = {
             "sameCategoryBonus": 1.0,
         },
     },
-}
+})
 
 # Storage Closet
 
-STORAGE_CLOSET_RULES = {
+STORAGE_CLOSET_RULES = _freeze({
 
     "identity": {
         "roomType": SPACE_ID.STORAGE_CLOSET,
@@ -7701,19 +7122,19 @@ STORAGE_CLOSET_RULES = {
 
     "existence": {
         "trigger": TRIGGER_ENUM.ALWAYS,
-        "countRules": [
+        "countRules": (
             {
                 "driver": COUNT_DRIVER_ENUM.FIXED,
                 "min": 1,
                 "max": None,
                 "condition": CONDITION_ENUM.NONE,
-            }
-        ],
+            },
+        ),
     },
 
     "geometry": {
         "shape": SHAPE_ENUM.RECTANGULAR,
-        "dimensionModels": [
+        "dimensionModels": (
             {
                 "label": "small_storage_closet",
                 "treatmentRoomsMin": None,
@@ -7734,7 +7155,7 @@ STORAGE_CLOSET_RULES = {
                 "longAxisVariable": False,
                 "longAxisIncrementPerDoorInches": None,
             },
-        ],
+        ),
         "fallbackStrategy": GEOMETRY_FALLBACK_ENUM.MINIMUM,
     },
 
@@ -7760,22 +7181,15 @@ STORAGE_CLOSET_RULES = {
     },
 
     "access": {
-        "entryCountRules": [
-            {
-                "treatmentRoomsMin": None,
-                "treatmentRoomsMax": None,
-                "minEntries": 1,
-                "maxEntries": 1,
-            }
-        ],
-        "entryConstraints": [
+        "entryCountRules": _ONE_ENTRY,
+        "entryConstraints": (
             {
                 "kind": ENTRY_RULE_ENUM.ENTRY_NOT_FROM,
                 "target": SPACE_GROUP.PUBLIC,
                 "distanceMaxInches": None,
                 "hard": True,
-            }
-        ],
+            },
+        ),
         "ada": {
             "minClearWidthInches": 32,
             "requiredEntries": 1,
@@ -7784,8 +7198,8 @@ STORAGE_CLOSET_RULES = {
     },
 
     "adjacency": {
-        "direct": [],
-        "preferredProximity": [
+        "direct": (),
+        "preferredProximity": (
             {
                 "target": SPACE_GROUP.STAFF,
                 "maxDistanceInches": 300,  # 25'
@@ -7796,43 +7210,31 @@ STORAGE_CLOSET_RULES = {
                 "maxDistanceInches": 360,  # 30'
                 "optimizationWeight": 0.5,
             },
-        ],
-        "separation": [
-            {
-                "target": SPACE_GROUP.PUBLIC,
-                "hard": True,
-            },
-            {
-                "target": SPACE_GROUP.PATIENT_FACING,
-                "hard": True,
-            },
-        ],
+        ),
+        "separation": _targets(
+            (SPACE_GROUP.PUBLIC, True),
+            (SPACE_GROUP.PATIENT_FACING, True),
+        ),
     },
 
     "visibility": {
-        "mustBeHiddenFrom": [
-            {
-                "target": SPACE_GROUP.PUBLIC,
-                "hard": True,
-            },
-            {
-                "target": SPACE_GROUP.PATIENT_FACING,
-                "hard": True,
-            },
-        ],
-        "mustBeVisibleFrom": [],
+        "mustBeHiddenFrom": _targets(
+            (SPACE_GROUP.PUBLIC, True),
+            (SPACE_GROUP.PATIENT_FACING, True),
+        ),
+        "mustBeVisibleFrom": (),
     },
 
     "circulation": {
         "role": CIRCULATION_ROLE_ENUM.DESTINATION,
-        "mustConnect": [
+        "mustConnect": (
             SPACE_ID.CLINICAL_CORRIDOR,
-        ],
-        "mustNotTerminateInto": [
+        ),
+        "mustNotTerminateInto": (
             SPACE_ID.PATIENT_LOUNGE,
             SPACE_ID.CHECK_IN,
             SPACE_ID.CHECK_OUT,
-        ],
+        ),
     },
 
     "optimization": {
@@ -7844,11 +7246,11 @@ STORAGE_CLOSET_RULES = {
             "sameCategoryBonus": 0.8,
         },
     },
-}
+})
 
 # Shipping Recieving Room
 
-SHIP_REC_RULES = {
+SHIP_REC_RULES = _freeze({
 
     "identity": {
         "roomType": SPACE_ID.SHIP_REC,
@@ -7861,19 +7263,19 @@ SHIP_REC_RULES = {
 
     "existence": {
         "trigger": TRIGGER_ENUM.ALWAYS,
-        "countRules": [
+        "countRules": (
             {
                 "driver": COUNT_DRIVER_ENUM.FIXED,
                 "min": 1,
                 "max": None,
                 "condition": CONDITION_ENUM.NONE,
-            }
-        ],
+            },
+        ),
     },
 
     "geometry": {
         "shape": SHAPE_ENUM.RECTANGULAR,
-        "dimensionModels": [
+        "dimensionModels": (
             {
                 "label": "small_ship_rec",
                 "treatmentRoomsMin": None,
@@ -7894,7 +7296,7 @@ SHIP_REC_RULES = {
                 "longAxisVariable": True,
                 "longAxisIncrementPerDoorInches": 12,
             },
-        ],
+        ),
         "fallbackStrategy": GEOMETRY_FALLBACK_ENUM.MINIMUM,
     },
 
@@ -7920,15 +7322,8 @@ SHIP_REC_RULES = {
     },
 
     "access": {
-        "entryCountRules": [
-            {
-                "treatmentRoomsMin": None,
-                "treatmentRoomsMax": None,
-                "minEntries": 1,
-                "maxEntries": 2,
-            }
-        ],
-        "entryConstraints": [
+        "entryCountRules": _ONE_OR_TWO_ENTRIES,
+        "entryConstraints": (
             {
                 "kind": ENTRY_RULE_ENUM.ENTRY_FROM,
                 "target": SPACE_GROUP.STAFF,
@@ -7941,23 +7336,16 @@ SHIP_REC_RULES = {
                 "distanceMaxInches": None,
                 "hard": True,
             },
-        ],
-        "ada": {
-            "minClearWidthInches": 36,
-            "requiredEntries": 1,
-            # TODO: Confirm if ADA is needed for shipping/receiving access
-        },
+        ),
+        # TODO: Confirm if ADA is needed for shipping/receiving access
+        "ada": _ADA_WIDE,
     },
 
     "adjacency": {
-        "direct": [
-            {
-                "target": SPACE_GROUP.STAFF,
-                "condition": CONDITION_ENUM.NONE,
-                "hard": True,
-            }
-        ],
-        "preferredProximity": [
+        "direct": _adjacent(
+            (SPACE_GROUP.STAFF, CONDITION_ENUM.NONE, True),
+        ),
+        "preferredProximity": (
             {
                 "target": SPACE_GROUP.SUPPORT,
                 "maxDistanceInches": 120,  # 10'
@@ -7968,41 +7356,32 @@ SHIP_REC_RULES = {
                 "maxDistanceInches": 360,  # 30'
                 "optimizationWeight": 0.5,
             },
-        ],
-        "separation": [
-            {
-                "target": SPACE_GROUP.PUBLIC,
-                "hard": True,
-            }
-        ],
+        ),
+        "separation": _targets(
+            (SPACE_GROUP.PUBLIC, True),
+        ),
     },
 
     "visibility": {
-        "mustBeHiddenFrom": [
-            {
-                "target": SPACE_GROUP.PUBLIC,
-                "hard": True,
-            }
-        ],
-        "mustBeVisibleFrom": [
-            {
-                "target": SPACE_GROUP.STAFF,
-                "hard": True,
-            }
-        ],
+        "mustBeHiddenFrom": _targets(
+            (SPACE_GROUP.PUBLIC, True),
+        ),
+        "mustBeVisibleFrom": _targets(
+            (SPACE_GROUP.STAFF, True),
+        ),
     },
 
     "circulation": {
         "role": CIRCULATION_ROLE_ENUM.DESTINATION,
-        "mustConnect": [
+        "mustConnect": (
             SPACE_ID.CLINICAL_CORRIDOR,
             # TODO: Consider connecting to MECHANICAL or LOADING areas if layout allows
-        ],
-        "mustNotTerminateInto": [
+        ),
+        "mustNotTerminateInto": (
             SPACE_ID.PATIENT_LOUNGE,
             SPACE_ID.CHECK_IN,
             SPACE_ID.CHECK_OUT,
-        ],
+        ),
     },
 
     "optimization": {
@@ -8014,11 +7393,11 @@ SHIP_REC_RULES = {
             "sameCategoryBonus": 0.8,
         },
     },
-}
+})
 
 # Conference Room
 
-CONFERENCE_RULES = {
+CONFERENCE_RULES = _freeze({
 
     "identity": {
         "roomType": SPACE_ID.CONFERENCE,
@@ -8031,19 +7410,19 @@ CONFERENCE_RULES = {
 
     "existence": {
         "trigger": TRIGGER_ENUM.ALWAYS,
-        "countRules": [
+        "countRules": (
             {
                 "driver": COUNT_DRIVER_ENUM.FIXED,
                 "min": 1,
                 "max": None,
                 "condition": CONDITION_ENUM.NONE,
-            }
-        ],
+            },
+        ),
     },
 
     "geometry": {
         "shape": SHAPE_ENUM.RECTANGULAR,
-        "dimensionModels": [
+        "dimensionModels": (
             {
                 "label": "small_conference",
                 "treatmentRoomsMin": None,
@@ -8064,7 +7443,7 @@ CONFERENCE_RULES = {
                 "longAxisVariable": True,
                 "longAxisIncrementPerDoorInches": 12,
             },
-        ],
+        ),
         "fallbackStrategy": GEOMETRY_FALLBACK_ENUM.MINIMUM,
     },
 
@@ -8090,37 +7469,23 @@ CONFERENCE_RULES = {
     },
 
     "access": {
-        "entryCountRules": [
-            {
-                "treatmentRoomsMin": None,
-                "treatmentRoomsMax": None,
-                "minEntries": 1,
-                "maxEntries": 2,
-            }
-        ],
-        "entryConstraints": [
+        "entryCountRules": _ONE_OR_TWO_ENTRIES,
+        "entryConstraints": (
             {
                 "kind": ENTRY_RULE_ENUM.ENTRY_FROM,
                 "target": SPACE_GROUP.STAFF,
                 "distanceMaxInches": None,
                 "hard": True,
-            }
-        ],
-        "ada": {
-            "minClearWidthInches": 36,
-            "requiredEntries": 1,
-        },
+            },
+        ),
+        "ada": _ADA_WIDE,
     },
 
     "adjacency": {
-        "direct": [
-            {
-                "target": SPACE_GROUP.PRIVATE,
-                "condition": CONDITION_ENUM.NONE,
-                "hard": True,
-            }
-        ],
-        "preferredProximity": [
+        "direct": _adjacent(
+            (SPACE_GROUP.PRIVATE, CONDITION_ENUM.NONE, True),
+        ),
+        "preferredProximity": (
             {
                 "target": SPACE_GROUP.STAFF,
                 "maxDistanceInches": 240,  # 20'
@@ -8131,40 +7496,31 @@ CONFERENCE_RULES = {
                 "maxDistanceInches": 360,  # 30'
                 "optimizationWeight": 0.5,
             },
-        ],
-        "separation": [
-            {
-                "target": SPACE_GROUP.CLINICAL,
-                "hard": True,
-            }
-        ],
+        ),
+        "separation": _targets(
+            (SPACE_GROUP.CLINICAL, True),
+        ),
     },
 
     "visibility": {
-        "mustBeHiddenFrom": [
-            {
-                "target": SPACE_GROUP.CLINICAL,
-                "hard": True,
-            }
-        ],
-        "mustBeVisibleFrom": [
-            {
-                "target": SPACE_GROUP.STAFF,
-                "hard": True,
-            }
-        ],
+        "mustBeHiddenFrom": _targets(
+            (SPACE_GROUP.CLINICAL, True),
+        ),
+        "mustBeVisibleFrom": _targets(
+            (SPACE_GROUP.STAFF, True),
+        ),
     },
 
     "circulation": {
         "role": CIRCULATION_ROLE_ENUM.DESTINATION,
-        "mustConnect": [
+        "mustConnect": (
             SPACE_ID.CROSSOVER_HALLWAY,
             # TODO: Confirm if must connect to STAFF_LOUNGE or ADMIN zones
-        ],
-        "mustNotTerminateInto": [
+        ),
+        "mustNotTerminateInto": (
             SPACE_ID.PATIENT_LOUNGE,
             SPACE_ID.CHECK_IN,
-        ],
+        ),
     },
 
     "optimization": {
@@ -8176,11 +7532,11 @@ CONFERENCE_RULES = {
             "sameCategoryBonus": 0.8,
         },
     },
-}
+})
 
 # Associate Office
 
-ASSOCIATE_OFFICE_RULES = {
+ASSOCIATE_OFFICE_RULES = _freeze({
 
     "identity": {
         "roomType": SPACE_ID.ASSOCIATE_OFFICE,
@@ -8193,19 +7549,19 @@ ASSOCIATE_OFFICE_RULES = {
 
     "existence": {
         "trigger": TRIGGER_ENUM.ALWAYS,
-        "countRules": [
+        "countRules": (
             {
                 "driver": COUNT_DRIVER_ENUM.FIXED,
                 "min": 1,
                 "max": None,  # TODO: Confirm max number per floor
                 "condition": CONDITION_ENUM.NONE,
-            }
-        ],
+            },
+        ),
     },
 
     "geometry": {
         "shape": SHAPE_ENUM.RECTANGULAR,
-        "dimensionModels": [
+        "dimensionModels": (
             {
                 "label": "standard_associate_office",
                 "treatmentRoomsMin": None,
@@ -8216,7 +7572,7 @@ ASSOCIATE_OFFICE_RULES = {
                 "longAxisVariable": True,
                 "longAxisIncrementPerDoorInches": 12,
             },
-        ],
+        ),
         "fallbackStrategy": GEOMETRY_FALLBACK_ENUM.MINIMUM,
     },
 
@@ -8242,37 +7598,23 @@ ASSOCIATE_OFFICE_RULES = {
     },
 
     "access": {
-        "entryCountRules": [
-            {
-                "treatmentRoomsMin": None,
-                "treatmentRoomsMax": None,
-                "minEntries": 1,
-                "maxEntries": 1,
-            }
-        ],
-        "entryConstraints": [
+        "entryCountRules": _ONE_ENTRY,
+        "entryConstraints": (
             {
                 "kind": ENTRY_RULE_ENUM.ENTRY_FROM,
                 "target": SPACE_GROUP.PRIVATE,
                 "distanceMaxInches": None,
                 "hard": True,
-            }
-        ],
-        "ada": {
-            "minClearWidthInches": 36,
-            "requiredEntries": 1,
-        },
+            },
+        ),
+        "ada": _ADA_WIDE,
     },
 
     "adjacency": {
-        "direct": [
-            {
-                "target": SPACE_GROUP.PRIVATE,
-                "condition": CONDITION_ENUM.NONE,
-                "hard": True,
-            }
-        ],
-        "preferredProximity": [
+        "direct": _adjacent(
+            (SPACE_GROUP.PRIVATE, CONDITION_ENUM.NONE, True),
+        ),
+        "preferredProximity": (
             {
                 "target": SPACE_GROUP.ADMIN,
                 "maxDistanceInches": 240,  # 20'
@@ -8283,43 +7625,31 @@ ASSOCIATE_OFFICE_RULES = {
                 "maxDistanceInches": 300,  # 25'
                 "optimizationWeight": 0.5,
             },
-        ],
-        "separation": [
-            {
-                "target": SPACE_GROUP.CLINICAL,
-                "hard": True,
-            }
-        ],
+        ),
+        "separation": _targets(
+            (SPACE_GROUP.CLINICAL, True),
+        ),
     },
 
     "visibility": {
-        "mustBeHiddenFrom": [
-            {
-                "target": SPACE_GROUP.CLINICAL,
-                "hard": True,
-            },
-            {
-                "target": SPACE_GROUP.PUBLIC,
-                "hard": True,
-            },
-        ],
-        "mustBeVisibleFrom": [
-            {
-                "target": SPACE_GROUP.STAFF,
-                "hard": True,
-            }
-        ],
+        "mustBeHiddenFrom": _targets(
+            (SPACE_GROUP.CLINICAL, True),
+            (SPACE_GROUP.PUBLIC, True),
+        ),
+        "mustBeVisibleFrom": _targets(
+            (SPACE_GROUP.STAFF, True),
+        ),
     },
 
     "circulation": {
         "role": CIRCULATION_ROLE_ENUM.DESTINATION,
-        "mustConnect": [
+        "mustConnect": (
             SPACE_ID.CROSSOVER_HALLWAY,  # TODO: confirm connection preference
-        ],
-        "mustNotTerminateInto": [
+        ),
+        "mustNotTerminateInto": (
             SPACE_ID.CHECK_IN,
             SPACE_ID.PATIENT_LOUNGE,
-        ],
+        ),
     },
 
     "optimization": {
@@ -8331,11 +7661,11 @@ ASSOCIATE_OFFICE_RULES = {
             "sameCategoryBonus": 0.7,
         },
     },
-}
+})
 
 # Associates Restroom
 
-ASSOCIATE_RESTROOM_RULES = {
+ASSOCIATE_RESTROOM_RULES = _freeze({
 
     "identity": {
         "roomType": SPACE_ID.ASSOCIATE_RESTROOM,
@@ -8348,19 +7678,19 @@ ASSOCIATE_RESTROOM_RULES = {
 
     "existence": {
         "trigger": TRIGGER_ENUM.ALWAYS,
-        "countRules": [
+        "countRules": (
             {
                 "driver": COUNT_DRIVER_ENUM.OCCUPANCY,
                 "min": 1,
                 "max": None,  # TODO: Confirm if more than 1 restroom is needed for larger floors
                 "condition": CONDITION_ENUM.NONE,
-            }
-        ],
+            },
+        ),
     },
 
     "geometry": {
         "shape": SHAPE_ENUM.RECTANGULAR,
-        "dimensionModels": [
+        "dimensionModels": (
             {
                 "label": "single_staff_restroom",
                 "treatmentRoomsMin": None,
@@ -8371,7 +7701,7 @@ ASSOCIATE_RESTROOM_RULES = {
                 "longAxisVariable": True,
                 "longAxisIncrementPerDoorInches": 12,
             },
-        ],
+        ),
         "fallbackStrategy": GEOMETRY_FALLBACK_ENUM.MINIMUM,
     },
 
@@ -8397,79 +7727,53 @@ ASSOCIATE_RESTROOM_RULES = {
     },
 
     "access": {
-        "entryCountRules": [
-            {
-                "treatmentRoomsMin": None,
-                "treatmentRoomsMax": None,
-                "minEntries": 1,
-                "maxEntries": 1,
-            }
-        ],
-        "entryConstraints": [
+        "entryCountRules": _ONE_ENTRY,
+        "entryConstraints": (
             {
                 "kind": ENTRY_RULE_ENUM.ENTRY_FROM,
                 "target": SPACE_GROUP.PRIVATE,
                 "distanceMaxInches": 120,  # within 10' of offices
                 "hard": True,
-            }
-        ],
-        "ada": {
-            "minClearWidthInches": 36,
-            "requiredEntries": 1,
-        },
+            },
+        ),
+        "ada": _ADA_WIDE,
     },
 
     "adjacency": {
-        "direct": [
-            {
-                "target": SPACE_GROUP.PRIVATE,
-                "condition": CONDITION_ENUM.NONE,
-                "hard": True,
-            }
-        ],
-        "preferredProximity": [
+        "direct": _adjacent(
+            (SPACE_GROUP.PRIVATE, CONDITION_ENUM.NONE, True),
+        ),
+        "preferredProximity": (
             {
                 "target": SPACE_ID.ASSOCIATE_OFFICE,
                 "maxDistanceInches": 120,  # 10' max from offices
                 "optimizationWeight": 0.8,
             },
-        ],
-        "separation": [
-            {
-                "target": SPACE_GROUP.PUBLIC,
-                "hard": True,
-            }
-        ],
+        ),
+        "separation": _targets(
+            (SPACE_GROUP.PUBLIC, True),
+        ),
     },
 
     "visibility": {
-        "mustBeHiddenFrom": [
-            {
-                "target": SPACE_GROUP.PUBLIC,
-                "hard": True,
-            },
-            {
-                "target": SPACE_GROUP.CLINICAL,
-                "hard": True,
-            },
-        ],
-        "mustBeVisibleFrom": [
-            {
-                "target": SPACE_GROUP.PRIVATE,
-                "hard": False,
-            }
-        ],
+        "mustBeHiddenFrom": _targets(
+            (SPACE_GROUP.PUBLIC, True),
+            (SPACE_GROUP.CLINICAL, True),
+        ),
+        "mustBeVisibleFrom": _targets(
+            (SPACE_GROUP.PRIVATE, False),
+        ),
     },
 
     "circulation": {
         "role": CIRCULATION_ROLE_ENUM.DESTINATION,
-        "mustConnect": [
+        "mustConnect": (
             SPACE_ID.CROSSOVER_HALLWAY,  # TODO: confirm exact corridor connection
-        ],
-        "mustNotTerminateInto": [
+        ),
+        "mustNotTerminateInto": (
             SPACE_ID.CHECK_IN,
             SPACE_ID.PATIENT_LOUNGE,
-        ],
+        ),
     },
 
     "optimization": {
@@ -8481,11 +7785,11 @@ ASSOCIATE_RESTROOM_RULES = {
             "sameCategoryBonus": 0.6,
         },
     },
-}
+})
 
 # Marketing Room
 
-MARKETING_RULES = {
+MARKETING_RULES = _freeze({
 
     "identity": {
         "roomType": SPACE_ID.MARKETING,
@@ -8498,19 +7802,19 @@ MARKETING_RULES = {
 
     "existence": {
         "trigger": TRIGGER_ENUM.ALWAYS,
-        "countRules": [
+        "countRules": (
             {
                 "driver": COUNT_DRIVER_ENUM.FIXED,
                 "min": 1,
                 "max": 1,  # TODO: Confirm if more than 1 marketing office is needed per floor
                 "condition": CONDITION_ENUM.NONE,
-            }
-        ],
+            },
+        ),
     },
 
     "geometry": {
         "shape": SHAPE_ENUM.RECTANGULAR,
-        "dimensionModels": [
+        "dimensionModels": (
             {
                 "label": "standard_marketing_office",
                 "treatmentRoomsMin": None,
@@ -8520,8 +7824,8 @@ MARKETING_RULES = {
                 "areaSqIn": None,
                 "longAxisVariable": True,
                 "longAxisIncrementPerDoorInches": 12,
-            }
-        ],
+            },
+        ),
         "fallbackStrategy": GEOMETRY_FALLBACK_ENUM.MINIMUM,
     },
 
@@ -8547,75 +7851,52 @@ MARKETING_RULES = {
     },
 
     "access": {
-        "entryCountRules": [
-            {
-                "treatmentRoomsMin": None,
-                "treatmentRoomsMax": None,
-                "minEntries": 1,
-                "maxEntries": 1,
-            }
-        ],
-        "entryConstraints": [
+        "entryCountRules": _ONE_ENTRY,
+        "entryConstraints": (
             {
                 "kind": ENTRY_RULE_ENUM.ENTRY_FROM,
                 "target": SPACE_GROUP.PRIVATE,
                 "distanceMaxInches": 120,  # within 10' of admin cluster
                 "hard": True,
-            }
-        ],
-        "ada": {
-            "minClearWidthInches": 36,
-            "requiredEntries": 1,
-        },
+            },
+        ),
+        "ada": _ADA_WIDE,
     },
 
     "adjacency": {
-        "direct": [
-            {
-                "target": SPACE_GROUP.PRIVATE,
-                "condition": CONDITION_ENUM.NONE,
-                "hard": True,
-            }
-        ],
-        "preferredProximity": [
+        "direct": _adjacent(
+            (SPACE_GROUP.PRIVATE, CONDITION_ENUM.NONE, True),
+        ),
+        "preferredProximity": (
             {
                 "target": SPACE_ID.TEAM_LEADER,
                 "maxDistanceInches": 120,
                 "optimizationWeight": 0.8,
-            }
-        ],
-        "separation": [
-            {
-                "target": SPACE_GROUP.PUBLIC,
-                "hard": True,
-            }
-        ],
+            },
+        ),
+        "separation": _targets(
+            (SPACE_GROUP.PUBLIC, True),
+        ),
     },
 
     "visibility": {
-        "mustBeHiddenFrom": [
-            {
-                "target": SPACE_GROUP.PUBLIC,
-                "hard": True,
-            }
-        ],
-        "mustBeVisibleFrom": [
-            {
-                "target": SPACE_GROUP.PRIVATE,
-                "hard": False,
-            }
-        ],
+        "mustBeHiddenFrom": _targets(
+            (SPACE_GROUP.PUBLIC, True),
+        ),
+        "mustBeVisibleFrom": _targets(
+            (SPACE_GROUP.PRIVATE, False),
+        ),
     },
 
     "circulation": {
         "role": CIRCULATION_ROLE_ENUM.DESTINATION,
-        "mustConnect": [
+        "mustConnect": (
             SPACE_ID.CROSSOVER_HALLWAY,  # TODO: Confirm exact corridor or adjacency
-        ],
-        "mustNotTerminateInto": [
+        ),
+        "mustNotTerminateInto": (
             SPACE_ID.CHECK_IN,
             SPACE_ID.PATIENT_LOUNGE,
-        ],
+        ),
     },
 
     "optimization": {
@@ -8627,11 +7908,11 @@ MARKETING_RULES = {
             "sameCategoryBonus": 0.6,
         },
     },
-}
+})
 
 # Team Leader Room
 
-TEAM_LEADER_RULES = {
+TEAM_LEADER_RULES = _freeze({
 
     "identity": {
         "roomType": SPACE_ID.TEAM_LEADER,
@@ -8644,19 +7925,19 @@ TEAM_LEADER_RULES = {
 
     "existence": {
         "trigger": TRIGGER_ENUM.ALWAYS,
-        "countRules": [
+        "countRules": (
             {
                 "driver": COUNT_DRIVER_ENUM.FIXED,
                 "min": 1,
                 "max": 1,
                 "condition": CONDITION_ENUM.NONE,
-            }
-        ],
+            },
+        ),
     },
 
     "geometry": {
         "shape": SHAPE_ENUM.RECTANGULAR,
-        "dimensionModels": [
+        "dimensionModels": (
             {
                 "label": "standard_team_leader_office",
                 "treatmentRoomsMin": None,
@@ -8666,8 +7947,8 @@ TEAM_LEADER_RULES = {
                 "areaSqIn": None,
                 "longAxisVariable": True,
                 "longAxisIncrementPerDoorInches": 12,
-            }
-        ],
+            },
+        ),
         "fallbackStrategy": GEOMETRY_FALLBACK_ENUM.MINIMUM,
     },
 
@@ -8693,75 +7974,52 @@ TEAM_LEADER_RULES = {
     },
 
     "access": {
-        "entryCountRules": [
-            {
-                "treatmentRoomsMin": None,
-                "treatmentRoomsMax": None,
-                "minEntries": 1,
-                "maxEntries": 1,
-            }
-        ],
-        "entryConstraints": [
+        "entryCountRules": _ONE_ENTRY,
+        "entryConstraints": (
             {
                 "kind": ENTRY_RULE_ENUM.ENTRY_FROM,
                 "target": SPACE_GROUP.PRIVATE,
                 "distanceMaxInches": 120,  # within 10' of admin cluster
                 "hard": True,
-            }
-        ],
-        "ada": {
-            "minClearWidthInches": 36,
-            "requiredEntries": 1,
-        },
+            },
+        ),
+        "ada": _ADA_WIDE,
     },
 
     "adjacency": {
-        "direct": [
-            {
-                "target": SPACE_GROUP.PRIVATE,
-                "condition": CONDITION_ENUM.NONE,
-                "hard": True,
-            }
-        ],
-        "preferredProximity": [
+        "direct": _adjacent(
+            (SPACE_GROUP.PRIVATE, CONDITION_ENUM.NONE, True),
+        ),
+        "preferredProximity": (
             {
                 "target": SPACE_ID.MARKETING,
                 "maxDistanceInches": 120,
                 "optimizationWeight": 0.8,
-            }
-        ],
-        "separation": [
-            {
-                "target": SPACE_GROUP.PUBLIC,
-                "hard": True,
-            }
-        ],
+            },
+        ),
+        "separation": _targets(
+            (SPACE_GROUP.PUBLIC, True),
+        ),
     },
 
     "visibility": {
-        "mustBeHiddenFrom": [
-            {
-                "target": SPACE_GROUP.PUBLIC,
-                "hard": True,
-            }
-        ],
-        "mustBeVisibleFrom": [
-            {
-                "target": SPACE_ID.MARKETING,
-                "hard": False,
-            }
-        ],
+        "mustBeHiddenFrom": _targets(
+            (SPACE_GROUP.PUBLIC, True),
+        ),
+        "mustBeVisibleFrom": _targets(
+            (SPACE_ID.MARKETING, False),
+        ),
     },
 
     "circulation": {
         "role": CIRCULATION_ROLE_ENUM.DESTINATION,
-        "mustConnect": [
+        "mustConnect": (
             SPACE_ID.CROSSOVER_HALLWAY,  # TODO: Confirm exact corridor
-        ],
-        "mustNotTerminateInto": [
+        ),
+        "mustNotTerminateInto": (
             SPACE_ID.CHECK_IN,
             SPACE_ID.PATIENT_LOUNGE,
-        ],
+        ),
     },
 
     "optimization": {
@@ -8773,11 +8031,11 @@ TEAM_LEADER_RULES = {
             "sameCategoryBonus": 0.6,
         },
     },
-}
+})
 
 # patient Care Center
 
-PATIENT_CARE_CENTER_RULES = {
+PATIENT_CARE_CENTER_RULES = _freeze({
 
     "identity": {
         "roomType": SPACE_ID.PATIENT_CARE_CENTER,
@@ -8791,19 +8049,19 @@ PATIENT_CARE_CENTER_RULES = {
 
     "existence": {
         "trigger": TRIGGER_ENUM.ALWAYS,
-        "countRules": [
+        "countRules": (
             {
                 "driver": COUNT_DRIVER_ENUM.FIXED,
                 "min": 1,
                 "max": 1,
                 "condition": CONDITION_ENUM.NONE,
-            }
-        ],
+            },
+        ),
     },
 
     "geometry": {
         "shape": SHAPE_ENUM.RECTILINEAR,
-        "dimensionModels": [
+        "dimensionModels": (
             {
                 "label": "standard_patient_care_center",
                 "treatmentRoomsMin": None,
@@ -8813,8 +8071,8 @@ PATIENT_CARE_CENTER_RULES = {
                 "areaSqIn": None,
                 "longAxisVariable": True,
                 "longAxisIncrementPerDoorInches": 24,
-            }
-        ],
+            },
+        ),
         "fallbackStrategy": GEOMETRY_FALLBACK_ENUM.MINIMUM,
     },
 
@@ -8840,22 +8098,22 @@ PATIENT_CARE_CENTER_RULES = {
     },
 
     "access": {
-        "entryCountRules": [
+        "entryCountRules": (
             {
                 "treatmentRoomsMin": None,
                 "treatmentRoomsMax": None,
                 "minEntries": 2,
                 "maxEntries": 3,
-            }
-        ],
-        "entryConstraints": [
+            },
+        ),
+        "entryConstraints": (
             {
                 "kind": ENTRY_RULE_ENUM.ENTRY_FROM,
                 "target": SPACE_GROUP.CORRIDORS,
                 "distanceMaxInches": 60,  # 5' from main corridor
                 "hard": True,
-            }
-        ],
+            },
+        ),
         "ada": {
             "minClearWidthInches": 36,
             "requiredEntries": 2,
@@ -8863,14 +8121,10 @@ PATIENT_CARE_CENTER_RULES = {
     },
 
     "adjacency": {
-        "direct": [
-            {
-                "target": SPACE_GROUP.CLINICAL,
-                "condition": CONDITION_ENUM.NONE,
-                "hard": True,
-            }
-        ],
-        "preferredProximity": [
+        "direct": _adjacent(
+            (SPACE_GROUP.CLINICAL, CONDITION_ENUM.NONE, True),
+        ),
+        "preferredProximity": (
             {
                 "target": SPACE_ID.TREATMENT_COORDINATION,
                 "maxDistanceInches": 120,
@@ -8881,39 +8135,30 @@ PATIENT_CARE_CENTER_RULES = {
                 "maxDistanceInches": 120,
                 "optimizationWeight": 0.8,
             }
-        ],
-        "separation": [
-            {
-                "target": SPACE_GROUP.PUBLIC,
-                "hard": False,
-            }
-        ],
+        ),
+        "separation": _targets(
+            (SPACE_GROUP.PUBLIC, False),
+        ),
     },
 
     "visibility": {
-        "mustBeHiddenFrom": [
-            {
-                "target": SPACE_GROUP.PRIVATE,
-                "hard": False,
-            }
-        ],
-        "mustBeVisibleFrom": [
-            {
-                "target": SPACE_ID.CHECK_IN,
-                "hard": True,
-            }
-        ],
+        "mustBeHiddenFrom": _targets(
+            (SPACE_GROUP.PRIVATE, False),
+        ),
+        "mustBeVisibleFrom": _targets(
+            (SPACE_ID.CHECK_IN, True),
+        ),
     },
 
     "circulation": {
         "role": CIRCULATION_ROLE_ENUM.DESTINATION,
-        "mustConnect": [
+        "mustConnect": (
             SPACE_ID.CLINICAL_CORRIDOR,
             SPACE_ID.CROSSOVER_HALLWAY,
-        ],
-        "mustNotTerminateInto": [
+        ),
+        "mustNotTerminateInto": (
             SPACE_ID.STAFF_LOUNGE,
-        ],
+        ),
     },
 
     "optimization": {
@@ -8925,9 +8170,9 @@ PATIENT_CARE_CENTER_RULES = {
             "sameCategoryBonus": 0.7,
         },
     },
-}
+})
 
-ROOM_RULES = {
+_ROOM_SPECS = {
     SPACE_ID.STERILIZATION: STERILIZATION_RULES,
     SPACE_ID.LAB: LAB_RULES,
     SPACE_ID.CONSULT: CONSULT_RULES,
@@ -8980,4 +8225,68 @@ ROOM_RULES = {
     SPACE_ID.MARKETING: MARKETING_RULES,
     SPACE_ID.TEAM_LEADER: TEAM_LEADER_RULES,
     SPACE_ID.PATIENT_CARE_CENTER: PATIENT_CARE_CENTER_RULES,
-}
\ No newline at end of file
+}
+
+# With ERGO_RULES_CACHE=1 the compiled rules are pickled next to this module and
+# reloaded while this file, room_schema.py and core.py keep the mtimes recorded
+# in its header. Off by default so edits during development are never masked.
+_RULES_CACHE = Path(__file__).with_name("room_rules.pkl")
+_RULES_CACHE_SOURCES = (Path(__file__), Path(room_schema.__file__), Path(core.__file__))
+
+
+def _proxy(items):
+    return MappingProxyType(items)
+
+
+class _RulePickler(pickle.Pickler):
+    # mappingproxy has no pickle support of its own
+    def reducer_override(self, obj):
+        if type(obj) is MappingProxyType:
+            return _proxy, (dict(obj),)
+        return NotImplemented
+
+
+def _compile_rules():
+    return {space_id: RoomRule.from_spec(spec) for space_id, spec in _ROOM_SPECS.items()}
+
+
+def _load_rules():
+    if os.environ.get("ERGO_RULES_CACHE") != "1":
+        return _compile_rules()
+
+    try:
+        header = tuple(p.stat().st_mtime_ns for p in _RULES_CACHE_SOURCES)
+    except OSError:
+        return _compile_rules()
+
+    try:
+        with _RULES_CACHE.open("rb") as f:
+            if pickle.load(f) == header:
+                return pickle.load(f)
+    except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ImportError):
+        pass
+
+    rules = _compile_rules()
+
+    # Best effort, written aside and swapped in so readers never see a partial file
+    tmp = _RULES_CACHE.with_name(f"{_RULES_CACHE.name}.{os.getpid()}.tmp")
+    try:
+        with tmp.open("wb") as f:
+            pickler = _RulePickler(f, protocol=pickle.HIGHEST_PROTOCOL)
+            pickler.dump(header)
+            pickler.dump(rules)
+        os.replace(tmp, _RULES_CACHE)
+    except OSError:
+        tmp.unlink(missing_ok=True)
+
+    return rules
+
+
+# Consumers read sections as attributes: ROOM_RULES[SPACE_ID.LAB].geometry
+ROOM_RULES = MappingProxyType(_load_rules())
+
+# Same rules as a flat tuple, in ROOM_RULES order, for whole-rule-set scans
+ALL_RULES: tuple[RoomRule, ...] = tuple(ROOM_RULES.values())
+
+# The intern table is only needed while the literals above are frozen
+_INTERNED.clear()
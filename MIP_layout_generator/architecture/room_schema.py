@@ -1,3 +1,8 @@
+import re
+from collections.abc import Mapping
+from dataclasses import dataclass, field, fields
+from types import MappingProxyType
+
 from .core import *
 
 RoomSchema = {
@@ -22,6 +27,7 @@ RoomSchema = {
                 "min": int | None,
                 "max": int | None,
                 "condition": CONDITION_ENUM,    # or none
+                "threshold": int | None,        # IF_GREATER_THAN: driver value; PER_N_UNITS: units per step
                 #TODO: perhaps add argument field so that condition enum doesn't hold semantics
             }
         ]
@@ -179,3 +185,257 @@ RoomSchema = {
         }
     }
 }
+
+
+# Compiled form of a RoomSchema-shaped rule dict.
+# room_rules.py stays the authoring format; RoomRule.from_spec turns each dict
+# into frozen, slotted dataclasses so consumers do attribute (slot) loads
+# instead of chains of string-keyed lookups. Keys are converted to snake_case
+# (treatmentRoomsMin -> treatment_rooms_min). Keys a class doesn't declare are
+# kept, unconverted, in its `extras` mapping. A None upper bound (max, *Max,
+# maxDistanceInches) compiles to NO_LIMIT; other None fields stay None.
+
+_EMPTY = MappingProxyType({})
+
+def _section():
+    # mappingproxy isn't hashable, so dataclasses won't take it as a plain default
+    return field(default_factory=lambda: _EMPTY)
+
+
+def _snake(key):
+    return re.sub(r"(?<!^)(?=[A-Z])", "_", key).lower()
+
+
+@dataclass(slots=True, frozen=True)
+class Identity:
+    room_type: SPACE_ID | None = None
+    category: ROOM_CATEGORY | None = None
+    description: str | None = None
+    extras: Mapping = _section()
+
+
+@dataclass(slots=True, frozen=True)
+class CountRule:
+    driver: COUNT_DRIVER_ENUM | None = None
+    min: int | None = None
+    max: int | float = NO_LIMIT
+    condition: CONDITION_ENUM | None = None
+    threshold: int | None = None
+    extras: Mapping = _section()
+
+
+@dataclass(slots=True, frozen=True)
+class Existence:
+    trigger: TRIGGER_ENUM | None = None
+    count_rules: tuple = ()
+    extras: Mapping = _section()
+
+
+@dataclass(slots=True, frozen=True)
+class DimensionModel:
+    label: str | None = None
+    treatment_rooms_min: int | None = None
+    treatment_rooms_max: int | float | str = NO_LIMIT
+    width_inches: int | None = None
+    length_inches: int | None = None
+    area_sq_in: int | None = None
+    long_axis_variable: bool | None = None
+    long_axis_increment_per_door_inches: int | None = None
+    aspect_ratio_range: tuple | None = None
+    extras: Mapping = _section()
+
+
+@dataclass(slots=True, frozen=True)
+class Geometry:
+    shape: SHAPE_ENUM | None = None
+    dimension_models: tuple = ()
+    fallback_strategy: GEOMETRY_FALLBACK_ENUM | None = None
+    # Treatment-room-style geometry
+    width_rules: Mapping | None = None
+    depth_rules: Mapping | None = None
+    extras: Mapping = _section()
+
+
+@dataclass(slots=True, frozen=True)
+class Orientation:
+    allowed: bool | None = None
+    long_axis_relation: AXIS_RELATION_ENUM | None = None
+    placement_hint: PLACEMENT_ENUM | None = None
+    connects_corridors: bool | None = None
+    extras: Mapping = _section()
+
+
+@dataclass(slots=True, frozen=True)
+class EntryCountRule:
+    treatment_rooms_min: int | None = None
+    treatment_rooms_max: int | float | str = NO_LIMIT
+    min_entries: int | None = None
+    max_entries: int | float = NO_LIMIT
+    # Capacity-binned variants (staff lounge, alt business office)
+    seats_min: int | None = None
+    seats_max: int | float = NO_LIMIT
+    workstations_min: int | None = None
+    workstations_max: int | float = NO_LIMIT
+    extras: Mapping = _section()
+
+
+@dataclass(slots=True, frozen=True)
+class EntryConstraint:
+    kind: ENTRY_RULE_ENUM | None = None
+    target: SPACE_ID | SPACE_GROUP | None = None
+    distance_max_inches: int | float = NO_LIMIT
+    hard: bool = False
+    extras: Mapping = _section()
+
+
+@dataclass(slots=True, frozen=True)
+class Access:
+    entry_count_rules: tuple = ()
+    entry_constraints: tuple = ()
+    ada: Mapping = _section()
+    extras: Mapping = _section()
+
+
+@dataclass(slots=True, frozen=True)
+class AdjacencyTarget:
+    # adjacency.direct / adjacency.separation / visibility.* entries
+    target: SPACE_ID | SPACE_GROUP | None = None
+    condition: CONDITION_ENUM | None = None
+    hard: bool = False
+    extras: Mapping = _section()
+
+
+@dataclass(slots=True, frozen=True)
+class ProximityTarget:
+    target: SPACE_ID | SPACE_GROUP | None = None
+    max_distance_inches: int | float = NO_LIMIT
+    optimization_weight: float | None = None
+    extras: Mapping = _section()
+
+
+@dataclass(slots=True, frozen=True)
+class Adjacency:
+    direct: tuple = ()
+    preferred_proximity: tuple = ()
+    separation: tuple = ()
+    extras: Mapping = _section()
+
+
+@dataclass(slots=True, frozen=True)
+class Visibility:
+    must_be_hidden_from: tuple = ()
+    must_be_visible_from: tuple = ()
+    extras: Mapping = _section()
+
+
+@dataclass(slots=True, frozen=True)
+class Circulation:
+    role: CIRCULATION_ROLE_ENUM | None = None
+    must_connect: tuple = ()
+    must_not_terminate_into: tuple = ()
+    extras: Mapping = _section()
+
+
+@dataclass(slots=True, frozen=True)
+class Optimization:
+    center_bias: Mapping | None = None
+    layout_cohesion_bias: Mapping | None = None
+    extras: Mapping = _section()
+
+
+# Flyweights: one shared instance per distinct value of a leaf entry class
+# (Orientation policies, target / entry rows), so equal entries are also
+# `is`-identical. Entries with extras are left unshared.
+_INTERNED = {}
+
+def _interned(cls, spec):
+    entry = _build(cls, spec)
+    if entry.extras:
+        return entry
+    # type() keeps True / 1 / 1.0 apart, as in room_rules._freeze
+    key = (cls,) + tuple(
+        (type(v), v) for v in (getattr(entry, f.name) for f in fields(cls) if f.name != "extras")
+    )
+    return _INTERNED.setdefault(key, entry)
+
+
+def _orientations(spec):
+    # Per-layout entries become Orientation; other keys (treatment room) pass through
+    return MappingProxyType({
+        k: _interned(Orientation, v) if isinstance(k, LAYOUT_ENUM) else v
+        for k, v in spec.items()
+    })
+
+
+def _each(cls, interned=False):
+    make = _interned if interned else _build
+    return lambda items: tuple(make(cls, item) for item in items)
+
+
+def _build(cls, spec):
+    names = {f.name for f in fields(cls)}
+    kwargs = {}
+    extras = {}
+    for key, value in spec.items():
+        name = _snake(key)
+        if name not in names or name == "extras":
+            extras[key] = value
+            continue
+        convert = _CHILDREN.get((cls, name))
+        if convert is not None and value is not None:
+            value = convert(value)
+        if value is not None:
+            kwargs[name] = value
+    if extras:
+        kwargs["extras"] = MappingProxyType(extras)
+    return cls(**kwargs)
+
+
+@dataclass(slots=True, frozen=True)
+class RoomRule:
+    identity: Identity = field(default_factory=Identity)
+    existence: Existence = field(default_factory=Existence)
+    geometry: Geometry = field(default_factory=Geometry)
+    orientation: Mapping = _section()  # LAYOUT_ENUM -> Orientation
+    access: Access = field(default_factory=Access)
+    adjacency: Adjacency = field(default_factory=Adjacency)
+    visibility: Visibility = field(default_factory=Visibility)
+    circulation: Circulation = field(default_factory=Circulation)
+    optimization: Optimization = field(default_factory=Optimization)
+
+    # Room-specific extras (capacity-driven rooms, treatment room)
+    capacity: Mapping | None = None
+    chair_orientation: Mapping | None = None
+    entry_variants: Mapping | None = None
+
+    @classmethod
+    def from_spec(cls, spec):
+        """Build a RoomRule from a rule dict; unknown sections are an authoring error."""
+        names = {f.name for f in fields(cls)}
+        unknown = [k for k in spec if _snake(k) not in names]
+        if unknown:
+            raise ValueError(f"Unknown rule section(s): {', '.join(unknown)}")
+        return _build(cls, spec)
+
+
+# (class, field) -> converter for nested sections and entry lists
+_CHILDREN = {
+    (RoomRule, "identity"): lambda v: _build(Identity, v),
+    (RoomRule, "existence"): lambda v: _build(Existence, v),
+    (RoomRule, "geometry"): lambda v: _build(Geometry, v),
+    (RoomRule, "orientation"): _orientations,
+    (RoomRule, "access"): lambda v: _build(Access, v),
+    (RoomRule, "adjacency"): lambda v: _build(Adjacency, v),
+    (RoomRule, "visibility"): lambda v: _build(Visibility, v),
+    (RoomRule, "circulation"): lambda v: _build(Circulation, v),
+    (RoomRule, "optimization"): lambda v: _build(Optimization, v),
+    (Existence, "count_rules"): _each(CountRule),
+    (Geometry, "dimension_models"): _each(DimensionModel),
+    (Access, "entry_count_rules"): _each(EntryCountRule, interned=True),
+    (Access, "entry_constraints"): _each(EntryConstraint, interned=True),
+    (Adjacency, "direct"): _each(AdjacencyTarget, interned=True),
+    (Adjacency, "separation"): _each(AdjacencyTarget, interned=True),
+    (Adjacency, "preferred_proximity"): _each(ProximityTarget, interned=True),
+    (Visibility, "must_be_hidden_from"): _each(AdjacencyTarget, interned=True),
+    (Visibility, "must_be_visible_from"): _each(AdjacencyTarget, interned=True),
+}
@@ -0,0 +1,910 @@
+# rule_tables.py
+#
+# Pre-validated NumPy views of ROOM_RULES.
+# Built once at import so the constraint builders don't re-walk the rule dicts
+# (and re-run isinstance checks) for every room instance on every model build.
+#
+# Layout is struct-of-arrays: one int32 array per scalar field, indexed by
+# (SPACE_ID.value, dimension model index). SPACE_IDs are dense from 0, so every row is a room.
+
+import hashlib
+import os
+import shutil
+import textwrap
+from pathlib import Path
+from types import SimpleNamespace
+
+import numpy as np
+
+from . import core, room_rules, room_schema
+from .core import *
+from .room_rules import ROOM_RULES
+
+# With ERGO_TABLES_DIR set, compiled tables are cached there as one .npy per
+# table, in a subdirectory named for the mtimes and sizes of the files they are
+# derived from. Loading memory-maps them read-only, so every solver process on
+# the machine shares one page-cache copy instead of building its own; point it
+# at tmpfs (e.g. /dev/shm/ergo_rule_tables) to keep it in RAM. Off by default,
+# like ERGO_RULES_CACHE, so nothing is written into the package unasked.
+_CACHE_ROOT = os.environ.get("ERGO_TABLES_DIR")
+_CACHE_STAMP = "COMPLETE"
+_CACHE_SOURCES = (Path(__file__),) + tuple(
+    Path(m.__file__) for m in (core, room_rules, room_schema)
+)
+
+# Typed sentinels so every table stays a plain int array (no None / object dtype).
+# UNSPEC marks a missing field; an open upper bound (treatmentRoomsMax: NO_LIMIT)
+# is clamped to UNBOUNDED, so tier checks reduce to trmin <= n <= trmax. TR_INVALID marks a
+# tier bound that isn't numeric (e.g. "TBD") and never matches.
+UNSPEC = -1
+UNBOUNDED = np.iinfo(np.int16).max
+TR_INVALID = -2
+ORIENT_UNSET = UNSPEC
+
+# ENTRIES_MIN / ENTRIES_MAX: no entryCountRule covers the count / maxEntries is NO_LIMIT
+ENTRY_UNSET = -1
+ENTRY_UNBOUNDED = np.iinfo(np.int8).max
+
+# PROX_MAX_DIST: no maxDistanceInches caps the pair. Above any real distance, so
+# "d <= cap" needs no special case
+DIST_UNBOUNDED = np.iinfo(np.int32).max
+
+# Treatment-room counts are tabulated up to here; larger counts read this column
+TR_COUNT_MAX = 64
+
+# Rule weights are authored to one decimal; the *_10 tables hold them as integer
+# tenths (0.8 -> 8) so they can be used directly as integer MIP coefficients.
+WEIGHT_SCALE = 10
+
+# BIASES packs a room's int8 tenths into one uint64: bits 0-7 centerBias.weight,
+# bits 8-15 layoutCohesionBias.sameCategoryBonus (two's complement bytes)
+BIAS_CENTER_SHIFT = 0
+BIAS_SAME_CATEGORY_SHIFT = 8
+
+# ORIENTATION_TABLE columns
+ORIENT_ALLOWED = 0
+ORIENT_LONG_AXIS = 1
+ORIENT_PLACEMENT = 2
+ORIENT_CONNECTS_CORRIDORS = 3
+
+N_ROOMS = len(SPACE_ID)
+N_TARGETS = N_ROOMS + len(SPACE_GROUP)
+# SPACE_IDS[v] is SPACE_ID(v) without the Enum call machinery (values are dense)
+SPACE_IDS = tuple(SPACE_ID)
+N_LAYOUTS = max(l.value for l in LAYOUT_ENUM) + 1
+
+# Relationship masks reserve one bit per SPACE_ID.value
+assert N_ROOMS <= 64, "SPACE_ID no longer fits in a uint64 mask"
+
+
+def _is_num(v):
+    return isinstance(v, (int, float))
+
+
+def to_tenths(weight):
+    """Rule weight as integer tenths (WEIGHT_SCALE); None counts as 0."""
+    return int(round((weight or 0.0) * WEIGHT_SCALE))
+
+
+def is_unspec(x):
+    return x == UNSPEC
+
+
+def _tr_field(v):
+    if v is None:
+        return UNSPEC
+    if _is_num(v):
+        return int(min(v, UNBOUNDED))
+    return TR_INVALID
+
+
+def _dim_field(v):
+    return int(v) if _is_num(v) else UNSPEC
+
+
+def _flag_field(v):
+    return ORIENT_UNSET if v is None else int(bool(v))
+
+
+def _enum_field(v):
+    # Enum values start at 1 (auto()), so 0 is free to mean "no value"
+    return 0 if v is None else v.value
+
+
+MAX_DIM_MODELS = max(len(rule.geometry.dimension_models) for rule in ROOM_RULES.values())
+
+# One record per dimension model across all rooms, grouped by room and in rule
+# order. DIM_MODEL_START[r] is room r's first row; it has N_MODELS[r] rows.
+DIM_DTYPE = np.dtype([
+    ("room_id", "i4"),
+    ("trmin", "i2"),
+    ("trmax", "i2"),
+    ("w", "i2"),
+    ("l", "i2"),
+    ("inc", "i2"),
+    ("var", "?"),
+])
+
+# One record per pair rule across all rooms: each (rule entry, expanded target)
+# with src != tgt, grouped by src room, then by kind in PAIR_* order, then in
+# rule order. w10 is the preferredProximity weight in tenths and max_dist its
+# maxDistanceInches (DIST_UNBOUNDED if none); both are 0 / DIST_UNBOUNDED for
+# other kinds. Circulation entries have no hard flag in the rules and count as hard.
+PAIR_RULE_DTYPE = np.dtype([
+    ("src", "i2"),
+    ("tgt", "i2"),
+    ("kind", "u1"),
+    ("hard", "?"),
+    ("cond", "i1"),
+    ("w10", "i2"),
+    ("max_dist", "i4"),
+])
+
+# PAIR_RULES["kind"]
+PAIR_DIRECT = 0
+PAIR_SEPARATION = 1
+PAIR_HIDDEN_FROM = 2
+PAIR_VISIBLE_FROM = 3
+PAIR_PROXIMITY = 4
+PAIR_MUST_CONNECT = 5
+PAIR_MUST_NOT_TERMINATE = 6
+
+
+def _group_members(group):
+    # Default grouping by identity.category; corridors are matched by name
+    def category(space_id):
+        return ROOM_RULES[space_id].identity.category
+
+    if group in (SPACE_GROUP.CLINICAL, SPACE_GROUP.PUBLIC, SPACE_GROUP.PRIVATE):
+        wanted = ROOM_CATEGORY[group.name]
+        return [s for s in ROOM_RULES if category(s) == wanted]
+    if group == SPACE_GROUP.CORRIDORS:
+        return [s for s in ROOM_RULES if "CORRIDOR" in s.name or "HALLWAY" in s.name]
+    if group == SPACE_GROUP.PATIENT_FACING:
+        return [s for s in ROOM_RULES if category(s) == ROOM_CATEGORY.PUBLIC]
+    return []
+
+
+# Every SPACE_GROUP resolved once; groups with no default members map to an empty set
+SPACE_GROUP_MEMBERS = {group: frozenset(_group_members(group)) for group in SPACE_GROUP}
+
+
+def _target_bits(target):
+    if isinstance(target, SPACE_ID):
+        return 1 << target.value
+    if isinstance(target, SPACE_GROUP):
+        bits = 0
+        for s in SPACE_GROUP_MEMBERS[target]:
+            bits |= 1 << s.value
+        return bits
+    return 0
+
+
+def _targets_bits(targets):
+    bits = 0
+    for target in targets or ():
+        bits |= _target_bits(target)
+    return bits
+
+
+def _rule_bits(rules, hard):
+    bits = 0
+    for rule in rules or ():
+        if rule.hard == hard:
+            bits |= _target_bits(rule.target)
+    return bits
+
+
+def _is_unconditional(rule):
+    # CONDITION_ENUM.NONE is the authored spelling of "no condition"
+    return rule.condition in (None, CONDITION_ENUM.NONE)
+
+
+def _cond_field(rule):
+    # 0 for an unconditional rule, so condition columns test nonzero for "conditional"
+    return 0 if _is_unconditional(rule) else rule.condition.value
+
+
+def _required_bits(rules):
+    # Partners a room cannot do without: hard, unconditional, named SPACE_IDs
+    bits = 0
+    for rule in rules or ():
+        if rule.hard and isinstance(rule.target, SPACE_ID) and _is_unconditional(rule):
+            bits |= 1 << rule.target.value
+    return bits
+
+
+def _unconditional_bits(rules):
+    bits = 0
+    for rule in rules or ():
+        if _is_unconditional(rule):
+            bits |= _target_bits(rule.target)
+    return bits
+
+
+def mask_of(space_ids):
+    """Bitmask with one bit set per SPACE_ID in space_ids."""
+    bits = 0
+    for s in space_ids:
+        bits |= 1 << s.value
+    return np.uint64(bits)
+
+
+def group_bit(group):
+    """Bit of SPACE_GROUP group in ROOM_GROUPS masks."""
+    return group.value - N_ROOMS
+
+
+def group_mask(groups):
+    """ROOM_GROUPS-style uint64 mask with the bit of every SPACE_GROUP in groups set."""
+    bits = 0
+    for g in groups:
+        bits |= 1 << group_bit(g)
+    return np.uint64(bits)
+
+
+def members_of(mask):
+    """SPACE_IDs whose bits are set in mask."""
+    mask = int(mask)
+    return [SPACE_IDS[i] for i in range(N_ROOMS) if mask >> i & 1]
+
+
+def _fill_entry_counts(rules, mn_row, mx_row):
+    # Rules driven by seats / workstations don't bin on treatment rooms; skip them.
+    # Where rules overlap, keep the loosest bounds so no count is over-constrained.
+    for rule in rules or ():
+        capacity_min = (rule.seats_min, rule.workstations_min)
+        capacity_max = min(rule.seats_max, rule.workstations_max)
+        if capacity_min != (None, None) or capacity_max < NO_LIMIT:
+            continue
+        lo = _tr_field(rule.treatment_rooms_min)
+        hi = _tr_field(rule.treatment_rooms_max)
+        mn = rule.min_entries
+        mx = rule.max_entries
+        if lo == TR_INVALID or hi == TR_INVALID or not _is_num(mn):
+            continue
+
+        span = slice(max(lo, 0), min(hi, TR_COUNT_MAX) + 1)
+        mx = int(min(mx, ENTRY_UNBOUNDED))
+        unset = mn_row[span] == ENTRY_UNSET
+        mn_row[span] = np.where(unset, int(mn), np.minimum(mn_row[span], int(mn)))
+        mx_row[span] = np.where(unset, mx, np.maximum(mx_row[span], mx))
+
+
+def _pairwise(masks):
+    # [r, t] is True where bit t of masks[r] is set
+    bits = np.arange(N_ROOMS, dtype=np.uint64)
+    return ((masks[:, None] >> bits) & np.uint64(1)).astype(bool)
+
+
+def _csr(dense, data=None):
+    # Compressed-row form of a bool [r, t] matrix, laid out like scipy.sparse.csr_matrix:
+    # row r's targets are indices[indptr[r]:indptr[r + 1]], with data[...] alongside
+    rows, cols = np.nonzero(dense)
+    indptr = np.zeros(dense.shape[0] + 1, dtype=np.int32)
+    np.cumsum(np.bincount(rows, minlength=dense.shape[0]), out=indptr[1:])
+    data = dense if data is None else data
+    return SimpleNamespace(indptr=indptr, indices=cols.astype(np.int32), data=data[rows, cols])
+
+
+def _pair_rule_rows(space_id, rule):
+    # (kind, entries) in PAIR_* order; circulation lists hold bare targets
+    sections = (
+        (PAIR_DIRECT, rule.adjacency.direct),
+        (PAIR_SEPARATION, rule.adjacency.separation),
+        (PAIR_HIDDEN_FROM, rule.visibility.must_be_hidden_from),
+        (PAIR_VISIBLE_FROM, rule.visibility.must_be_visible_from),
+        (PAIR_PROXIMITY, rule.adjacency.preferred_proximity),
+        (PAIR_MUST_CONNECT, rule.circulation.must_connect),
+        (PAIR_MUST_NOT_TERMINATE, rule.circulation.must_not_terminate_into),
+    )
+    for kind, entries in sections:
+        for entry in entries or ():
+            target = getattr(entry, "target", entry)
+            if kind == PAIR_PROXIMITY:
+                hard, cond = False, 0
+                w10 = to_tenths(entry.optimization_weight)
+                max_dist = int(min(entry.max_distance_inches, DIST_UNBOUNDED))
+            elif kind in (PAIR_MUST_CONNECT, PAIR_MUST_NOT_TERMINATE):
+                hard, cond, w10, max_dist = True, 0, 0, DIST_UNBOUNDED
+            else:
+                hard, cond, w10, max_dist = bool(entry.hard), _cond_field(entry), 0, DIST_UNBOUNDED
+            for t in members_of(_target_bits(target)):
+                if t != space_id:
+                    yield space_id.value, t.value, kind, hard, cond, w10, max_dist
+
+
+def build_soa_tables():
+    """
+    Walk ROOM_RULES once and fill the struct-of-arrays tables.
+    Unused model slots hold UNSPEC / TR_INVALID and are excluded via N_MODELS.
+    """
+    shape = (N_ROOMS, MAX_DIM_MODELS)
+    tables = {
+        "N_MODELS": np.zeros(N_ROOMS, dtype=np.int32),
+        "WIDTHS": np.full(shape, UNSPEC, dtype=np.int32),
+        "LENGTHS": np.full(shape, UNSPEC, dtype=np.int32),
+        "TRM_MIN": np.full(shape, TR_INVALID, dtype=np.int32),
+        "TRM_MAX": np.full(shape, TR_INVALID, dtype=np.int32),
+        "LONG_AXIS_INC": np.full(shape, UNSPEC, dtype=np.int32),
+        "LONG_AXIS_VAR": np.zeros(shape, dtype=bool),
+        # Relationship masks: bit t set if room r has a rule targeting SPACE_ID t,
+        # with SPACE_GROUP targets expanded to all of their members
+        "HARD_ADJ": np.zeros(N_ROOMS, dtype=np.uint64),
+        "HARD_REQUIRED": np.zeros(N_ROOMS, dtype=np.uint64),
+        "SOFT_ADJ": np.zeros(N_ROOMS, dtype=np.uint64),
+        # Direct targets of rules with no condition; conditional ones are the
+        # direct_csr edges with a nonzero DIRECT_COND
+        "UNCONDITIONAL_ADJ": np.zeros(N_ROOMS, dtype=np.uint64),
+        "HARD_SEPARATION": np.zeros(N_ROOMS, dtype=np.uint64),
+        "SEPARATION": np.zeros(N_ROOMS, dtype=np.uint64),
+        "MUST_HIDE_FROM": np.zeros(N_ROOMS, dtype=np.uint64),
+        "MUST_BE_VISIBLE_FROM": np.zeros(N_ROOMS, dtype=np.uint64),
+        "MUST_CONNECT": np.zeros(N_ROOMS, dtype=np.uint64),
+        "MUST_NOT_TERMINATE": np.zeros(N_ROOMS, dtype=np.uint64),
+        # ENTRIES_MIN[r, n] / ENTRIES_MAX[r, n] == entry count bounds with n treatment rooms
+        "ENTRIES_MIN": np.full((N_ROOMS, TR_COUNT_MAX + 1), ENTRY_UNSET, dtype=np.int8),
+        "ENTRIES_MAX": np.full((N_ROOMS, TR_COUNT_MAX + 1), ENTRY_UNSET, dtype=np.int8),
+        # OPT_WEIGHTS[r, t] == summed preferredProximity weight from r toward t
+        "OPT_WEIGHTS": np.zeros((N_ROOMS, N_ROOMS), dtype=np.float32),
+        # PROX_MAX_DIST[r, t] == tightest preferredProximity maxDistanceInches from r
+        # toward t (Manhattan, whole inches); DIST_UNBOUNDED where no rule caps the pair
+        "PROX_MAX_DIST": np.full((N_ROOMS, N_ROOMS), DIST_UNBOUNDED, dtype=np.int32),
+        # CENTER_BIAS_W[r] == optimization.centerBias weight, 0 if none
+        "CENTER_BIAS_W": np.zeros(N_ROOMS, dtype=np.float32),
+        # Integer-tenths copies of the weights, see WEIGHT_SCALE / BIASES
+        "OPT_WEIGHTS_10": np.zeros((N_ROOMS, N_ROOMS), dtype=np.int8),
+        "CENTER_BIAS_10": np.zeros(N_ROOMS, dtype=np.int8),
+        "SAME_CATEGORY_BONUS_10": np.zeros(N_ROOMS, dtype=np.int8),
+        # ORIENTATION_TABLE[r, layout] == [allowed, longAxisRelation, placementHint, connectsCorridors]
+        "ORIENTATION_TABLE": np.full((N_ROOMS, N_LAYOUTS, 4), ORIENT_UNSET, dtype=np.int8),
+    }
+
+    for space_id, rule in ROOM_RULES.items():
+        row = space_id.value
+
+        models = rule.geometry.dimension_models
+        tables["N_MODELS"][row] = len(models)
+        for i, m in enumerate(models):
+            tables["WIDTHS"][row, i] = _dim_field(m.width_inches)
+            tables["LENGTHS"][row, i] = _dim_field(m.length_inches)
+            tables["TRM_MIN"][row, i] = _tr_field(m.treatment_rooms_min)
+            tables["TRM_MAX"][row, i] = _tr_field(m.treatment_rooms_max)
+            tables["LONG_AXIS_INC"][row, i] = _dim_field(m.long_axis_increment_per_door_inches)
+            tables["LONG_AXIS_VAR"][row, i] = bool(m.long_axis_variable)
+
+        _fill_entry_counts(
+            rule.access.entry_count_rules,
+            tables["ENTRIES_MIN"][row],
+            tables["ENTRIES_MAX"][row],
+        )
+
+        adjacency = rule.adjacency
+        visibility = rule.visibility
+        circulation = rule.circulation
+        tables["HARD_ADJ"][row] = _rule_bits(adjacency.direct, hard=True)
+        tables["HARD_REQUIRED"][row] = _required_bits(adjacency.direct)
+        tables["SOFT_ADJ"][row] = _rule_bits(adjacency.direct, hard=False)
+        tables["UNCONDITIONAL_ADJ"][row] = _unconditional_bits(adjacency.direct)
+        tables["HARD_SEPARATION"][row] = _rule_bits(adjacency.separation, hard=True)
+        tables["SEPARATION"][row] = tables["HARD_SEPARATION"][row] | _rule_bits(adjacency.separation, hard=False)
+        tables["MUST_HIDE_FROM"][row] = _rule_bits(visibility.must_be_hidden_from, hard=True)
+        tables["MUST_BE_VISIBLE_FROM"][row] = _rule_bits(visibility.must_be_visible_from, hard=True)
+        tables["MUST_CONNECT"][row] = _targets_bits(circulation.must_connect)
+        tables["MUST_NOT_TERMINATE"][row] = _targets_bits(circulation.must_not_terminate_into)
+
+        for prox in adjacency.preferred_proximity:
+            weight = float(prox.optimization_weight or 0.0)
+            for t in members_of(_target_bits(prox.target)):
+                if t != space_id:
+                    tables["OPT_WEIGHTS"][row, t.value] += weight
+                    tables["OPT_WEIGHTS_10"][row, t.value] += to_tenths(weight)
+                    tables["PROX_MAX_DIST"][row, t.value] = min(
+                        tables["PROX_MAX_DIST"][row, t.value], prox.max_distance_inches
+                    )  # NO_LIMIT leaves DIST_UNBOUNDED
+
+        center_bias = rule.optimization.center_bias or {}
+        cohesion = rule.optimization.layout_cohesion_bias or {}
+        tables["CENTER_BIAS_W"][row] = float(center_bias.get("weight") or 0.0)
+        tables["CENTER_BIAS_10"][row] = to_tenths(center_bias.get("weight"))
+        tables["SAME_CATEGORY_BONUS_10"][row] = to_tenths(cohesion.get("sameCategoryBonus"))
+
+        # Rooms keyed by something other than LAYOUT_ENUM (treatment room) keep ORIENT_UNSET
+        for layout, o in rule.orientation.items():
+            if isinstance(layout, LAYOUT_ENUM):
+                tables["ORIENTATION_TABLE"][row, layout.value] = (
+                    _flag_field(o.allowed),
+                    _enum_field(o.long_axis_relation),
+                    _enum_field(o.placement_hint),
+                    _flag_field(o.connects_corridors),
+                )
+
+    # RELATED[r]: bit t set if any pair rule of r mentions t (adjacency, separation,
+    # visibility, circulation or a preferredProximity weight / distance cap). A clear bit means the
+    # pair (r, t) can be skipped without consulting the per-relation tables.
+    tables["RELATED"] = np.bitwise_or.reduce([
+        tables[name] for name in (
+            "HARD_ADJ", "SOFT_ADJ", "SEPARATION", "MUST_HIDE_FROM",
+            "MUST_BE_VISIBLE_FROM", "MUST_CONNECT", "MUST_NOT_TERMINATE",
+        )
+    ]) | np.array([
+        mask_of(SPACE_IDS[t] for t in np.flatnonzero(row))
+        for row in (tables["OPT_WEIGHTS"] != 0) | (tables["PROX_MAX_DIST"] != DIST_UNBOUNDED)
+    ], dtype=np.uint64)
+
+    # LAYOUT_ALLOWED[r, layout] is False only where the rule says allowed: False;
+    # a room or layout with no orientation entry is unrestricted
+    tables["LAYOUT_ALLOWED"] = tables["ORIENTATION_TABLE"][:, :, ORIENT_ALLOWED] != 0
+    # LAYOUT_DISALLOWED[layout]: the same, per layout, as a mask of the rooms it excludes
+    tables["LAYOUT_DISALLOWED"] = np.array(
+        [mask_of(SPACE_IDS[r] for r in np.flatnonzero(~column)) for column in tables["LAYOUT_ALLOWED"].T],
+        dtype=np.uint64,
+    )
+
+    # SPACE_GROUP_MEMBERSHIP[r, g] is True if SPACE_ID r is a member of the g-th SPACE_GROUP
+    tables["SPACE_GROUP_MEMBERSHIP"] = np.array(
+        [[space_id in SPACE_GROUP_MEMBERS[g] for g in SPACE_GROUP] for space_id in SPACE_ID], dtype=bool
+    )
+
+    # ROOM_GROUPS[r]: the same membership packed into a uint64, bit group_bit(g) per
+    # SPACE_GROUP, so "is r in any of these groups" is one AND against a group mask
+    tables["ROOM_GROUPS"] = (
+        tables["SPACE_GROUP_MEMBERSHIP"].astype(np.uint64) << np.arange(len(SPACE_GROUP), dtype=np.uint64)
+    ).sum(axis=1, dtype=np.uint64)
+
+    # TARGET_MASKS[target] == SPACE_IDs a rule target covers, for a SPACE_ID or SPACE_GROUP
+    tables["TARGET_MASKS"] = np.array(
+        [_target_bits(t) for t in (*SPACE_ID, *SPACE_GROUP)], dtype=np.uint64
+    )
+
+    tables["BIASES"] = (
+        (tables["CENTER_BIAS_10"].view(np.uint8).astype(np.uint64) << np.uint64(BIAS_CENTER_SHIFT))
+        | (tables["SAME_CATEGORY_BONUS_10"].view(np.uint8).astype(np.uint64) << np.uint64(BIAS_SAME_CATEGORY_SHIFT))
+    )
+
+    counts = tables["N_MODELS"]
+    tables["DIM_MODEL_START"] = (np.cumsum(counts) - counts).astype(np.int32)
+    dim_models = np.zeros(int(counts.sum()), dtype=DIM_DTYPE)
+    for row in np.flatnonzero(counts):
+        block = dim_models[tables["DIM_MODEL_START"][row]:][:counts[row]]
+        block["room_id"] = row
+        block["trmin"] = tables["TRM_MIN"][row, :counts[row]]
+        block["trmax"] = tables["TRM_MAX"][row, :counts[row]]
+        block["w"] = tables["WIDTHS"][row, :counts[row]]
+        block["l"] = tables["LENGTHS"][row, :counts[row]]
+        block["inc"] = tables["LONG_AXIS_INC"][row, :counts[row]]
+        block["var"] = tables["LONG_AXIS_VAR"][row, :counts[row]]
+    tables["DIM_MODELS"] = dim_models
+
+    # Pair relations in CSR form, flattened to <NAME>_INDPTR / _INDICES / _DATA so
+    # they are cached and memory-mapped with the rest; _csr_table reassembles them
+    for name, relation, data in (
+        ("SEP", "SEPARATION", "HARD_SEPARATION"),
+        ("HIDDEN", "MUST_HIDE_FROM", None),
+        ("VISIBLE", "MUST_BE_VISIBLE_FROM", None),
+    ):
+        csr = _csr(_pairwise(tables[relation]), None if data is None else _pairwise(tables[data]))
+        tables[f"{name}_INDPTR"] = csr.indptr
+        tables[f"{name}_INDICES"] = csr.indices
+        tables[f"{name}_DATA"] = csr.data
+
+    # Separation is symmetric, and many pairs are written from both rooms. SEP_SYM
+    # keeps each unordered pair once, as (min, max); _DATA is hard if either side is
+    sep = _pairwise(tables["SEPARATION"])
+    hard = _pairwise(tables["HARD_SEPARATION"])
+    csr = _csr(np.triu(sep | sep.T, k=1), data=hard | hard.T)
+    tables["SEP_SYM_INDPTR"] = csr.indptr
+    tables["SEP_SYM_INDICES"] = csr.indices
+    tables["SEP_SYM_DATA"] = csr.data
+
+    # Direct adjacency as an edge list in the same CSR layout: one edge per
+    # (rule, expanded target) in rule order, so a target reached twice appears
+    # twice. _DATA is the hard flag and _COND the rule's condition (_cond_field:
+    # 0 when unconditional, CONDITION_ENUM.NONE included).
+    indptr = np.zeros(N_ROOMS + 1, dtype=np.int32)
+    indices, hard, cond = [], [], []
+    for space_id in SPACE_ID:
+        rule = ROOM_RULES.get(space_id)
+        for entry in rule.adjacency.direct if rule else ():
+            targets = members_of(_target_bits(entry.target))
+            indices += [t.value for t in targets]
+            hard += [bool(entry.hard)] * len(targets)
+            cond += [_cond_field(entry)] * len(targets)
+        indptr[space_id.value + 1] = len(indices)
+    tables["DIRECT_INDPTR"] = indptr
+    tables["DIRECT_INDICES"] = np.array(indices, dtype=np.int32)
+    tables["DIRECT_DATA"] = np.array(hard, dtype=bool)
+    tables["DIRECT_COND"] = np.array(cond, dtype=np.int8)
+
+    tables["PAIR_RULES"] = np.array(
+        [row for space_id in SPACE_ID if space_id in ROOM_RULES
+         for row in _pair_rule_rows(space_id, ROOM_RULES[space_id])],
+        dtype=PAIR_RULE_DTYPE,
+    )
+
+    return tables
+
+
+def _cache_version():
+    stats = [p.stat() for p in _CACHE_SOURCES]
+    key = repr([(st.st_mtime_ns, st.st_size) for st in stats]).encode()
+    return f"v{hashlib.blake2b(key, digest_size=8).hexdigest()}"
+
+
+def _load_tables():
+    cache_dir = None
+    if _CACHE_ROOT:
+        try:
+            cache_dir = Path(_CACHE_ROOT) / _cache_version()
+            if (cache_dir / _CACHE_STAMP).exists():
+                return {
+                    path.stem: np.load(path, mmap_mode="r")
+                    for path in cache_dir.glob("*.npy")
+                }
+        except (OSError, ValueError):
+            pass
+
+    tables = build_soa_tables()
+    # Read-only like the memory-mapped tables, so cold and warm imports agree
+    for table in tables.values():
+        table.flags.writeable = False
+
+    # Best effort: an unwritable cache dir just rebuilds on every import.
+    # Each version is built aside and renamed into place whole, and published
+    # versions are never modified or removed, so a reader can't see a partial
+    # or vanishing directory. If another process publishes first, its copy wins.
+    if cache_dir is not None:
+        tmp_dir = cache_dir.with_name(f"{cache_dir.name}.{os.getpid()}.tmp")
+        try:
+            tmp_dir.mkdir(parents=True)
+            for name, table in tables.items():
+                np.save(tmp_dir / f"{name}.npy", table)
+            (tmp_dir / _CACHE_STAMP).touch()
+            os.rename(tmp_dir, cache_dir)
+        except OSError:
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+
+    return tables
+
+
+_TABLES = _load_tables()
+N_MODELS = _TABLES["N_MODELS"]
+WIDTHS = _TABLES["WIDTHS"]
+LENGTHS = _TABLES["LENGTHS"]
+TRM_MIN = _TABLES["TRM_MIN"]
+TRM_MAX = _TABLES["TRM_MAX"]
+LONG_AXIS_INC = _TABLES["LONG_AXIS_INC"]
+LONG_AXIS_VAR = _TABLES["LONG_AXIS_VAR"]
+HARD_ADJ = _TABLES["HARD_ADJ"]
+HARD_REQUIRED = _TABLES["HARD_REQUIRED"]
+SOFT_ADJ = _TABLES["SOFT_ADJ"]
+UNCONDITIONAL_ADJ = _TABLES["UNCONDITIONAL_ADJ"]
+HARD_SEPARATION = _TABLES["HARD_SEPARATION"]
+SEPARATION = _TABLES["SEPARATION"]
+MUST_HIDE_FROM = _TABLES["MUST_HIDE_FROM"]
+MUST_BE_VISIBLE_FROM = _TABLES["MUST_BE_VISIBLE_FROM"]
+MUST_CONNECT = _TABLES["MUST_CONNECT"]
+MUST_NOT_TERMINATE = _TABLES["MUST_NOT_TERMINATE"]
+OPT_WEIGHTS = _TABLES["OPT_WEIGHTS"]
+PROX_MAX_DIST = _TABLES["PROX_MAX_DIST"]
+CENTER_BIAS_W = _TABLES["CENTER_BIAS_W"]
+OPT_WEIGHTS_10 = _TABLES["OPT_WEIGHTS_10"]
+CENTER_BIAS_10 = _TABLES["CENTER_BIAS_10"]
+SAME_CATEGORY_BONUS_10 = _TABLES["SAME_CATEGORY_BONUS_10"]
+BIASES = _TABLES["BIASES"]
+TARGET_MASKS = _TABLES["TARGET_MASKS"]
+SPACE_GROUP_MEMBERSHIP = _TABLES["SPACE_GROUP_MEMBERSHIP"]
+ROOM_GROUPS = _TABLES["ROOM_GROUPS"]
+# GROUP_ROOMS[group_bit(g)]: SPACE_ID values in SPACE_GROUP g, ascending
+GROUP_ROOMS = tuple(np.flatnonzero(column).astype(np.int16) for column in SPACE_GROUP_MEMBERSHIP.T)
+DIM_MODELS = _TABLES["DIM_MODELS"]
+PAIR_RULES = _TABLES["PAIR_RULES"]
+DIM_MODEL_START = _TABLES["DIM_MODEL_START"]
+ENTRIES_MIN = _TABLES["ENTRIES_MIN"]
+ENTRIES_MAX = _TABLES["ENTRIES_MAX"]
+ORIENTATION_TABLE = _TABLES["ORIENTATION_TABLE"]
+LAYOUT_ALLOWED = _TABLES["LAYOUT_ALLOWED"]
+LAYOUT_DISALLOWED = _TABLES["LAYOUT_DISALLOWED"]
+RELATED = _TABLES["RELATED"]
+
+
+def _entry_arrays(entries_of):
+    # Per room, its target list as parallel arrays: target value (SPACE_ID or
+    # SPACE_GROUP, unexpanded; expand with TARGET_MASKS) and hard flag
+    targets = {}
+    hard = {}
+    for space_id, rule in ROOM_RULES.items():
+        entries = [e for e in entries_of(rule) if e.target is not None]
+        targets[space_id] = np.array([e.target for e in entries], dtype=np.int16)
+        hard[space_id] = np.array([e.hard for e in entries], dtype=bool)
+    return targets, hard
+
+
+def _csr_table(name):
+    csr = SimpleNamespace(
+        indptr=_TABLES[f"{name}_INDPTR"],
+        indices=_TABLES[f"{name}_INDICES"],
+        data=_TABLES[f"{name}_DATA"],
+    )
+    if f"{name}_COND" in _TABLES:
+        csr.cond = _TABLES[f"{name}_COND"]
+    # Source room of each entry (the COO row column), for whole-relation masking
+    csr.rows = np.repeat(np.arange(N_ROOMS, dtype=np.int32), np.diff(csr.indptr))
+    csr.rows.flags.writeable = False
+    return csr
+
+
+def _compile_rules():
+    """
+    Dense per-room / per-pair views of the tables for vectorized constraint
+    generation, e.g. rows, cols = np.nonzero(RULES_TABLE.sep[np.ix_(ids, ids)]).
+    """
+    sep_targets, sep_hard = _entry_arrays(lambda rule: rule.adjacency.separation)
+    direct_targets, direct_hard = _entry_arrays(lambda rule: rule.adjacency.direct)
+
+    sep = _pairwise(SEPARATION)
+
+    return SimpleNamespace(
+        hard_sep=_pairwise(HARD_SEPARATION),
+        sep=sep,
+        # CSR relation lists; sep_csr.data is the hard flag of each pair
+        sep_csr=_csr_table("SEP"),
+        # sep_csr with each unordered pair once (r < t)
+        sep_sym_csr=_csr_table("SEP_SYM"),
+        hidden_csr=_csr_table("HIDDEN"),
+        visible_csr=_csr_table("VISIBLE"),
+        # direct_csr.data is the hard flag, direct_csr.cond the condition, per edge
+        direct_csr=_csr_table("DIRECT"),
+        hard_adj=_pairwise(HARD_ADJ),
+        separation_targets=sep_targets,
+        separation_hard=sep_hard,
+        direct_targets=direct_targets,
+        direct_hard=direct_hard,
+        pref_prox_w=OPT_WEIGHTS,
+        prox_max_dist=PROX_MAX_DIST,
+        center_bias_w=CENTER_BIAS_W,
+        pref_prox_w10=OPT_WEIGHTS_10,
+        center_bias_w10=CENTER_BIAS_10,
+        same_category_bonus10=SAME_CATEGORY_BONUS_10,
+        biases=BIASES,
+        dim_w=WIDTHS,
+        dim_l=LENGTHS,
+        min_entries=ENTRIES_MIN,
+        max_entries=ENTRIES_MAX,
+        layout_allowed=LAYOUT_ALLOWED,
+        related=RELATED,
+        room_groups=ROOM_GROUPS,
+        unconditional_adj=UNCONDITIONAL_ADJ,
+        must_connect=MUST_CONNECT,
+        must_not_terminate=MUST_NOT_TERMINATE,
+        pair_rules=PAIR_RULES,
+    )
+
+
+RULES_TABLE = _compile_rules()
+
+
+def placed_pairs(csr, space_ids):
+    """
+    (r, t) SPACE_ID pairs from a RULES_TABLE CSR relation with r != t and both
+    in space_ids, ordered by r then t.
+    """
+    placed = np.zeros(N_ROOMS, dtype=bool)
+    placed[np.fromiter(space_ids, dtype=np.int32)] = True
+    keep = placed[csr.rows] & placed[csr.indices] & (csr.rows != csr.indices)
+    return [
+        (SPACE_IDS[r], SPACE_IDS[t])
+        for r, t in zip(csr.rows[keep].tolist(), csr.indices[keep].tolist())
+    ]
+
+
+def get_orientation(space_id, layout):
+    """
+    (allowed, longAxisRelation, placementHint, connectsCorridors) for a room in a layout.
+
+    Flags are 0/1 with ORIENT_UNSET (-1) for missing; enum columns hold the
+    member .value, 0 for None, ORIENT_UNSET if the layout has no entry.
+    """
+    return tuple(ORIENTATION_TABLE[space_id.value, layout.value].tolist())
+
+
+def is_allowed(space_id, layout):
+    """False if the room's orientation rule disallows it in this layout."""
+    return bool(LAYOUT_ALLOWED[space_id.value, layout.value])
+
+
+def get_entry_bounds(space_id, num_treatment_rooms):
+    """
+    (minEntries, maxEntries) for a room type at a treatment-room count.
+
+    maxEntries is NO_LIMIT when unbounded. Returns None if no entryCountRule covers
+    the count; counts above TR_COUNT_MAX use the TR_COUNT_MAX bin.
+    """
+    n = min(max(num_treatment_rooms, 0), TR_COUNT_MAX)
+    mn = int(ENTRIES_MIN[space_id.value, n])
+    if mn == ENTRY_UNSET:
+        return None
+    mx = int(ENTRIES_MAX[space_id.value, n])
+    return mn, (NO_LIMIT if mx == ENTRY_UNBOUNDED else mx)
+
+
+def dim_models_of(space_id):
+    """The room's DIM_MODELS records, in rule order (a view, no copy)."""
+    row = space_id.value
+    start = DIM_MODEL_START[row]
+    return DIM_MODELS[start:start + N_MODELS[row]]
+
+
+def pick_model(space_id, num_treatment_rooms):
+    """
+    DIM_MODELS record of the tier containing num_treatment_rooms, else the
+    room's first generic (untiered) model, else None.
+
+    Tiers are searched by lower bound with np.searchsorted; where tiers
+    overlap, the one with the highest lower bound wins.
+    """
+    rows = dim_models_of(space_id)
+    n = num_treatment_rooms
+    trmin = rows["trmin"]
+    trmax = rows["trmax"]
+
+    generic = is_unspec(trmin) & (trmax == UNBOUNDED)
+    tiers = np.flatnonzero((trmin != TR_INVALID) & (trmax != TR_INVALID) & ~generic)
+    tiers = tiers[np.argsort(trmin[tiers], kind="stable")]
+
+    i = int(np.searchsorted(trmin[tiers], n, side="right")) - 1
+    if i >= 0 and n <= trmax[tiers[i]]:
+        return rows[tiers[i]]
+    if generic.any():
+        return rows[int(np.argmax(generic))]
+    return None
+
+
+def nearest_dim_model(space_id, num_treatment_rooms):
+    """
+    DIM_MODELS record of the room's model whose treatment-room tier is closest
+    to num_treatment_rooms (GEOMETRY_FALLBACK_ENUM.NEAREST_MATCH).
+
+    Distance is 0 inside the tier (an unset bound is open), otherwise the gap to
+    the nearer bound; ties go to the earlier model. Returns None if the room has
+    no dimensionModels or none with a valid tier.
+    """
+    rows = dim_models_of(space_id)
+    if rows.size == 0:
+        return None
+
+    n = num_treatment_rooms
+    trmin = rows["trmin"].astype(np.int32)
+    trmax = rows["trmax"].astype(np.int32)
+    dist = np.maximum(trmin - n, 0) + np.maximum(n - trmax, 0)
+    dist[(trmin == TR_INVALID) | (trmax == TR_INVALID)] = np.iinfo(np.int32).max
+
+    idx = int(np.argmin(dist))
+    if dist[idx] == np.iinfo(np.int32).max:
+        return None
+    return rows[idx]
+
+
+def candidate_dims(space_id, num_treatment_rooms):
+    """
+    Known (widths, lengths) of the candidate dimension models for a room type.
+
+    Preference order: tier-matching models, then generic (no tier bounds),
+    then every model. Returns None if the room has no dimensionModels.
+    """
+    row = space_id.value
+    count = N_MODELS[row]
+    if count == 0:
+        return None
+
+    tr_min = TRM_MIN[row, :count]
+    tr_max = TRM_MAX[row, :count]
+    n = num_treatment_rooms
+
+    valid = (tr_min != TR_INVALID) & (tr_max != TR_INVALID)
+    generic = is_unspec(tr_min) & (tr_max == UNBOUNDED)
+    matching = valid & (tr_min <= n) & (n <= tr_max) & ~generic
+
+    if matching.any():
+        selected = matching
+    elif generic.any():
+        selected = generic
+    else:
+        selected = np.ones(count, dtype=bool)
+
+    widths = WIDTHS[row, :count][selected]
+    lengths = LENGTHS[row, :count][selected]
+    return widths[~is_unspec(widths)], lengths[~is_unspec(lengths)]
+
+
+def missing_hard_adjacency(space_id, placed_mask):
+    """
+    Bits of the required adjacency partners of space_id that are not in placed_mask.
+    Only hard, unconditional rules naming a SPACE_ID count; group targets and
+    IF_PRESENT rules are satisfied by whatever is placed.
+    """
+    return HARD_REQUIRED[space_id.value] & ~placed_mask
+
+
+def unconnected(space_id, reached_mask, placed_mask):
+    """
+    Bits of the placed mustConnect targets of space_id that are not in reached_mask;
+    0 once its circulation reaches all of them. SPACE_GROUP targets are pre-expanded.
+    """
+    return MUST_CONNECT[space_id.value] & np.uint64(placed_mask) & ~np.uint64(reached_mask)
+
+
+def terminates_into(space_id, end_mask):
+    """Bits of end_mask that space_id's circulation must not terminate into (mustNotTerminateInto)."""
+    return MUST_NOT_TERMINATE[space_id.value] & np.uint64(end_mask)
+
+
+# ----------------------------
+# Compiled count rules
+# ----------------------------
+# Existence rules driven by building square footage / occupancy are compiled
+# into a plain function count(sqft, occupancy) -> minimum room count, so a
+# caller doesn't walk the rule dicts and dispatch on enums per candidate.
+# Rules combine by max(); a PER_N_UNITS rule extends the threshold rule before
+# it on the same driver by +min per threshold units past that rule's threshold.
+
+_COUNT_ARGS = {
+    COUNT_DRIVER_ENUM.BUILDING_SQFT: "sqft",
+    COUNT_DRIVER_ENUM.OCCUPANCY: "occupancy",
+}
+
+
+def _compile_count_rule(rules):
+    """
+    Generate count(sqft, occupancy) for a room's countRules, or None if any rule
+    depends on something else (treatment rooms, layout, presence) or has no
+    encoded threshold.
+    """
+    branches = []  # [driver arg or None, threshold, expression]
+    last_threshold = {}  # driver arg -> its latest IF_GREATER_THAN branch
+
+    for rule in rules:
+        driver = rule.driver
+        condition = rule.condition
+        mn = rule.min
+        threshold = rule.threshold
+        arg = _COUNT_ARGS.get(driver)
+
+        if condition in (None, CONDITION_ENUM.NONE, CONDITION_ENUM.ALWAYS):
+            if arg is None and driver != COUNT_DRIVER_ENUM.FIXED:
+                return None
+            if _is_num(mn):
+                branches.append([None, None, str(int(mn))])
+        elif condition == CONDITION_ENUM.IF_GREATER_THAN and arg and _is_num(threshold) and _is_num(mn):
+            last_threshold[arg] = [arg, int(threshold), str(int(mn))]
+            branches.append(last_threshold[arg])
+        elif condition == CONDITION_ENUM.PER_N_UNITS and arg in last_threshold and _is_num(threshold) and _is_num(mn):
+            prev = last_threshold[arg]
+            prev[2] += f" + {int(mn)} * (({arg} - {prev[1]} - 1) // {int(threshold)})"
+        else:
+            return None
+
+    if not last_threshold:
+        return None
+
+    body = ["count = 0"]
+    for arg, threshold, expr in branches:
+        if arg is None:
+            body.append(f"count = max(count, {expr})")
+        else:
+            body.append(f"if {arg} > {threshold}:\n    count = max(count, {expr})")
+    body.append("return count")
+
+    source = "def count(sqft, occupancy):\n" + textwrap.indent("\n".join(body), "    ")
+    namespace = {}
+    exec(source, namespace)
+    return namespace["count"]
+
+
+COUNT_FNS = {}
+for _space_id, _rule in ROOM_RULES.items():
+    _fn = _compile_count_rule(_rule.existence.count_rules)
+    if _fn is not None:
+        COUNT_FNS[_space_id] = _fn
+
+PATIENT_RESTROOM_COUNT_FN = COUNT_FNS.get(SPACE_ID.PATIENT_RESTROOM)
@@ -1,19 +1,67 @@
 # layout_model.py
 #
-# Skeleton MIP layout model on a 1-inch discrete grid.
+# Skeleton CP-SAT layout model on a 1-inch discrete grid.
 # - Rooms are axis-aligned rectangles with integer coordinates (x, y, w, h)
 # - Entrances are discrete integer positions on the rectangle perimeter
 # - Constraint details live in layout_constraints.py
 
-from ortools.linear_solver import pywraplp # pyright: ignore[reportMissingImports]
+import argparse
+import json
+
+import numpy as np
+from ortools.sat.python import cp_model # pyright: ignore[reportMissingImports]
 
 from ..architecture.constraints import *
+from ..architecture.kernels import eval_room_constraints
 from ..architecture.room_rules import ROOM_RULES
+from ..architecture.rule_tables import mask_of, members_of, missing_hard_adjacency
+
+ROOM_TYPES = tuple(
+    r for r in SPACE_ID
+    if r not in {
+        SPACE_ID.MECHANICAL,
+        SPACE_ID.STAFF_ENTRY,
+    }
+)
+
+# for testing we will focus on implementing pipeline in these rooms first
+TEST_ROOM_TYPES = (
+    SPACE_ID.DOCTOR_OFFICE,
+    SPACE_ID.STERILIZATION,
+    SPACE_ID.PATIENT_RESTROOM,
+    SPACE_ID.PATIENT_LOUNGE,
+    SPACE_ID.CROSSOVER_HALLWAY,
+    SPACE_ID.CLINICAL_CORRIDOR,
+    SPACE_ID.TREATMENT_ROOM,
+)
+
 
 def _make_instance_id(room_type: str, idx: int) -> str:
     return f"{room_type}__{idx}"
 
 
+def _greedy_pack(rooms, min_sizes, building_width_in, building_height_in):
+    """
+    Shelf-pack rooms at their minimum sizes, tallest first: left to right
+    along a shelf, opening a new shelf on top when the row is full.
+    The sort is stable, so instances of one type keep their row-major order.
+    Returns {room: (x, y)}, or None if they do not fit the shell.
+    """
+    origins = {}
+    shelf_y = shelf_h = cursor_x = 0
+    for r in sorted(rooms, key=lambda r: -min_sizes[r][1]):
+        rw, rh = min_sizes[r]
+        if cursor_x + rw > building_width_in:
+            shelf_y += shelf_h
+            cursor_x = shelf_h = 0
+        if rw > building_width_in or shelf_y + rh > building_height_in:
+            return None
+        origins[r] = (cursor_x, shelf_y)
+        cursor_x += rw
+        shelf_h = max(shelf_h, rh)
+    return origins
+
+
 def build_layout_model(
     building_width_in,
     building_height_in,
@@ -22,34 +70,49 @@ def build_layout_model(
     max_entrances_per_room=2,
 ):
     """
-    Build a mixed-integer model on a 1-inch discrete grid.
+    Build a CP-SAT model on a 1-inch discrete grid.
 
     - building_width_in, building_height_in: total shell size in inches. Current iteration assumes rectangular shell
     - rooms: list of room INSTANCE identifiers (e.g., "TREATMENT_ROOM__0")
     - num_treatment_rooms: scalar used by tiered rules (sterilization)
     - max_entrances_per_room: maximum number of door locations we allow per room in v1
-    - NOTE: CBC is linear solver only, constraints may have addition, multiplication by a constant, and logical evals
+    - NOTE: CP-SAT is integer-only; every variable and coefficient must be an integer
     Returns:
-        solver, vars_dict
+        model, vars_dict
+    Raises ValueError if a room's rule sizes cannot fit the shell.
     """
-    solver = pywraplp.Solver.CreateSolver("CBC")
-    if solver is None:
-        raise RuntimeError("Could not create CBC solver")
+    model = cp_model.CpModel()
 
     # -------------------------------
     # Variables
     # Every room is represented by vertex and dimension pairs
     # -------------------------------
+    # Domains carry the rule min/max sizes directly, so no size rows are needed
+    # and a room's origin stops where its smallest allowed size would leave the shell
     x = {}
     y = {}
     w = {}
     h = {}
 
+    size_bounds = size_bounds_by_room(rooms, num_treatment_rooms)
+    min_sizes = {}
     for r in rooms:
-        x[r] = solver.IntVar(0, building_width_in, f"x_{r}")    # Args: (lower bound, upper bound, name)
-        y[r] = solver.IntVar(0, building_height_in, f"y_{r}")
-        w[r] = solver.IntVar(1, building_width_in, f"w_{r}")
-        h[r] = solver.IntVar(1, building_height_in, f"h_{r}")
+        min_w, min_h, max_w, max_h = size_bounds[r]
+        w_lo = max(1, int(min_w)) if min_w is not None else 1
+        h_lo = max(1, int(min_h)) if min_h is not None else 1
+        w_hi = min(building_width_in, int(max_w)) if max_w is not None else building_width_in
+        h_hi = min(building_height_in, int(max_h)) if max_h is not None else building_height_in
+        if w_lo > w_hi or h_lo > h_hi:
+            raise ValueError(
+                f"{r} needs at least {w_lo} x {h_lo} in (at most {max_w} x {max_h}), "
+                f"which does not fit a {building_width_in} x {building_height_in} in shell"
+            )
+
+        x[r] = model.NewIntVar(0, building_width_in - w_lo, f"x_{r}")    # Args: (lower bound, upper bound, name)
+        y[r] = model.NewIntVar(0, building_height_in - h_lo, f"y_{r}")
+        w[r] = model.NewIntVar(w_lo, w_hi, f"w_{r}")
+        h[r] = model.NewIntVar(h_lo, h_hi, f"h_{r}")
+        min_sizes[r] = (w_lo, h_lo)
 
     entrance_x = {}
     entrance_y = {}
@@ -57,71 +120,73 @@ def build_layout_model(
 
     for r in rooms:
         for k in range(max_entrances_per_room):
-            entrance_x[(r, k)] = solver.IntVar(0, building_width_in, f"door_x_{r}_{k}")
-            entrance_y[(r, k)] = solver.IntVar(0, building_height_in, f"door_y_{r}_{k}")
-            entrance_active[(r, k)] = solver.BoolVar(f"door_active_{r}_{k}")
+            entrance_x[(r, k)] = model.NewIntVar(0, building_width_in, f"door_x_{r}_{k}")
+            entrance_y[(r, k)] = model.NewIntVar(0, building_height_in, f"door_y_{r}_{k}")
+            entrance_active[(r, k)] = model.NewBoolVar(f"door_active_{r}_{k}")
 
     # -------------------------------
     # Rules lookup per instance
     # -------------------------------
-    # Constraint functions do ROOM_RULES.get(r, {}) where r is the room INSTANCE id.
+    # Constraint functions do ROOM_RULES.get(r) where r is the room INSTANCE id.
     # For multiple instances, build a rules dict keyed by instance id.
-    ROOM_RULES_BY_INSTANCE = {}
-    for r in rooms:
-        base_type = r.split("__", 1)[0]
-        ROOM_RULES_BY_INSTANCE[r] = ROOM_RULES.get(base_type, {})
+    base_type_of = {r: r.split("__", 1)[0] for r in rooms}
+    ROOM_RULES_BY_INSTANCE = {r: ROOM_RULES.get(base_type_of[r]) for r in rooms}
 
     # -------------------------------
     # Constraints
     # -------------------------------
     add_room_bounds_constraints(
-        solver, rooms, x, y, w, h, building_width_in, building_height_in
+        model, rooms, x, y, w, h, building_width_in, building_height_in
     )
 
-    add_entry_bounds_constraints(
-        solver, rooms, x, y, w, h, entrance_x, entrance_y, entrance_active
+    # Door placement; corridor doors bind to the first corridor instance
+    corridor_instances = [r for r in rooms if base_type_of[r] == SPACE_ID.CLINICAL_CORRIDOR]
+    add_entrance_constraints(
+        model, rooms, x, y, w, h, entrance_x, entrance_y, entrance_active,
+        corridor_room_id=corridor_instances[0] if corridor_instances else None,
     )
 
-    add_non_overlap_constraints(solver, rooms, x, y, w, h)
-
-    # Corridor-specific constraints (pick the first corridor instance)
-    corridor_instances = [r for r in rooms if r.split("__", 1)[0] == SPACE_ID.CLINICAL_CORRIDOR]
-    if corridor_instances:
-        corridor_room_id = corridor_instances[0]
-        add_simple_entry_from_corridor_constraints(
-            solver,
-            rooms,
-            x,
-            y,
-            w,
-            h,
-            entrance_x,
-            entrance_y,
-            entrance_active,
-            corridor_room_id=corridor_room_id,
-        )
+    add_non_overlap_constraints(
+        model, rooms, x, y, w, h, building_width_in, building_height_in
+    )
+
+    # Instances of one room type are interchangeable, so order each group by
+    # origin (row-major) and the solver skips their k! relabelings. Non-overlap
+    # keeps two origins from coinciding, so the order is strict in practice.
+    # The corridor group is skipped: its first instance carries the corridor doors.
+    instances_by_type = {}
+    for r in rooms:
+        instances_by_type.setdefault(base_type_of[r], []).append(r)
+    for group in instances_by_type.values():
+        if corridor_instances and group[0] == corridor_instances[0]:
+            continue
+        for a, b in zip(group, group[1:]):
+            model.Add(
+                y[a] * (building_width_in + 1) + x[a] <= y[b] * (building_width_in + 1) + x[b]
+            )
 
     add_adjacency_constraints_from_rules(
-        solver, rooms, x, y, w, h
+        model, rooms, x, y, w, h, building_width_in, building_height_in
     )
     add_visibility_constraints_from_rules(
-        solver, rooms, x, y, w, h
+        model, rooms, x, y, w, h, building_width_in, building_height_in
     )
 
-    # Min constraints include a soft "prefer larger above min" reward;
-    # no separate ideal-size objective is used.
-    add_room_min_constraints_from_rules(
-        solver, rooms, w, h, num_treatment_rooms
-    )
-    add_room_max_constraints_from_rules(
-        solver, rooms, w, h, num_treatment_rooms
-    )
+    # Start the search from a shelf packing at minimum sizes; CP-SAT repairs
+    # the parts of it that miss other constraints
+    origins = _greedy_pack(rooms, min_sizes, building_width_in, building_height_in)
+    if origins is not None:
+        for r, (ox, oy) in origins.items():
+            model.AddHint(x[r], ox)
+            model.AddHint(y[r], oy)
+            model.AddHint(w[r], min_sizes[r][0])
+            model.AddHint(h[r], min_sizes[r][1])
 
     # -------------------------------
     # Objective
     # -------------------------------
-    total_size = solver.Sum([w[r] + h[r] for r in rooms])
-    solver.Maximize(total_size)
+    # One flat sum over the size vars, not a nested w[r] + h[r] expression per room
+    model.Maximize(cp_model.LinearExpr.Sum([w[r] for r in rooms] + [h[r] for r in rooms]))
 
     vars_dict = {
         "x": x,
@@ -132,9 +197,10 @@ def build_layout_model(
         "entrance_y": entrance_y,
         "entrance_active": entrance_active,
         "ROOM_RULES_BY_INSTANCE": ROOM_RULES_BY_INSTANCE,
+        "base_type_of": base_type_of,
     }
 
-    return solver, vars_dict
+    return model, vars_dict
 
 
 def _prompt_nonnegative_int(prompt: str) -> int:
@@ -149,9 +215,7 @@ def _prompt_nonnegative_int(prompt: str) -> int:
             print("Please enter a valid integer.")
 
 
-def main():
-    print("=== Floorplan MIP Layout ===")
-
+def _prompt_config():
     #CLI interface for layout footprint
     print("Enter building shell size (inches).")
 
@@ -159,36 +223,81 @@ def main():
     building_height_in = _prompt_nonnegative_int("Building height in inches: ")
 
     if building_width_in <= 0 or building_height_in <= 0:
-        print("Building dimensions must be positive.")
-        return
-
-    room_types = [
-        r for r in SPACE_ID
-        if r not in {
-            SPACE_ID.MECHANICAL,
-            SPACE_ID.STAFF_ENTRY,
-        }
-    ]
-    
-    # for testing we will focus on implementing pipeline in these rooms first
-    test_room_types = [
-        SPACE_ID.DOCTOR_OFFICE,
-        SPACE_ID.STERILIZATION,
-        SPACE_ID.PATIENT_RESTROOM,
-        SPACE_ID.PATIENT_LOUNGE,
-        SPACE_ID.CROSSOVER_HALLWAY,
-        SPACE_ID.CLINICAL_CORRIDOR,
-        SPACE_ID.TREATMENT_ROOM
-    ]
+        return building_width_in, building_height_in, {}
 
     print("\nEnter desired count for each room type (0 for none).\n")
 
-    selected_rooms = []
     counts_by_type = {}
-    for rt in test_room_types:
-        count = _prompt_nonnegative_int(f"{rt}: ")
-        counts_by_type[rt] = count
+    for rt in TEST_ROOM_TYPES:
+        counts_by_type[rt] = _prompt_nonnegative_int(f"{rt}: ")
+    return building_width_in, building_height_in, counts_by_type
+
 
+def _load_config(path):
+    """
+    Read a batch run from JSON instead of prompting:
+
+        {"building_width_in": 2400, "building_height_in": 1200,
+         "counts": {"TREATMENT_ROOM": 5, "DOCTOR_OFFICE": 1}}
+
+    counts are keyed by SPACE_ID name; any room type may be listed.
+    """
+    with open(path) as f:
+        cfg = json.load(f)
+    if not isinstance(cfg, dict):
+        raise ValueError("config must be a JSON object")
+    if not isinstance(cfg.get("counts", {}), dict):
+        raise ValueError("counts must be a JSON object")
+
+    def _count(key, value):
+        if not isinstance(value, int) or isinstance(value, bool) or value < 0:
+            raise ValueError(f"{key} must be a non-negative integer, got {value!r}")
+        return value
+
+    building_width_in = _count("building_width_in", cfg.get("building_width_in"))
+    building_height_in = _count("building_height_in", cfg.get("building_height_in"))
+
+    counts_by_type = {}
+    for name, count in cfg.get("counts", {}).items():
+        if name not in SPACE_ID.__members__:
+            raise ValueError(f"unknown room type {name!r}")
+        counts_by_type[SPACE_ID[name]] = _count(name, count)
+    return building_width_in, building_height_in, counts_by_type
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Floorplan MIP layout")
+    parser.add_argument(
+        "--config", metavar="PATH",
+        help="JSON file with the shell size and room counts; skips the prompts",
+    )
+    parser.add_argument(
+        "--time-limit", type=float, metavar="SECONDS",
+        help="stop the search after this long and report the best layout found",
+    )
+    parser.add_argument(
+        "--workers", type=int, default=0, metavar="N",
+        help="parallel search workers (default: 0, one per core)",
+    )
+    args = parser.parse_args(argv)
+
+    print("=== Floorplan MIP Layout ===")
+
+    if args.config:
+        try:
+            building_width_in, building_height_in, counts_by_type = _load_config(args.config)
+        except (OSError, ValueError) as e:
+            print(f"Could not read config: {e}")
+            return
+    else:
+        building_width_in, building_height_in, counts_by_type = _prompt_config()
+
+    if building_width_in <= 0 or building_height_in <= 0:
+        print("Building dimensions must be positive.")
+        return
+
+    selected_rooms = []
+    for rt, count in counts_by_type.items():
         if count > 0 and rt not in ROOM_RULES:
             print(f"  [warning] No ROOM_RULES entry for '{rt}', it will have only generic constraints.")
 
@@ -199,44 +308,69 @@ def main():
         print("No rooms selected (all counts were 0). Nothing to solve.")
         return
 
+    # Flag room types whose required adjacency partners were not selected
+    present = [rt for rt, count in counts_by_type.items() if count > 0]
+    program = mask_of(present)
+    scores = eval_room_constraints(
+        np.full(len(present), program, dtype=np.uint64),
+        np.array([rt.value for rt in present], dtype=np.int32),
+    )
+    for rt, score in zip(present, scores):
+        if np.isneginf(score):
+            missing = members_of(missing_hard_adjacency(rt, program))
+            verb = "were" if len(missing) > 1 else "was"
+            print(f"  [warning] {rt} requires {', '.join(map(str, missing))}, which {verb} not selected.")
+
     # Single treatment room type
     num_treatment_rooms = counts_by_type.get(SPACE_ID.TREATMENT_ROOM, 0)
 
     # Invoke builder, this sets solver constraints and defines variables
-    solver, vars_dict = build_layout_model(
-        building_width_in=building_width_in,
-        building_height_in=building_height_in,
-        rooms=selected_rooms,
-        num_treatment_rooms=num_treatment_rooms,
-    )
+    try:
+        model, vars_dict = build_layout_model(
+            building_width_in=building_width_in,
+            building_height_in=building_height_in,
+            rooms=selected_rooms,
+            num_treatment_rooms=num_treatment_rooms,
+        )
+    except ValueError as e:
+        print(f"No layout possible: {e}")
+        return
 
-    status = solver.Solve()
-    if status == pywraplp.Solver.OPTIMAL:
-        print("\nFound layout (all dimensions in inches):")
+    solver = cp_model.CpSolver()
+    solver.parameters.num_workers = args.workers
+    if args.time_limit is not None:
+        solver.parameters.max_time_in_seconds = args.time_limit
+    status = solver.Solve(model)
+    if status in (cp_model.OPTIMAL, cp_model.FEASIBLE):
+        # One write for the whole table instead of a print per room
+        lines = ["\nFound layout (all dimensions in inches):"]
+        if status == cp_model.FEASIBLE:
+            lines.append("(time limit reached; best layout found, not proven optimal)")
         for r in selected_rooms:
-            x_val = vars_dict["x"][r].solution_value()
-            y_val = vars_dict["y"][r].solution_value()
-            w_val = vars_dict["w"][r].solution_value()
-            h_val = vars_dict["h"][r].solution_value()
+            x_val = solver.Value(vars_dict["x"][r])
+            y_val = solver.Value(vars_dict["y"][r])
+            w_val = solver.Value(vars_dict["w"][r])
+            h_val = solver.Value(vars_dict["h"][r])
             
             # 1. Collect all active doors for this room
             active_doors = []
             # You need to know how many max_entrances there were (default was 2)
             for k in range(2): 
                 door_var = vars_dict["entrance_active"].get((r, k))
-                if door_var and door_var.solution_value() > 0.5: # 0.5 threshold for BoolVars
-                    dx = vars_dict["entrance_x"][(r, k)].solution_value()
-                    dy = vars_dict["entrance_y"][(r, k)].solution_value()
+                if door_var is not None and solver.Value(door_var):
+                    dx = solver.Value(vars_dict["entrance_x"][(r, k)])
+                    dy = solver.Value(vars_dict["entrance_y"][(r, k)])
                     active_doors.append(f"Door_{k}@(x={dx:.0f}, y={dy:.0f})")
 
-            base = r.split("__", 1)[0]
+            base = vars_dict["base_type_of"][r]
             doors_str = ", ".join(active_doors) if active_doors else "No active doors"
             
-            print(
+            lines.append(
                 f"{r} [{base}]: (x={x_val:.0f}, y={y_val:.0f}, w={w_val:.0f}, h={h_val:.0f}) | {doors_str}"
             )
+        print("\n".join(lines))
     else:
-        print("No optimal solution found; status:", status)
+        print("No layout found; status:", solver.StatusName(status))
 
 
 if __name__ == "__main__":